@@ -0,0 +1,45 @@
+"""
+Compara MLFQScheduler con RoundRobinScheduler sobre la misma carga.
+
+Uso:
+    python -m benchmarks.bench_mlfq [num_procesos]
+"""
+import random
+import sys
+import time
+from src.scheduler import MLFQScheduler, RoundRobinScheduler
+from src.metrics import Metrics
+from src.tabla import TablaProcesos
+
+def medir(funcion):
+    """Ejecuta la función y devuelve (resultado, segundos)."""
+    inicio = time.perf_counter()
+    resultado = funcion()
+    return resultado, time.perf_counter() - inicio
+
+def main():
+    num_procesos = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    generador = random.Random(0)
+    pids = [f"P{i}" for i in range(num_procesos)]
+    # Mezcla de trabajos interactivos cortos y de cálculo largos
+    duraciones = [generador.randint(1, 4) if generador.random() < 0.8 else generador.randint(20, 200)
+                  for _ in range(num_procesos)]
+    llegadas = sorted(generador.randint(0, 30 * num_procesos) for _ in range(num_procesos))
+
+    def planificar(scheduler):
+        tabla = TablaProcesos(pids, duraciones, [0] * num_procesos, llegadas)
+        gantt = scheduler.planificar_comprimido(tabla)
+        return len(gantt), Metrics(tabla, gantt).obtener_metricas_promedio()
+
+    (entradas_rr, metricas_rr), t_rr = medir(lambda: planificar(RoundRobinScheduler(4)))
+    (entradas_mlfq, metricas_mlfq), t_mlfq = medir(
+        lambda: planificar(MLFQScheduler(quanta=(4, 16, 64), intervalo_boost=1000)))
+
+    print(f"Procesos:             {num_procesos}")
+    print(f"Round-Robin (q=4):    {t_rr:.3f} s, {entradas_rr} entradas")
+    print(f"MLFQ (4/16/64):       {t_mlfq:.3f} s, {entradas_mlfq} entradas")
+    for metrica in metricas_rr:
+        print(f"{metrica:<22}RR {metricas_rr[metrica]:.2f}  MLFQ {metricas_mlfq[metrica]:.2f}")
+
+if __name__ == "__main__":
+    main()
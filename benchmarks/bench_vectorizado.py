@@ -0,0 +1,102 @@
+"""
+Compara FCFS + Metrics calculados proceso a proceso frente a la ruta
+vectorizada con TablaProcesos, que con 1M procesos o más debe ser al
+menos 50 veces más rápida.
+
+Uso:
+    python -m benchmarks.bench_vectorizado [num_procesos]
+"""
+import random
+import sys
+import time
+from src.proceso import Proceso
+from src.scheduler import FCFSScheduler
+from src.metrics import Metrics
+from src.tabla import TablaProcesos
+
+def medir(funcion):
+    """Ejecuta la función y devuelve (resultado, segundos)."""
+    inicio = time.perf_counter()
+    resultado = funcion()
+    return resultado, time.perf_counter() - inicio
+
+ACELERACION_MINIMA = 50
+PROCESOS_OBJETIVO = 1_000_000
+REPETICIONES = 3
+
+def por_objetos(procesos):
+    """
+    FCFS y Metrics proceso a proceso, como antes de la ruta vectorizada.
+    
+    Cada tiempo pasa por los setters que lo validan, el diagrama es una
+    lista de entradas y las métricas se guardan por proceso.
+    """
+    gantt = []
+    tiempo = 0
+    for proceso in procesos:
+        tiempo = max(tiempo, proceso.tiempo_llegada)
+        proceso.establecer_tiempo_inicio(tiempo)
+        tiempo += proceso.duracion
+        proceso.establecer_tiempo_fin(tiempo)
+        proceso.reducir_tiempo_restante(proceso.tiempo_restante)
+        gantt.append((proceso.pid, proceso.tiempo_inicio, proceso.tiempo_fin))
+    if not all(isinstance(entrada, tuple) and len(entrada) == 3 for entrada in gantt):
+        raise SystemExit("Diagrama de Gantt inválido")
+
+    metricas = {}
+    respuesta = retorno = espera = 0
+    for proceso in procesos:
+        tiempo_respuesta = proceso.tiempo_inicio - proceso.tiempo_llegada
+        tiempo_retorno = proceso.tiempo_fin - proceso.tiempo_llegada
+        tiempo_espera = tiempo_retorno - proceso.duracion
+        metricas[proceso.pid] = {
+            "tiempo_respuesta": tiempo_respuesta,
+            "tiempo_retorno": tiempo_retorno,
+            "tiempo_espera": tiempo_espera
+        }
+        respuesta += tiempo_respuesta
+        retorno += tiempo_retorno
+        espera += tiempo_espera
+    return {
+        "promedio_respuesta": respuesta / len(procesos),
+        "promedio_retorno": retorno / len(procesos),
+        "promedio_espera": espera / len(procesos)
+    }
+
+def main():
+    num_procesos = int(sys.argv[1]) if len(sys.argv) > 1 else PROCESOS_OBJETIVO
+    generador = random.Random(0)
+    pids = [f"P{i}" for i in range(num_procesos)]
+    duraciones = [generador.randint(1, 100) for _ in range(num_procesos)]
+
+    procesos = [Proceso(pid, d, 0) for pid, d in zip(pids, duraciones)]
+    lista = [Proceso(pid, d, 0) for pid, d in zip(pids, duraciones)]
+    # Una tabla sin planificar por repetición; se toma la más rápida
+    tablas = [TablaProcesos(pids, duraciones, [0] * num_procesos) for _ in range(REPETICIONES)]
+
+    def por_lista():
+        gantt = FCFSScheduler().planificar_comprimido(lista)
+        return Metrics(lista, gantt).obtener_metricas_promedio()
+
+    def vectorizado(tabla):
+        gantt = FCFSScheduler().planificar_comprimido(tabla)
+        return Metrics(tabla, gantt).obtener_metricas_promedio()
+
+    esperado, t_objetos = medir(lambda: por_objetos(procesos))
+    en_lista, t_lista = medir(por_lista)
+    obtenido, t_vectorizado = min((medir(lambda: vectorizado(tabla)) for tabla in tablas),
+                                  key=lambda medida: medida[1])
+    if not obtenido == en_lista == esperado:
+        raise SystemExit("Los promedios no coinciden")
+
+    aceleracion = t_objetos / t_vectorizado
+    print(f"Procesos:          {num_procesos}")
+    print(f"Proceso a proceso: {t_objetos:.3f} s")
+    print(f"Lista de Proceso:  {t_lista:.3f} s")
+    print(f"TablaProcesos:     {t_vectorizado:.3f} s")
+    print(f"Aceleración:       {aceleracion:.1f}x")
+    if num_procesos >= PROCESOS_OBJETIVO and aceleracion < ACELERACION_MINIMA:
+        raise SystemExit(f"La ruta vectorizada no alcanza {ACELERACION_MINIMA}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+import itertools
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+from src.metrics import Metrics
+from src.multinucleo import FCFSMultinucleoScheduler, RoundRobinMultinucleoScheduler
+from src.scheduler import (CargaTrabajo, CFSScheduler, FCFSScheduler, LoteriaScheduler, MLFQScheduler,
+                           PrioridadExpropiativaScheduler, PrioridadScheduler, RoundRobinScheduler,
+                           SJFScheduler, SRTFScheduler, StrideScheduler, _columnas_carga, _validar_carga)
+from src.tabla import TablaProcesos
+
+# Algoritmos disponibles en un barrido, por nombre
+ALGORITMOS = {
+    "fcfs": FCFSScheduler,
+    "rr": RoundRobinScheduler,
+    "prioridad": PrioridadScheduler,
+    "prioridad_expropiativa": PrioridadExpropiativaScheduler,
+    "sjf": SJFScheduler,
+    "srtf": SRTFScheduler,
+    "mlfq": MLFQScheduler,
+    "cfs": CFSScheduler,
+    "loteria": LoteriaScheduler,
+    "stride": StrideScheduler,
+    "fcfs_multinucleo": FCFSMultinucleoScheduler,
+    "rr_multinucleo": RoundRobinMultinucleoScheduler,
+}
+
+# Carga de trabajo por columnas: (pids, duraciones, llegadas, prioridades)
+Columnas = Tuple[List[str], List[int], List[int], List[int]]
+
+class Configuracion(NamedTuple):
+    """Un algoritmo con sus parámetros, p. ej. ("rr", (("quantum", 4),))."""
+    algoritmo: str
+    parametros: Tuple[Tuple[str, Any], ...] = ()
+
+    def __str__(self) -> str:
+        """Representación compacta: rr(quantum=4)."""
+        return f"{self.algoritmo}({', '.join(f'{k}={v}' for k, v in self.parametros)})"
+
+class FilaBarrido(NamedTuple):
+    """Resumen de Metrics de una configuración del barrido."""
+    configuracion: Configuracion
+    promedios: Dict[str, float]
+    percentiles: Dict[str, Dict[str, float]]
+    tiempo_total: int
+    segundos: float
+
+def rejilla(algoritmo: str, **valores: Sequence[Any]) -> List[Configuracion]:
+    """
+    Genera todas las combinaciones de parámetros de un algoritmo.
+    
+    Args:
+        algoritmo: Nombre del algoritmo (clave de ALGORITMOS).
+        **valores: Lista de valores de cada parámetro, p. ej. quantum=[2, 4].
+        
+    Returns:
+        Lista de configuraciones, una por combinación.
+        
+    Raises:
+        ValueError: Si el algoritmo no existe o algún parámetro no tiene valores.
+    """
+    if algoritmo not in ALGORITMOS:
+        raise ValueError(f"Algoritmo desconocido: {algoritmo}")
+    if any(len(v) == 0 for v in valores.values()):
+        raise ValueError("Cada parámetro necesita al menos un valor")
+    nombres = list(valores)
+    return [
+        Configuracion(algoritmo, tuple(zip(nombres, combinacion)))
+        for combinacion in itertools.product(*(valores[nombre] for nombre in nombres))
+    ]
+
+# Carga de trabajo del proceso trabajador; se fija una sola vez al arrancarlo
+_carga: Optional[TablaProcesos] = None
+
+def _iniciar_trabajador(columnas: Columnas) -> None:
+    """Inicializador del pool: construye la tabla que comparten todas las tareas."""
+    global _carga
+    pids, duraciones, llegadas, prioridades = columnas
+    _carga = TablaProcesos(pids, duraciones, prioridades, llegadas)
+
+def _ejecutar(configuracion: Configuracion) -> FilaBarrido:
+    """Planifica la carga del trabajador con una configuración y resume sus métricas."""
+    scheduler = ALGORITMOS[configuracion.algoritmo](**dict(configuracion.parametros))
+    inicio = time.perf_counter()
+    resultado = scheduler.planificar_resultado(_carga)
+    metricas = Metrics(_carga, resultado)
+    segundos = time.perf_counter() - inicio
+
+    return FilaBarrido(configuracion, metricas.obtener_metricas_promedio(),
+                       metricas.obtener_percentiles(), resultado.tiempo_total, segundos)
+
+def barrer(procesos: CargaTrabajo, configuraciones: Sequence[Configuracion],
+           trabajadores: Optional[int] = None) -> List[FilaBarrido]:
+    """
+    Ejecuta cada configuración sobre la misma carga de trabajo en paralelo.
+    
+    La carga se envía a cada proceso trabajador una sola vez, como
+    argumento de su inicializador: con el método de arranque fork se hereda
+    sin serializar, y con spawn se serializa una vez por trabajador, nunca
+    por tarea. Las tareas planifican con `planificar_resultado`, así que
+    comparten la carga sin copiarla ni modificarla.
+    
+    Args:
+        procesos: Lista de procesos o TablaProcesos; no se modifica.
+        configuraciones: Configuraciones a evaluar, p. ej. las de `rejilla`.
+        trabajadores: Número de procesos del pool (None = uno por CPU;
+            1 = en el proceso actual, sin pool).
+            
+    Returns:
+        Una FilaBarrido por configuración, en el mismo orden.
+        
+    Raises:
+        ValueError: Si la carga o alguna configuración son inválidas.
+    """
+    _validar_carga(procesos, solo_lectura=True)
+    for configuracion in configuraciones:
+        if configuracion.algoritmo not in ALGORITMOS:
+            raise ValueError(f"Algoritmo desconocido: {configuracion.algoritmo}")
+    columnas = _columnas_carga(procesos)
+
+    if trabajadores == 1:
+        global _carga
+        anterior = _carga
+        _iniciar_trabajador(columnas)
+        try:
+            return [_ejecutar(configuracion) for configuracion in configuraciones]
+        finally:
+            _carga = anterior
+
+    metodos = multiprocessing.get_all_start_methods()
+    contexto = multiprocessing.get_context("fork" if "fork" in metodos else None)
+    with ProcessPoolExecutor(max_workers=trabajadores, mp_context=contexto,
+                             initializer=_iniciar_trabajador, initargs=(columnas,)) as pool:
+        return list(pool.map(_ejecutar, configuraciones))
+
+def formatear_tabla(filas: Sequence[FilaBarrido]) -> str:
+    """
+    Da formato de tabla de texto a los resultados de un barrido.
+    
+    Args:
+        filas: Resultados devueltos por `barrer`.
+        
+    Returns:
+        Tabla con una fila por configuración y los promedios, el p95 del
+        tiempo de retorno y el tiempo total.
+    """
+    ancho = max([len("Configuración")] + [len(str(fila.configuracion)) for fila in filas])
+    cabecera = (f"{'Configuración':<{ancho}}  {'Respuesta':>10}  {'Retorno':>10}  {'Espera':>10}"
+                f"  {'Retorno p95':>11}  {'Tiempo total':>12}")
+    lineas = [cabecera, "-" * len(cabecera)]
+    for fila in filas:
+        lineas.append(
+            f"{str(fila.configuracion):<{ancho}}  {fila.promedios['promedio_respuesta']:>10.2f}"
+            f"  {fila.promedios['promedio_retorno']:>10.2f}  {fila.promedios['promedio_espera']:>10.2f}"
+            f"  {fila.percentiles['tiempo_retorno']['p95']:>11.2f}  {fila.tiempo_total:>12}"
+        )
+    return "\n".join(lineas)
@@ -0,0 +1,164 @@
+import hashlib
+import os
+import pickle
+import tempfile
+import weakref
+from collections import OrderedDict
+from typing import NamedTuple, Optional, Tuple
+from src.metrics import MetricasIncrementales, Metrics
+from src.repositorio import RepositorioProcesos
+from src.scheduler import ResultadoPlanificacion, Scheduler
+
+class EntradaCache(NamedTuple):
+    """Planificación de un repositorio con un planificador y sus métricas."""
+    resultado: ResultadoPlanificacion
+    metricas: MetricasIncrementales
+
+class CacheResultados:
+    """
+    Caché de planificaciones indexada por contenido y configuración.
+    
+    La clave es la huella del repositorio más la clave de configuración del
+    planificador, así que repetir la misma petición no vuelve a planificar ni
+    a calcular las métricas. En memoria se guardan como mucho `capacidad`
+    entradas y se descarta la usada hace más tiempo; con un directorio, las
+    descartadas pasan a disco y se recuperan de allí. Cualquier cambio en un
+    repositorio consultado invalida sus entradas en ambos niveles.
+    """
+
+    def __init__(self, capacidad: int = 128, directorio: Optional[str] = None):
+        """
+        Inicializa la caché.
+        
+        Args:
+            capacidad: Número máximo de entradas en memoria.
+            directorio: Directorio del nivel en disco (None = solo memoria).
+                Las entradas se guardan con pickle: use solo directorios de
+                confianza.
+                
+        Raises:
+            ValueError: Si la capacidad no es un entero positivo.
+        """
+        if not isinstance(capacidad, int) or capacidad <= 0:
+            raise ValueError("La capacidad debe ser un entero positivo")
+        self.capacidad = capacidad
+        self.directorio = directorio
+        if directorio is not None:
+            os.makedirs(directorio, exist_ok=True)
+        self._entradas: "OrderedDict[Tuple[int, Tuple], EntradaCache]" = OrderedDict()
+        # Repositorios a los que ya se observa; no los mantiene vivos y un id
+        # reutilizado por otro repositorio no lo da por observado
+        self._observados: "weakref.WeakSet[RepositorioProcesos]" = weakref.WeakSet()
+        self.aciertos = 0
+        self.fallos = 0
+
+    def __len__(self) -> int:
+        """Número de entradas en memoria."""
+        return len(self._entradas)
+
+    def obtener(self, repositorio: RepositorioProcesos, scheduler: Scheduler) -> EntradaCache:
+        """
+        Devuelve la planificación del repositorio, calculándola si hace falta.
+        
+        Los procesos del repositorio no se modifican. Si el planificador no es
+        reproducible (p. ej. lotería sin semilla) se planifica siempre.
+        
+        Args:
+            repositorio: Repositorio con los procesos a planificar.
+            scheduler: Planificador a usar.
+            
+        Returns:
+            EntradaCache con el resultado y sus métricas.
+            
+        Raises:
+            ValueError: Si el repositorio está vacío.
+        """
+        if repositorio not in self._observados:
+            self._observados.add(repositorio)
+            repositorio.observar(self.invalidar)
+
+        configuracion = scheduler.clave_configuracion()
+        if configuracion is None:
+            self.fallos += 1
+            return self._calcular(repositorio, scheduler)
+
+        clave = (repositorio.huella, configuracion)
+        entrada = self._entradas.get(clave)
+        if entrada is not None:
+            self._entradas.move_to_end(clave)
+            self.aciertos += 1
+            return entrada
+
+        entrada = self._leer_disco(clave)
+        if entrada is not None:
+            self.aciertos += 1
+        else:
+            self.fallos += 1
+            entrada = self._calcular(repositorio, scheduler)
+        self._guardar(clave, entrada)
+        return entrada
+
+    def invalidar(self, huella: int) -> None:
+        """
+        Descarta las entradas de un contenido de repositorio.
+        
+        Args:
+            huella: Huella del contenido que ha dejado de ser válido.
+        """
+        for clave in [clave for clave in self._entradas if clave[0] == huella]:
+            del self._entradas[clave]
+        if self.directorio is not None:
+            prefijo = f"{huella:016x}-"
+            for nombre in os.listdir(self.directorio):
+                if nombre.startswith(prefijo):
+                    os.remove(os.path.join(self.directorio, nombre))
+
+    def limpiar(self) -> None:
+        """Descarta todas las entradas de memoria y de disco."""
+        self._entradas.clear()
+        if self.directorio is not None:
+            for nombre in os.listdir(self.directorio):
+                if nombre.endswith(".pkl"):
+                    os.remove(os.path.join(self.directorio, nombre))
+
+    @staticmethod
+    def _calcular(repositorio: RepositorioProcesos, scheduler: Scheduler) -> EntradaCache:
+        """Planifica el repositorio sin modificarlo y resume sus métricas."""
+        procesos = repositorio.listar()
+        resultado = scheduler.planificar_resultado(procesos)
+        return EntradaCache(resultado, Metrics(procesos, resultado).acumulador)
+
+    def _guardar(self, clave: Tuple[int, Tuple], entrada: EntradaCache) -> None:
+        """Inserta en memoria y pasa a disco (o descarta) la entrada más antigua."""
+        self._entradas[clave] = entrada
+        if len(self._entradas) > self.capacidad:
+            antigua, descartada = self._entradas.popitem(last=False)
+            self._escribir_disco(antigua, descartada)
+
+    def _ruta(self, clave: Tuple[int, Tuple]) -> str:
+        """Archivo del nivel en disco para una clave."""
+        configuracion = hashlib.blake2b(repr(clave[1]).encode("utf-8"), digest_size=8).hexdigest()
+        return os.path.join(self.directorio, f"{clave[0]:016x}-{configuracion}.pkl")
+
+    def _leer_disco(self, clave: Tuple[int, Tuple]) -> Optional[EntradaCache]:
+        """Recupera una entrada del nivel en disco, si existe."""
+        if self.directorio is None:
+            return None
+        try:
+            with open(self._ruta(clave), "rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+
+    def _escribir_disco(self, clave: Tuple[int, Tuple], entrada: EntradaCache) -> None:
+        """Guarda una entrada en disco de forma atómica."""
+        if self.directorio is None:
+            return
+        descriptor, temporal = tempfile.mkstemp(dir=self.directorio, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as f:
+                pickle.dump(entrada, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporal, self._ruta(clave))
+        except BaseException:
+            os.remove(temporal)
+            raise
@@ -0,0 +1,570 @@
+import os
+import tempfile
+import weakref
+from itertools import compress, islice
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+import numpy as np
+
+# Definición de GanttEntry como una tupla
+GanttEntry = Tuple[str, int, int]  # (pid, tiempo_inicio, tiempo_fin)
+
+class SegmentoRR:
+    """
+    Tramo de un diagrama Round-Robin comprimido.
+    
+    Los `pids` rotan `vueltas` veces a partir de `inicio`, cada uno con una
+    rebanada de `quantum`, y después dan una vuelta de cierre en la que el
+    i-ésimo pid ejecuta `cierre[i]` unidades (como mucho un quantum). Las
+    entradas GanttEntry que representa se obtienen con entradas().
+    """
+
+    __slots__ = ("inicio", "quantum", "vueltas", "pids", "cierre")
+
+    def __init__(self, inicio: int, quantum: int, vueltas: int,
+                 pids: Sequence[str], cierre: Sequence[int]):
+        """
+        Inicializa el segmento.
+        
+        Args:
+            inicio: Instante en que empieza la primera vuelta.
+            quantum: Rebanada de cada pid en las vueltas completas.
+            vueltas: Número de vueltas completas antes de la de cierre.
+            pids: PIDs de la rotación, en orden.
+            cierre: Duración de cada pid en la vuelta de cierre.
+        """
+        self.inicio = inicio
+        self.quantum = quantum
+        self.vueltas = vueltas
+        self.pids = pids
+        self.cierre = cierre
+
+    def __eq__(self, otro: object) -> bool:
+        if not isinstance(otro, SegmentoRR):
+            return NotImplemented
+        return ((self.inicio, self.quantum, self.vueltas, tuple(self.pids), tuple(self.cierre))
+                == (otro.inicio, otro.quantum, otro.vueltas, tuple(otro.pids), tuple(otro.cierre)))
+
+    def __repr__(self) -> str:
+        return (f"SegmentoRR(inicio={self.inicio}, quantum={self.quantum}, vueltas={self.vueltas}, "
+                f"pids={tuple(self.pids)!r}, cierre={tuple(self.cierre)!r})")
+
+    @property
+    def num_entradas(self) -> int:
+        """Número de entradas GanttEntry que representa el segmento."""
+        return len(self.pids) * (self.vueltas + 1)
+
+    @property
+    def fin(self) -> int:
+        """Instante en que termina la vuelta de cierre."""
+        return self.inicio + self.vueltas * len(self.pids) * self.quantum + sum(self.cierre)
+
+    def entradas(self) -> Iterator[GanttEntry]:
+        """Expande el segmento en sus entradas GanttEntry."""
+        quantum = self.quantum
+        pids = tuple(self.pids)
+        duracion_vuelta = len(pids) * quantum
+        for vuelta in range(self.vueltas):
+            base = self.inicio + vuelta * duracion_vuelta
+            for i, pid in enumerate(pids):
+                yield (pid, base + i * quantum, base + (i + 1) * quantum)
+        tiempo = self.inicio + self.vueltas * duracion_vuelta
+        for pid, duracion in zip(pids, self.cierre):
+            yield (pid, tiempo, tiempo + duracion)
+            tiempo += duracion
+
+class _CadenaRotaciones:
+    """
+    Miembros de rotaciones Round-Robin consecutivas, guardados una sola vez.
+    
+    De una rotación a la siguiente los supervivientes conservan su orden y
+    los que llegan se añaden al final, así que los miembros de toda la
+    cadena caben en una única lista `pids`. Para cada posición, `salidas`
+    guarda el número del primer segmento de la cadena que ya no la incluye
+    y `ultimas` su duración en la vuelta de cierre de su último segmento;
+    en los segmentos anteriores ejecutó un quantum completo. `posiciones`
+    da la última posición de cada pid.
+    """
+
+    __slots__ = ("quantum", "pids", "salidas", "ultimas", "posiciones")
+
+    def __init__(self, quantum: int):
+        self.quantum = quantum
+        self.pids: List[str] = []
+        self.salidas = np.zeros(0, dtype=np.int64)
+        self.ultimas = np.zeros(0, dtype=np.int64)
+        self.posiciones: Dict[str, int] = {}
+
+    def extender(self, pids: Sequence[str]) -> None:
+        """Añade posiciones al final de la cadena."""
+        self.posiciones.update(zip(pids, range(len(self.pids), len(self.pids) + len(pids))))
+        self.pids.extend(pids)
+        nuevas = np.zeros(len(pids), dtype=np.int64)
+        self.salidas = np.concatenate((self.salidas, nuevas))
+        self.ultimas = np.concatenate((self.ultimas, nuevas))
+
+class _VistaCadena(Sequence):
+    """Columna de un segmento de una _CadenaRotaciones, calculada bajo demanda."""
+    
+    __slots__ = ("cadena", "numero", "desde", "hasta", "longitud")
+
+    def __init__(self, cadena: _CadenaRotaciones, numero: int, desde: int, hasta: int, longitud: int):
+        self.cadena = cadena
+        self.numero = numero
+        self.desde = desde
+        self.hasta = hasta
+        self.longitud = longitud
+
+    def _miembros(self) -> np.ndarray:
+        """Máscara de las posiciones del tramo de la cadena que pertenecen al segmento."""
+        return self.cadena.salidas[self.desde:self.hasta] > self.numero
+
+    def __len__(self) -> int:
+        return self.longitud
+
+    def __getitem__(self, indice: Union[int, slice]):
+        """
+        Devuelve un elemento o un tramo del segmento.
+        
+        Un índice entero cuesta O(hasta - desde) operaciones vectorizadas
+        sobre la cadena, sin crear objetos por posición; un tramo materializa
+        la columna completa.
+        """
+        if isinstance(indice, slice):
+            return tuple(self)[indice]
+        posiciones = np.flatnonzero(self._miembros())
+        return self._elemento(self.desde + int(posiciones[indice]))
+
+    def _elemento(self, posicion: int):
+        """Valor de la columna en la posición `posicion` de la cadena."""
+        raise NotImplementedError
+
+class _PidsCadena(_VistaCadena):
+    """PIDs de un segmento encadenado."""
+    
+    __slots__ = ()
+
+    def __iter__(self) -> Iterator[str]:
+        return compress(self.cadena.pids[self.desde:self.hasta], self._miembros().tolist())
+
+    def _elemento(self, posicion: int) -> str:
+        return self.cadena.pids[posicion]
+
+class _CierreCadena(_VistaCadena):
+    """Duraciones de la vuelta de cierre de un segmento encadenado."""
+    
+    __slots__ = ()
+
+    def __iter__(self) -> Iterator[int]:
+        cadena = self.cadena
+        salidas = cadena.salidas[self.desde:self.hasta]
+        cierre = np.where(salidas == self.numero + 1, cadena.ultimas[self.desde:self.hasta], cadena.quantum)
+        return iter(cierre[self._miembros()].tolist())
+
+    def _elemento(self, posicion: int) -> int:
+        cadena = self.cadena
+        if cadena.salidas[posicion] == self.numero + 1:
+            return int(cadena.ultimas[posicion])
+        return cadena.quantum
+
+class _VistaColumna(Sequence):
+    """
+    Tramo [desde, hasta) de una columna, leído bajo demanda sin copiarla.
+    
+    Si se da `orden`, la posición i del tramo es valores[orden[desde + i]].
+    Un índice entero cuesta O(1); iterar convierte el tramo de una vez.
+    """
+    
+    __slots__ = ("valores", "orden", "desde", "hasta")
+
+    def __init__(self, valores: Union[Sequence, np.ndarray], orden: Optional[np.ndarray],
+                 desde: int, hasta: int):
+        self.valores = valores
+        self.orden = orden
+        self.desde = desde
+        self.hasta = hasta
+
+    def __len__(self) -> int:
+        return self.hasta - self.desde
+
+    def __getitem__(self, indice: Union[int, slice]):
+        if isinstance(indice, slice):
+            return tuple(self)[indice]
+        posicion = range(self.desde, self.hasta)[indice]
+        if self.orden is not None:
+            posicion = int(self.orden[posicion])
+        valor = self.valores[posicion]
+        return valor.item() if isinstance(valor, np.generic) else valor
+
+    def __iter__(self) -> Iterator:
+        valores = self.valores
+        if self.orden is None:
+            return iter(valores[self.desde:self.hasta].tolist() if isinstance(valores, np.ndarray)
+                        else valores[self.desde:self.hasta])
+        indices = self.orden[self.desde:self.hasta]
+        if isinstance(valores, np.ndarray):
+            return iter(valores[indices].tolist())
+        return map(valores.__getitem__, indices.tolist())
+
+class GanttComprimido:
+    """
+    Diagrama de Gantt Round-Robin codificado por segmentos periódicos.
+    
+    Su tamaño depende del número de procesos y no del número de quanta:
+    cada segmento describe una rotación completa de los procesos vivos.
+    Las entradas individuales se generan bajo demanda al iterar.
+    """
+
+    def __init__(self, segmentos: List[SegmentoRR]):
+        """
+        Inicializa el diagrama con sus segmentos.
+        
+        Args:
+            segmentos: Segmentos en orden cronológico.
+        """
+        self.segmentos = segmentos
+
+    @classmethod
+    def desde_tramos(cls, tramos: Iterable[SegmentoRR]) -> "GanttComprimido":
+        """
+        Construye el diagrama a partir de los tramos de una simulación.
+        
+        Las ráfagas sueltas contiguas se agrupan en un único segmento y, si
+        las que siguen a una rotación completa repiten sus pids en el mismo
+        orden, pasan a ser su vuelta de cierre. Los pids de las rotaciones
+        consecutivas se guardan una sola vez: cada segmento solo indica qué
+        tramo de la cadena ocupa, así que la memoria crece con el número de
+        procesos y no con el de procesos vivos en cada rotación.
+        
+        Args:
+            tramos: Tramos en orden cronológico, como los que produce
+                SimuladorEventos.
+                
+        Returns:
+            Diagrama GanttComprimido equivalente.
+        """
+        segmentos: List[SegmentoRR] = []
+        rotacion: Optional[SegmentoRR] = None  # Pendiente de su vuelta de cierre
+        pids: List[str] = []
+        cierre: List[int] = []
+        inicio = fin = 0
+        cadena: Optional[_CadenaRotaciones] = None
+        numero = -1  # Número del último segmento de la cadena
+
+        def encadenar(segmento: SegmentoRR) -> SegmentoRR:
+            # Siguen en la cadena los miembros del último segmento que forman
+            # un prefijo de los pids, en el mismo orden y tras un quantum
+            # completo en su vuelta de cierre
+            nonlocal cadena, numero
+            quantum = segmento.quantum
+            continuan = np.zeros(0, dtype=np.int64)
+            if cadena is not None and cadena.quantum == quantum:
+                posiciones = list(map(cadena.posiciones.get, segmento.pids))
+                if None in posiciones:
+                    del posiciones[posiciones.index(None):]
+                posiciones = np.array(posiciones, dtype=np.int64)
+                if ((np.diff(posiciones) > 0).all() and (cadena.salidas[posiciones] == numero + 1).all()
+                        and (cadena.ultimas[posiciones] == quantum).all()):
+                    continuan = posiciones
+            # Se empieza otra cadena si no sigue nadie o si más de la mitad del
+            # tramo a recorrer son posiciones que ya salieron de la rotación
+            if not len(continuan) or len(cadena.pids) - continuan[0] > 2 * len(continuan):
+                cadena, numero, continuan = _CadenaRotaciones(quantum), -1, continuan[:0]
+            numero += 1
+            primera_nueva = len(cadena.pids)
+            cadena.extender(segmento.pids[len(continuan):])
+            cierre = np.array(segmento.cierre, dtype=np.int64)
+            cadena.salidas[continuan] = cadena.salidas[primera_nueva:] = numero + 1
+            cadena.ultimas[continuan] = cierre[:len(continuan)]
+            cadena.ultimas[primera_nueva:] = cierre[len(continuan):]
+            desde = int(continuan[0]) if len(continuan) else primera_nueva
+            longitud = len(cierre)
+            return SegmentoRR(segmento.inicio, quantum, segmento.vueltas,
+                              _PidsCadena(cadena, numero, desde, len(cadena.pids), longitud),
+                              _CierreCadena(cadena, numero, desde, len(cadena.pids), longitud))
+
+        def volcar() -> None:
+            # La rotación pendiente precede a las ráfagas acumuladas
+            nonlocal rotacion
+            if rotacion is not None:
+                segmentos.append(encadenar(rotacion))
+                rotacion = None
+            if pids:
+                segmentos.append(SegmentoRR(inicio, max(cierre), 0, tuple(pids), tuple(cierre)))
+                pids.clear()
+                cierre.clear()
+
+        for tramo in tramos:
+            if tramo.vueltas > 0 or len(tramo.pids) > 1:
+                volcar()
+                rotacion = tramo
+                continue
+
+            if pids and tramo.inicio != fin:
+                volcar()
+            if not pids:
+                inicio = tramo.inicio
+                if rotacion is not None and inicio != rotacion.fin:
+                    volcar()
+            pids.extend(tramo.pids)
+            cierre.extend(tramo.cierre)
+            fin = tramo.fin
+
+            if rotacion is not None and len(pids) == len(rotacion.pids):
+                if (tuple(pids) == tuple(rotacion.pids) and max(cierre) <= rotacion.quantum
+                        and all(c == rotacion.quantum for c in rotacion.cierre)):
+                    # Las ráfagas forman la vuelta de cierre de la rotación
+                    segmentos.append(encadenar(SegmentoRR(rotacion.inicio, rotacion.quantum,
+                                                          rotacion.vueltas + 1, rotacion.pids, tuple(cierre))))
+                    pids.clear()
+                    cierre.clear()
+                else:
+                    segmentos.append(encadenar(rotacion))
+                rotacion = None
+
+        volcar()
+        return cls(segmentos)
+
+    def __len__(self) -> int:
+        """Número total de entradas GanttEntry que representa el diagrama."""
+        return sum(segmento.num_entradas for segmento in self.segmentos)
+
+    def __iter__(self) -> Iterator[GanttEntry]:
+        """Expande perezosamente el diagrama entrada a entrada."""
+        for segmento in self.segmentos:
+            yield from segmento.entradas()
+
+    def expandir(self) -> List[GanttEntry]:
+        """
+        Materializa el diagrama completo.
+        
+        Returns:
+            Lista de entradas GanttEntry (pid, tiempo_inicio, tiempo_fin).
+        """
+        return list(self)
+
+    def tiempos_por_proceso(self) -> Dict[str, Tuple[int, int]]:
+        """
+        Calcula los tiempos de inicio y fin de cada proceso sin expandir.
+        
+        Returns:
+            Diccionario pid -> (tiempo_inicio, tiempo_fin).
+        """
+        inicios: Dict[str, int] = {}
+        fines: Dict[str, int] = {}
+        for segmento in self.segmentos:
+            tiempo_cierre = segmento.inicio + segmento.vueltas * len(segmento.pids) * segmento.quantum
+            tiempo = tiempo_cierre
+            for i, (pid, duracion) in enumerate(zip(segmento.pids, segmento.cierre)):
+                if pid not in inicios:
+                    if segmento.vueltas > 0:
+                        inicios[pid] = segmento.inicio + i * segmento.quantum
+                    else:
+                        inicios[pid] = tiempo
+                tiempo += duracion
+                fines[pid] = tiempo
+        return {pid: (inicios[pid], fines[pid]) for pid in inicios}
+
+
+# Registro empaquetado de una entrada: id del PID + inicio + fin (20 bytes)
+DTYPE_ENTRADA = np.dtype([("id", "<i4"), ("inicio", "<i8"), ("fin", "<i8")])
+
+class GanttBuffer:
+    """
+    Diagrama de Gantt compacto respaldado por arrays tipados.
+    
+    Los PIDs se internan como ids int32 y cada entrada ocupa 20 bytes en un
+    array estructurado, frente a los más de 100 bytes de una tupla de
+    Python. Al superar `limite_memoria` entradas el contenido pasa a un
+    fichero temporal mapeado en memoria. Se itera como GanttEntry, admite
+    índices y cortes, y Metrics lo acepta igual que una lista.
+    """
+
+    TAM_BLOQUE = 65536  # Entradas convertidas por bloque al extender o iterar
+
+    def __init__(self, capacidad_inicial: int = 1024, limite_memoria: Optional[int] = None,
+                 directorio: Optional[str] = None):
+        """
+        Inicializa un buffer vacío.
+        
+        Args:
+            capacidad_inicial: Entradas reservadas al crear el buffer.
+            limite_memoria: Número de entradas a partir del cual se vuelca a
+                disco (None = nunca).
+            directorio: Carpeta del fichero de volcado (por defecto la temporal).
+            
+        Raises:
+            ValueError: Si la capacidad o el límite no son enteros positivos.
+        """
+        if not isinstance(capacidad_inicial, int) or capacidad_inicial <= 0:
+            raise ValueError("La capacidad inicial debe ser un entero positivo")
+        if limite_memoria is not None and (not isinstance(limite_memoria, int) or limite_memoria <= 0):
+            raise ValueError("El límite de memoria debe ser un entero positivo")
+        self.limite_memoria = limite_memoria
+        self.directorio = directorio
+        self._pids: List[str] = []  # id -> pid
+        self._ids: Dict[str, int] = {}  # pid -> id
+        self._datos = np.empty(capacidad_inicial, dtype=DTYPE_ENTRADA)
+        self._longitud = 0
+        self._vista = False
+        self._ruta: Optional[str] = None
+        self._finalizador = None
+
+    @classmethod
+    def desde_iterable(cls, entradas: Iterable[GanttEntry], **opciones) -> "GanttBuffer":
+        """
+        Construye un buffer con las entradas de un iterable.
+        
+        Args:
+            entradas: Entradas GanttEntry (pid, tiempo_inicio, tiempo_fin).
+            **opciones: Argumentos de GanttBuffer.
+            
+        Returns:
+            Nuevo GanttBuffer.
+        """
+        buffer = cls(**opciones)
+        buffer.extender(entradas)
+        return buffer
+
+    @property
+    def en_disco(self) -> bool:
+        """Indica si las entradas están en un fichero mapeado en memoria."""
+        return isinstance(self._datos, np.memmap)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes ocupados por las entradas almacenadas."""
+        return self._longitud * DTYPE_ENTRADA.itemsize
+
+    def _internar(self, pid: str) -> int:
+        """Devuelve el id de un PID, registrándolo si es nuevo."""
+        id_pid = self._ids.get(pid)
+        if id_pid is None:
+            if not isinstance(pid, str) or not pid.strip():
+                raise ValueError("El PID debe ser una cadena no vacía")
+            id_pid = len(self._pids)
+            self._ids[pid] = id_pid
+            self._pids.append(pid)
+        return id_pid
+
+    def _reservar(self, capacidad: int) -> None:
+        """Garantiza espacio para `capacidad` entradas, volcando a disco si hace falta."""
+        if capacidad <= len(self._datos):
+            return
+        nueva = max(capacidad, 2 * len(self._datos))
+        if self.en_disco:
+            self._datos.flush()
+            self._datos = self._mapear(nueva)
+        elif self.limite_memoria is not None and nueva > self.limite_memoria:
+            anteriores = self._datos[:self._longitud]
+            descriptor, self._ruta = tempfile.mkstemp(prefix="gantt_", suffix=".bin", dir=self.directorio)
+            os.close(descriptor)
+            self._finalizador = weakref.finalize(self, os.remove, self._ruta)
+            self._datos = self._mapear(nueva)
+            self._datos[:self._longitud] = anteriores
+        else:
+            datos = np.empty(nueva, dtype=DTYPE_ENTRADA)
+            datos[:self._longitud] = self._datos[:self._longitud]
+            self._datos = datos
+
+    def _mapear(self, capacidad: int) -> np.memmap:
+        """Amplía el fichero de volcado y lo mapea con la capacidad indicada."""
+        os.truncate(self._ruta, capacidad * DTYPE_ENTRADA.itemsize)
+        return np.memmap(self._ruta, dtype=DTYPE_ENTRADA, mode="r+", shape=(capacidad,))
+
+    def agregar(self, entrada: GanttEntry) -> None:
+        """
+        Añade una entrada al final del buffer.
+        
+        Args:
+            entrada: Tupla (pid, tiempo_inicio, tiempo_fin).
+            
+        Raises:
+            ValueError: Si el buffer es una vista o el PID es inválido.
+        """
+        self.extender((entrada,))
+
+    def extender(self, entradas: Iterable[GanttEntry]) -> None:
+        """
+        Añade entradas al final del buffer, convirtiéndolas por bloques.
+        
+        Args:
+            entradas: Entradas GanttEntry; puede ser un generador.
+            
+        Raises:
+            ValueError: Si el buffer es una vista o algún PID es inválido.
+        """
+        if self._vista:
+            raise ValueError("No se pueden añadir entradas a una vista de un GanttBuffer")
+        iterador = iter(entradas)
+        while True:
+            bloque = list(islice(iterador, self.TAM_BLOQUE))
+            if not bloque:
+                break
+            pids, inicios, fines = zip(*bloque)
+            ids = [self._internar(pid) for pid in pids]
+            fin_bloque = self._longitud + len(bloque)
+            self._reservar(fin_bloque)
+            datos = self._datos[self._longitud:fin_bloque]
+            datos["id"] = ids
+            datos["inicio"] = inicios
+            datos["fin"] = fines
+            self._longitud = fin_bloque
+
+    def __len__(self) -> int:
+        return self._longitud
+
+    def __iter__(self) -> Iterator[GanttEntry]:
+        """Recorre las entradas como tuplas GanttEntry."""
+        pids = self._pids
+        for desde in range(0, self._longitud, self.TAM_BLOQUE):
+            bloque = self._datos[desde:min(desde + self.TAM_BLOQUE, self._longitud)]
+            yield from zip([pids[i] for i in bloque["id"].tolist()],
+                           bloque["inicio"].tolist(), bloque["fin"].tolist())
+
+    def __getitem__(self, indice: Union[int, slice]) -> Union[GanttEntry, "GanttBuffer"]:
+        """
+        Devuelve una entrada o, con un corte, una vista de solo lectura.
+        
+        Args:
+            indice: Posición (admite negativos) o corte.
+            
+        Returns:
+            GanttEntry o GanttBuffer que comparte los datos con este.
+            
+        Raises:
+            IndexError: Si la posición está fuera de rango.
+        """
+        if isinstance(indice, slice):
+            vista = GanttBuffer.__new__(GanttBuffer)
+            vista.__dict__.update(self.__dict__)
+            vista._datos = self._datos[:self._longitud][indice]
+            vista._longitud = len(vista._datos)
+            vista._vista = True
+            vista._finalizador = None
+            return vista
+        if indice < 0:
+            indice += self._longitud
+        if not 0 <= indice < self._longitud:
+            raise IndexError("Índice fuera del diagrama de Gantt")
+        registro = self._datos[indice]
+        return (self._pids[int(registro["id"])], int(registro["inicio"]), int(registro["fin"]))
+
+    def expandir(self) -> List[GanttEntry]:
+        """
+        Materializa el buffer como lista de entradas.
+        
+        Returns:
+            Lista de entradas GanttEntry (pid, tiempo_inicio, tiempo_fin).
+        """
+        return list(self)
+
+    def cerrar(self) -> None:
+        """Elimina el fichero de volcado, si existe. El buffer queda vacío."""
+        if self._vista:
+            return
+        self._datos = np.empty(1, dtype=DTYPE_ENTRADA)
+        self._longitud = 0
+        if self._finalizador is not None:
+            self._finalizador()
+            self._finalizador = None
+            self._ruta = None
@@ -0,0 +1,409 @@
+from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right
+from itertools import cycle, islice
+from typing import Iterator, List, Optional, Tuple
+import numpy as np
+from src.gantt import GanttComprimido, SegmentoRR
+from src.proceso import Proceso
+from src.repositorio import RepositorioProcesos
+from src.scheduler import ResultadoPlanificacion, RoundRobinScheduler, _gantt_secuencial
+from src.simulacion import PoliticaRoundRobin, SimuladorEventos
+
+class PlanificacionIncremental(ABC):
+    """
+    Planificación de un repositorio que se mantiene al día con sus cambios.
+    
+    Los procesos se agregan y eliminan a través de la planificación, que
+    actualiza solo la parte del resultado afectada; el resultado coincide
+    siempre con el de planificar el repositorio desde cero. Si el
+    repositorio cambia por otra vía, se detecta por su huella y se vuelve a
+    planificar entero.
+    """
+
+    def __init__(self, repositorio: RepositorioProcesos):
+        """
+        Planifica el contenido actual del repositorio.
+        
+        Args:
+            repositorio: Repositorio a planificar; los procesos no se modifican.
+        """
+        self.repositorio = repositorio
+        self._reconstruir()
+        self._huella = repositorio.huella
+
+    def agregar(self, proceso: Proceso) -> None:
+        """
+        Agrega un proceso al repositorio y actualiza la planificación.
+        
+        Args:
+            proceso: Instancia de Proceso a agregar.
+            
+        Raises:
+            ValueError: Si el proceso no es válido o el pid ya existe.
+        """
+        self._sincronizar()
+        self.repositorio.agregar(proceso)
+        self._agregar(proceso)
+        self._huella = self.repositorio.huella
+
+    def eliminar(self, pid: str) -> None:
+        """
+        Elimina un proceso del repositorio y actualiza la planificación.
+        
+        Args:
+            pid: Identificador del proceso.
+            
+        Raises:
+            ValueError: Si el PID no existe.
+        """
+        self._sincronizar()
+        proceso = self.repositorio.obtener(pid)
+        self.repositorio.eliminar(pid)
+        self._eliminar(proceso)
+        self._huella = self.repositorio.huella
+
+    def resultado(self) -> ResultadoPlanificacion:
+        """
+        Devuelve la planificación actual del repositorio.
+        
+        Returns:
+            ResultadoPlanificacion en el orden de `repositorio.listar()`.
+            
+        Raises:
+            ValueError: Si el repositorio está vacío.
+        """
+        self._sincronizar()
+        if not self.repositorio.listar():
+            raise ValueError("Se requiere una lista no vacía de instancias de Proceso")
+        return self._resultado()
+
+    def _sincronizar(self) -> None:
+        """Vuelve a planificar si el repositorio ha cambiado por otra vía."""
+        if self.repositorio.huella != self._huella:
+            self._reconstruir()
+            self._huella = self.repositorio.huella
+
+    @abstractmethod
+    def _reconstruir(self) -> None:
+        """Planifica el repositorio desde cero."""
+        pass
+
+    @abstractmethod
+    def _agregar(self, proceso: Proceso) -> None:
+        """Actualiza la planificación tras agregar un proceso al final del repositorio."""
+        pass
+
+    @abstractmethod
+    def _eliminar(self, proceso: Proceso) -> None:
+        """Actualiza la planificación tras eliminar un proceso."""
+        pass
+
+    @abstractmethod
+    def _resultado(self) -> ResultadoPlanificacion:
+        """Construye el resultado a partir del estado incremental."""
+        pass
+
+class _Columnas:
+    """Columnas de enteros con capacidad de reserva, para insertar y eliminar filas sin reconstruirlas."""
+    
+    def __init__(self, **columnas: np.ndarray):
+        """
+        Inicializa las columnas con sus valores.
+        
+        Args:
+            **columnas: Valores de cada columna, todas de la misma longitud.
+        """
+        self._datos = {nombre: np.array(valores, dtype=np.int64) for nombre, valores in columnas.items()}
+        self.n = len(next(iter(self._datos.values())))
+
+    def __getitem__(self, nombre: str) -> np.ndarray:
+        """Vista de las filas ocupadas de una columna."""
+        return self._datos[nombre][:self.n]
+
+    def insertar(self, posicion: int, **valores: int) -> None:
+        """Inserta una fila en `posicion`, duplicando la capacidad si está llena."""
+        n = self.n
+        for nombre, columna in self._datos.items():
+            if n == len(columna):
+                columna = np.concatenate([columna, np.empty(max(16, n), dtype=np.int64)])
+                self._datos[nombre] = columna
+            columna[posicion + 1:n + 1] = columna[posicion:n]
+            columna[posicion] = valores[nombre]
+        self.n = n + 1
+
+    def eliminar(self, posicion: int) -> None:
+        """Elimina la fila de `posicion`."""
+        n = self.n
+        for columna in self._datos.values():
+            columna[posicion:n - 1] = columna[posicion + 1:n]
+        self.n = n - 1
+
+class FCFSIncremental(PlanificacionIncremental):
+    """
+    FCFS incremental.
+    
+    Los procesos se guardan ordenados por llegada (a igual llegada, por orden
+    de inserción) con su tiempo de fin, que cumple
+    fin[i] = max(fin[i-1], llegada[i]) + duracion[i]. Un proceso que llega
+    el último solo alarga la cola. Insertar o eliminar en medio desplaza los
+    fines siguientes, pero el desplazamiento se recalcula por bloques y se
+    detiene en cuanto un fin coincide con el anterior: a partir de ahí un
+    hueco de CPU inactiva lo ha absorbido y nada más cambia.
+    """
+
+    BLOQUE_INICIAL = 256  # Fines recalculados en el primer bloque; se duplica en cada uno
+
+    def _reconstruir(self) -> None:
+        procesos = self.repositorio.listar()
+        llegadas = np.array([p.tiempo_llegada for p in procesos], dtype=np.int64)
+        orden = np.argsort(llegadas, kind="stable")
+        self._pids = [procesos[i].pid for i in orden.tolist()]
+        # La secuencia es el orden de inserción en el repositorio
+        self._columnas = _Columnas(llegada=llegadas[orden], secuencia=orden,
+                                   duracion=np.array([p.duracion for p in procesos], dtype=np.int64)[orden],
+                                   fin=np.zeros(len(procesos), dtype=np.int64))
+        self._siguiente = len(procesos)
+        self._recalcular(0, desde_cero=True)
+
+    @staticmethod
+    def _calcular_fines(llegadas: np.ndarray, duraciones: np.ndarray, fin_previo: int) -> np.ndarray:
+        """Fines de una racha de procesos que empieza tras otro que termina en fin_previo."""
+        acumuladas = np.cumsum(duraciones)
+        return acumuladas + np.maximum(fin_previo, np.maximum.accumulate(llegadas - acumuladas + duraciones))
+
+    def _recalcular(self, desde: int, desde_cero: bool = False) -> None:
+        """
+        Recalcula los fines a partir de la posición `desde`.
+        
+        Salvo al planificar desde cero, se detiene al final del primer bloque
+        en el que algún fin posterior a `desde` no cambia.
+        """
+        llegadas, duraciones, fines = (self._columnas[nombre] for nombre in ("llegada", "duracion", "fin"))
+        n = len(fines)
+        bloque = n if desde_cero else self.BLOQUE_INICIAL
+        while desde < n:
+            hasta = min(n, desde + bloque)
+            fin_previo = int(fines[desde - 1]) if desde > 0 else 0
+            nuevos = self._calcular_fines(llegadas[desde:hasta], duraciones[desde:hasta], fin_previo)
+            estable = not desde_cero and bool((nuevos[1:] == fines[desde + 1:hasta]).any())
+            fines[desde:hasta] = nuevos
+            if estable:
+                return
+            desde = hasta
+            bloque *= 2
+
+    def _agregar(self, proceso: Proceso) -> None:
+        posicion = int(np.searchsorted(self._columnas["llegada"], proceso.tiempo_llegada, side="right"))
+        self._columnas.insertar(posicion, llegada=proceso.tiempo_llegada, secuencia=self._siguiente,
+                                duracion=proceso.duracion, fin=0)
+        self._pids.insert(posicion, proceso.pid)
+        self._siguiente += 1
+        self._recalcular(posicion)
+
+    def _eliminar(self, proceso: Proceso) -> None:
+        llegadas = self._columnas["llegada"]
+        desde = int(np.searchsorted(llegadas, proceso.tiempo_llegada, side="left"))
+        hasta = int(np.searchsorted(llegadas, proceso.tiempo_llegada, side="right"))
+        posicion = self._pids.index(proceso.pid, desde, hasta)
+        self._columnas.eliminar(posicion)
+        del self._pids[posicion]
+        self._recalcular(posicion)
+
+    def _resultado(self) -> ResultadoPlanificacion:
+        fines = self._columnas["fin"].copy()
+        inicios = fines - self._columnas["duracion"]
+        gantt = _gantt_secuencial(list(self._pids), inicios, fines)
+        # Las secuencias crecen con el orden del repositorio
+        orden = np.argsort(self._columnas["secuencia"], kind="stable")
+        return ResultadoPlanificacion(gantt, [self._pids[i] for i in orden.tolist()],
+                                      inicios[orden], fines[orden])
+
+def _entrada(segmento: SegmentoRR, tiempo: int) -> Tuple[int, int, int]:
+    """Índice, inicio y fin de la entrada del segmento en curso en `tiempo`."""
+    quantum = segmento.quantum
+    rondas = segmento.vueltas * len(segmento.pids)
+    inicio = segmento.inicio + rondas * quantum
+    if tiempo < inicio:
+        j = (tiempo - segmento.inicio) // quantum
+        return j, segmento.inicio + j * quantum, segmento.inicio + (j + 1) * quantum
+    for i, duracion in enumerate(segmento.cierre):
+        if tiempo < inicio + duracion:
+            return rondas + i, inicio, inicio + duracion
+        inicio += duracion
+    raise ValueError("El instante es posterior al segmento")
+
+def _prefijo(segmento: SegmentoRR, entradas: int) -> List[SegmentoRR]:
+    """Segmentos equivalentes a las primeras `entradas` entradas de un segmento."""
+    pids, quantum, m = segmento.pids, segmento.quantum, len(segmento.pids)
+    rondas = segmento.vueltas * m
+    partes = []
+    if entradas <= rondas:
+        completas, sueltas = divmod(entradas, m)
+        if completas:
+            partes.append(SegmentoRR(segmento.inicio, quantum, completas - 1, pids, (quantum,) * m))
+        if sueltas:
+            partes.append(SegmentoRR(segmento.inicio + completas * m * quantum, quantum, 0,
+                                     pids[:sueltas], (quantum,) * sueltas))
+        return partes
+    if segmento.vueltas:
+        partes.append(SegmentoRR(segmento.inicio, quantum, segmento.vueltas - 1, pids, (quantum,) * m))
+    cierre = segmento.cierre[:entradas - rondas]
+    partes.append(SegmentoRR(segmento.inicio + rondas * quantum, max(cierre), 0, pids[:len(cierre)], cierre))
+    return partes
+
+def _pids_desde(segmentos: List[SegmentoRR], indice: int, entrada: int) -> Iterator[str]:
+    """PIDs de las entradas a partir de la `entrada` del segmento `indice`, en orden."""
+    for segmento in segmentos[indice:]:
+        # Las vistas encadenadas se materializan una vez por segmento
+        pids = tuple(segmento.pids)
+        rondas = segmento.vueltas * len(pids)
+        if entrada < rondas:
+            inicio = entrada % len(pids)
+            yield from islice(cycle(pids), inicio, inicio + rondas - entrada)
+        yield from pids[max(entrada - rondas, 0):]
+        entrada = 0
+
+class RoundRobinIncremental(PlanificacionIncremental):
+    """
+    Round-Robin incremental.
+    
+    Un cambio en un proceso que llega en el instante `a` no afecta a nada
+    anterior: se conserva el diagrama hasta el final de la rebanada en
+    curso en `a` y solo se vuelve a simular desde ahí. El estado en ese
+    instante sale del propio diagrama: el tiempo ejecutado por cada proceso
+    se suma sobre el prefijo comprimido, y el orden de la cola es el de las
+    siguientes entradas, porque en Round-Robin todos los procesos que
+    esperan se ejecutan una vez antes de que vuelva ninguno.
+    """
+
+    def __init__(self, repositorio: RepositorioProcesos, quantum: int):
+        """
+        Planifica el contenido actual del repositorio.
+        
+        Args:
+            repositorio: Repositorio a planificar; los procesos no se modifican.
+            quantum: Tiempo máximo de ejecución por ciclo.
+            
+        Raises:
+            ValueError: Si el quantum no es positivo.
+        """
+        if not isinstance(quantum, int) or quantum <= 0:
+            raise ValueError("El quantum debe ser un entero positivo")
+        self.quantum = quantum
+        super().__init__(repositorio)
+
+    def _reconstruir(self) -> None:
+        procesos = self.repositorio.listar()
+        self._pids = [p.pid for p in procesos]
+        self._segmentos: List[SegmentoRR] = []
+        inicios = fines = np.zeros(len(procesos), dtype=np.int64)
+        if procesos:
+            resultado = RoundRobinScheduler(self.quantum).planificar_resultado(procesos)
+            self._segmentos = resultado.gantt.segmentos
+            inicios, fines = resultado.tiempo_inicio, resultado.tiempo_fin
+        self._inicios_segmento = [segmento.inicio for segmento in self._segmentos]
+        self._columnas = _Columnas(llegada=[p.tiempo_llegada for p in procesos],
+                                   duracion=[p.duracion for p in procesos], inicio=inicios, fin=fines)
+
+    def _agregar(self, proceso: Proceso) -> None:
+        # Fin -1: el proceso nuevo no cuenta como vivo en el diagrama anterior
+        self._columnas.insertar(len(self._pids), llegada=proceso.tiempo_llegada, duracion=proceso.duracion,
+                                inicio=-1, fin=-1)
+        self._pids.append(proceso.pid)
+        self._replanificar(proceso.tiempo_llegada, nuevo=len(self._pids) - 1)
+
+    def _eliminar(self, proceso: Proceso) -> None:
+        indice = self._pids.index(proceso.pid)
+        self._replanificar(proceso.tiempo_llegada, eliminado=indice)
+        self._columnas.eliminar(indice)
+        del self._pids[indice]
+
+    def _replanificar(self, llegada: int, nuevo: Optional[int] = None, eliminado: Optional[int] = None) -> None:
+        """
+        Vuelve a simular desde el primer instante afectado por un cambio.
+        
+        Args:
+            llegada: Llegada del proceso agregado o eliminado.
+            nuevo: Índice del proceso agregado, aún sin planificar.
+            eliminado: Índice del proceso eliminado, que se omite.
+        """
+        segmentos, inicios_segmento = self._segmentos, self._inicios_segmento
+
+        # Corte: fin de la rebanada en curso a la llegada, o la llegada misma
+        corte = llegada
+        s = bisect_right(inicios_segmento, llegada) - 1
+        if s >= 0 and llegada < segmentos[s].fin:
+            _, inicio, fin = _entrada(segmentos[s], llegada)
+            if inicio < llegada:
+                corte = fin
+
+        # Prefijo que se conserva y proceso cuya rebanada termina en el corte
+        s = conservados = bisect_left(inicios_segmento, corte)
+        entrada = 0
+        partido: List[SegmentoRR] = []
+        if s > 0 and segmentos[s - 1].fin > corte:
+            s = conservados = s - 1
+            entrada = _entrada(segmentos[s], corte)[0]
+            partido = _prefijo(segmentos[s], entrada)
+        prefijo = segmentos[:conservados] + partido
+        expulsado = prefijo[-1].pids[-1] if prefijo and prefijo[-1].fin == corte else None
+
+        # Estado en el corte: los que esperan, los que llegan justo entonces y los futuros
+        llegadas, duraciones = self._columnas["llegada"], self._columnas["duracion"]
+        inicios, fines = self._columnas["inicio"], self._columnas["fin"]
+        vivos = (llegadas <= corte) & (fines > corte)
+        llegan_en_corte = np.flatnonzero(vivos & (llegadas == corte)).tolist()
+        esperan = {self._pids[i]: i for i in np.flatnonzero(vivos & (llegadas < corte)).tolist()}
+        futuros = np.flatnonzero(llegadas > corte).tolist()
+        # El expulsado, si le queda tiempo, vuelve a la cola tras las llegadas
+        sigue = [esperan.pop(expulsado)] if expulsado in esperan else []
+
+        # Tiempo ejecutado antes del corte por los que ya habían llegado
+        ejecutado = dict.fromkeys([*esperan, *(self._pids[i] for i in sigue)], 0)
+        if ejecutado:
+            primera_llegada = min(int(llegadas[i]) for i in [*esperan.values(), *sigue])
+            for segmento in reversed(prefijo):
+                if segmento.fin <= primera_llegada:
+                    break
+                base = segmento.vueltas * segmento.quantum
+                for pid, duracion in zip(segmento.pids, segmento.cierre):
+                    if pid in ejecutado:
+                        ejecutado[pid] += base + duracion
+
+        # En Round-Robin los que esperaban se ejecutan una vez, en orden, antes que nadie más
+        cola = [esperan[pid] for pid in islice(_pids_desde(segmentos, s, entrada), len(esperan))]
+        if eliminado is not None:
+            cola, llegan_en_corte, futuros = ([i for i in grupo if i != eliminado]
+                                              for grupo in (cola, llegan_en_corte, futuros))
+        if nuevo is not None:
+            if llegada < corte:
+                # Llega durante la rebanada: entra en la cola por orden de llegada
+                posicion = len(cola)
+                while posicion > 0 and llegadas[cola[posicion - 1]] > llegada:
+                    posicion -= 1
+                cola.insert(posicion, nuevo)
+            else:
+                llegan_en_corte.append(nuevo)
+        orden = cola + llegan_en_corte + sigue
+        en_corte = len(orden)
+        orden += futuros
+
+        pids = [self._pids[i] for i in orden]
+        indices = np.array(orden, dtype=np.int64)
+        restantes = duraciones[indices] - np.array([ejecutado.get(pid, 0) for pid in pids], dtype=np.int64)
+        sub_llegadas = llegadas[indices]
+        sub_llegadas[:en_corte] = corte
+        simulador = SimuladorEventos(PoliticaRoundRobin(self.quantum))
+        tramos = simulador.simular(pids, duraciones[indices].tolist(), sub_llegadas.tolist(), None,
+                                   restantes.tolist())
+        nuevos = partido + GanttComprimido.desde_tramos(tramos).segmentos
+        self._segmentos = prefijo + nuevos[len(partido):]
+        self._inicios_segmento = inicios_segmento[:conservados] + [segmento.inicio for segmento in nuevos]
+
+        sin_empezar = restantes == duraciones[indices]
+        inicios[indices[sin_empezar]] = np.array(simulador.inicios, dtype=np.int64)[sin_empezar]
+        fines[indices] = simulador.fines
+
+    def _resultado(self) -> ResultadoPlanificacion:
+        return ResultadoPlanificacion(GanttComprimido(list(self._segmentos)), list(self._pids),
+                                      self._columnas["inicio"].copy(), self._columnas["fin"].copy())
@@ -1,7 +1,12 @@
-from src.proceso import Proceso
+from src.proceso import Proceso, recolector_pausado
 from src.repositorio import RepositorioProcesos
-from src.scheduler import FCFSScheduler, RoundRobinScheduler
+from src.tabla import TablaProcesos
 from src.metrics import Metrics
+from src.scheduler import (FCFSScheduler, RoundRobinScheduler, PrioridadScheduler,
+                           PrioridadExpropiativaScheduler, SJFScheduler, SRTFScheduler, MLFQScheduler,
+                           CFSScheduler, LoteriaScheduler, StrideScheduler)
+from src.cache import CacheResultados
+from src.barrido import barrer, formatear_tabla, rejilla
 
 def print_menu():
     """Prints the interactive menu."""
@@ -12,16 +17,18 @@ def print_menu():
     print("4. Mostrar métricas")
     print("5. Guardar procesos")
     print("6. Cargar procesos")
-    print("7. Salir")
+    print("7. Barrido de parámetros")
+    print("8. Salir")
 
 def main():
     """Main function for the interactive CLI."""
     repositorio = RepositorioProcesos()
-    gantt = None  # Store Gantt diagram for metrics
+    planificacion = None  # Processes and cache entry of the last planning
+    cache = CacheResultados()  # Repeated plannings of the same processes are not recomputed
 
     while True:
         print_menu()
-        opcion = input("Seleccione una opción (1-7): ")
+        opcion = input("Seleccione una opción (1-8): ")
 
         if opcion == "1":
             # Agregar proceso
@@ -29,7 +36,8 @@ def main():
                 pid = input("Ingrese PID: ")
                 duracion = int(input("Ingrese duración: "))
                 prioridad = int(input("Ingrese prioridad: "))
-                proceso = Proceso(pid, duracion, prioridad)
+                llegada = input("Ingrese tiempo de llegada (0 por defecto): ")
+                proceso = Proceso(pid, duracion, prioridad, int(llegada) if llegada.strip() else 0)
                 repositorio.agregar(proceso)
                 print(f"Proceso {pid} agregado exitosamente.")
             except ValueError as e:
@@ -52,47 +60,89 @@ def main():
                 print("No hay procesos para planificar.")
                 continue
 
-            algoritmo = input("Seleccione algoritmo (fcfs/rr): ").lower()
+            algoritmo = input("Seleccione algoritmo (fcfs/rr/prioridad/sjf/srtf/mlfq/cfs/loteria/stride): ").lower()
             try:
                 if algoritmo == "fcfs":
                     scheduler = FCFSScheduler()
                 elif algoritmo == "rr":
                     quantum = int(input("Ingrese quantum: "))
                     scheduler = RoundRobinScheduler(quantum)
+                elif algoritmo == "prioridad":
+                    expropiativo = input("¿Expropiativo? (s/n): ").lower() == "s"
+                    envejecimiento = input("Envejecimiento (vacío = sin envejecimiento): ").strip()
+                    clase = PrioridadExpropiativaScheduler if expropiativo else PrioridadScheduler
+                    scheduler = clase(int(envejecimiento) if envejecimiento else None)
+                elif algoritmo == "sjf":
+                    scheduler = SJFScheduler()
+                elif algoritmo == "srtf":
+                    scheduler = SRTFScheduler()
+                elif algoritmo == "mlfq":
+                    quanta = input("Quanta por nivel separados por comas (2,4,8 por defecto): ").strip()
+                    boost = input("Intervalo de boost (vacío = sin boost): ").strip()
+                    scheduler = MLFQScheduler(
+                        tuple(int(q) for q in quanta.split(",")) if quanta else (2, 4, 8),
+                        int(boost) if boost else None
+                    )
+                elif algoritmo == "cfs":
+                    latencia = int(input("Latencia objetivo: "))
+                    granularidad = int(input("Granularidad mínima: "))
+                    scheduler = CFSScheduler(latencia, granularidad)
+                elif algoritmo == "loteria":
+                    quantum = int(input("Ingrese quantum: "))
+                    semilla = input("Semilla (vacío = aleatoria): ").strip()
+                    scheduler = LoteriaScheduler(quantum, int(semilla) if semilla else None)
+                elif algoritmo == "stride":
+                    quantum = int(input("Ingrese quantum: "))
+                    scheduler = StrideScheduler(quantum)
                 else:
-                    print("Algoritmo no válido. Use 'fcfs' o 'rr'.")
+                    print("Algoritmo no válido. Use 'fcfs', 'rr', 'prioridad', 'sjf', 'srtf', 'mlfq', "
+                          "'cfs', 'loteria' o 'stride'.")
                     continue
 
-                gantt = scheduler.planificar(procesos)
+                # The processes are not modified, so they can be planned again
+                entrada = cache.obtener(repositorio, scheduler)
                 print("Diagrama de Gantt:")
-                for entry in gantt:
-                    print(f"  {entry[0]}: {entry[1]} -> {entry[2]}")
+                for pid, inicio, fin in entrada.resultado.gantt:
+                    print(f"  {pid}: {inicio} -> {fin}")
+                planificacion = (procesos, entrada)
             except ValueError as e:
                 print(f"Error: {e}")
 
         elif opcion == "4":
             # Mostrar métricas
-            procesos = repositorio.listar()
-            if not procesos or not gantt:
+            if planificacion is None:
                 print("Primero debes planificar los procesos.")
                 continue
             try:
-                metrics = Metrics(procesos, gantt)
-                print(metrics)
+                # Per-process times come from the cached result, not from the processes
+                procesos, entrada = planificacion
+                print("Métricas por proceso:")
+                for pid, valores in Metrics(procesos, entrada.resultado).obtener_metricas_por_proceso().items():
+                    print(f"  {pid}:")
+                    print(f"    Tiempo de respuesta: {valores['tiempo_respuesta']}")
+                    print(f"    Tiempo de retorno: {valores['tiempo_retorno']}")
+                    print(f"    Tiempo de espera: {valores['tiempo_espera']}")
+                print(entrada.metricas)
             except ValueError as e:
                 print(f"Error: {e}")
 
         elif opcion == "5":
             # Guardar procesos
-            formato = input("Seleccione formato (json/csv): ").lower()
+            formato = input("Seleccione formato (json/jsonl/csv/bin/inc): ").lower()
             archivo = input("Ingrese nombre del archivo: ")
             try:
                 if formato == "json":
                     repositorio.guardar_json(archivo)
+                elif formato == "jsonl":
+                    repositorio.guardar_jsonl(archivo)
                 elif formato == "csv":
                     repositorio.guardar_csv(archivo)
+                elif formato == "bin":
+                    TablaProcesos.desde_repositorio(repositorio).guardar_binario(archivo)
+                elif formato == "inc":
+                    repositorio.guardar_incremental(archivo)
                 else:
-                    print("Formato no válido. Use 'json' o 'csv'.")
+                    print("Formato no válido. Use 'json', 'jsonl', 'csv', 'bin' o 'inc'.")
                     continue
                 print(f"Procesos guardados en {archivo} ({formato}).")
             except (ValueError, IOError) as e:
@@ -100,28 +150,60 @@ def main():
 
         elif opcion == "6":
             # Cargar procesos
-            formato = input("Seleccione formato (json/csv): ").lower()
+            formato = input("Seleccione formato (json/jsonl/csv/bin/inc): ").lower()
             archivo = input("Ingrese nombre del archivo: ")
             try:
-                if formato == "json":
-                    repositorio.cargar_json(archivo)
-                elif formato == "csv":
-                    repositorio.cargar_csv(archivo)
-                else:
-                    print("Formato no válido. Use 'json' o 'csv'.")
-                    continue
+                # Bulk loads create one object per process; the CLI has a
+                # single thread, so pausing the collector here is safe
+                with recolector_pausado():
+                    if formato == "json":
+                        repositorio.cargar_json(archivo)
+                    elif formato == "jsonl":
+                        repositorio.cargar_jsonl(archivo)
+                    elif formato == "csv":
+                        repositorio.cargar_csv(archivo)
+                    elif formato == "bin":
+                        repositorio = TablaProcesos.abrir_binario(archivo).a_repositorio()
+                    elif formato == "inc":
+                        repositorio.cargar_incremental(archivo)
+                    else:
+                        print("Formato no válido. Use 'json', 'jsonl', 'csv', 'bin' o 'inc'.")
+                        continue
                 print(f"Procesos cargados desde {archivo} ({formato}).")
-                gantt = None  # Reset Gantt after loading new processes
+                planificacion = None  # Reset metrics after loading new processes
             except (ValueError, IOError) as e:
                 print(f"Error: {e}")
 
         elif opcion == "7":
+            # Barrido de parámetros en paralelo
+            procesos = repositorio.listar()
+            if not procesos:
+                print("No hay procesos para planificar.")
+                continue
+            try:
+                quanta = input("Quanta a probar separados por comas (2,4,8 por defecto): ").strip()
+                nucleos = input("Núcleos a probar separados por comas (vacío = solo un núcleo): ").strip()
+                niveles = input("Quanta MLFQ por nivel, configuraciones separadas por ';' (2,4,8 por defecto): ").strip()
+                quanta = [int(q) for q in quanta.split(",")] if quanta else [2, 4, 8]
+                nucleos = [int(n) for n in nucleos.split(",")] if nucleos else []
+                niveles = [tuple(int(q) for q in nivel.split(",")) for nivel in niveles.split(";")] if niveles else [(2, 4, 8)]
+
+                configuraciones = (rejilla("fcfs") + rejilla("sjf") + rejilla("srtf")
+                                   + rejilla("rr", quantum=quanta) + rejilla("mlfq", quanta=niveles))
+                if nucleos:
+                    configuraciones += (rejilla("fcfs_multinucleo", nucleos=nucleos)
+                                        + rejilla("rr_multinucleo", quantum=quanta, nucleos=nucleos))
+                print(formatear_tabla(barrer(procesos, configuraciones)))
+            except ValueError as e:
+                print(f"Error: {e}")
+
+        elif opcion == "8":
             # Salir
             print("Saliendo del programa.")
             break
 
         else:
-            print("Opción no válida. Por favor, seleccione un número entre 1 y 7.")
+            print("Opción no válida. Por favor, seleccione un número entre 1 y 8.")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,68 +1,429 @@
-from typing import List, Dict, Tuple
+import math
+from typing import List, Dict, Sequence, Tuple, Union
+import numpy as np
 from src.proceso import Proceso
-from src.scheduler import GanttEntry
+from src.gantt import GanttEntry, GanttBuffer, GanttComprimido
+from src.tabla import TablaProcesos, SIN_TIEMPO
+from src.scheduler import ResultadoPlanificacion, _columnas_carga
+
+# Métricas por proceso que se acumulan, en el orden de sus claves
+METRICAS = ("tiempo_respuesta", "tiempo_retorno", "tiempo_espera")
+
+class SketchCuantiles:
+    """
+    Resumen de cuantiles con error relativo acotado y memoria constante.
+    
+    Cada valor positivo v se cuenta en la cubeta ceil(log_gamma(v)), con
+    gamma = (1 + precision) / (1 - precision); los ceros se cuentan aparte.
+    Cualquier cuantil se estima con un error relativo menor que `precision`
+    y el número de cubetas solo crece con el logaritmo del rango de valores.
+    Dos sketches con la misma precisión se fusionan sumando sus cubetas.
+    """
+
+    def __init__(self, precision: float = 0.01):
+        """
+        Inicializa un sketch vacío.
+        
+        Args:
+            precision: Error relativo máximo de los cuantiles (entre 0 y 1).
+            
+        Raises:
+            ValueError: Si la precisión no está en el intervalo (0, 1).
+        """
+        if not isinstance(precision, (int, float)) or not 0 < precision < 1:
+            raise ValueError("La precisión debe estar entre 0 y 1")
+        self.precision = precision
+        self._gamma = (1 + precision) / (1 - precision)
+        self._log_gamma = math.log(self._gamma)
+        self._cubetas: Dict[int, int] = {}
+        self._ceros = 0
+        self.total = 0
+        self.minimo = None
+        self.maximo = None
+
+    def agregar(self, valor: int) -> None:
+        """
+        Añade un valor al sketch.
+        
+        Args:
+            valor: Valor no negativo.
+            
+        Raises:
+            ValueError: Si el valor es negativo.
+        """
+        if valor < 0:
+            raise ValueError("El sketch solo admite valores no negativos")
+        if valor == 0:
+            self._ceros += 1
+        else:
+            indice = math.ceil(math.log(valor) / self._log_gamma)
+            self._cubetas[indice] = self._cubetas.get(indice, 0) + 1
+        self.total += 1
+        self.minimo = valor if self.minimo is None else min(self.minimo, valor)
+        self.maximo = valor if self.maximo is None else max(self.maximo, valor)
+
+    def agregar_lote(self, valores: np.ndarray) -> None:
+        """
+        Añade un array de valores de una sola vez.
+        
+        Args:
+            valores: Array de valores no negativos.
+            
+        Raises:
+            ValueError: Si algún valor es negativo.
+        """
+        valores = np.asarray(valores)
+        if valores.size == 0:
+            return
+        if (valores < 0).any():
+            raise ValueError("El sketch solo admite valores no negativos")
+        positivos = valores[valores > 0]
+        self._ceros += int(valores.size - positivos.size)
+        if positivos.size:
+            indices = np.ceil(np.log(positivos) / self._log_gamma).astype(np.int64)
+            for indice, veces in zip(*(a.tolist() for a in np.unique(indices, return_counts=True))):
+                self._cubetas[indice] = self._cubetas.get(indice, 0) + veces
+        self.total += int(valores.size)
+        minimo, maximo = valores.min().item(), valores.max().item()
+        self.minimo = minimo if self.minimo is None else min(self.minimo, minimo)
+        self.maximo = maximo if self.maximo is None else max(self.maximo, maximo)
+
+    def cuantil(self, q: float) -> float:
+        """
+        Estima el cuantil q de los valores añadidos.
+        
+        Args:
+            q: Cuantil entre 0 y 1 (0.5 = mediana).
+            
+        Returns:
+            Valor estimado del cuantil.
+            
+        Raises:
+            ValueError: Si q no está en [0, 1] o el sketch está vacío.
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("El cuantil debe estar entre 0 y 1")
+        if self.total == 0:
+            raise ValueError("El sketch está vacío")
+        if q == 0:
+            return self.minimo
+        if q == 1:
+            return self.maximo
+        rango = q * (self.total - 1)
+        acumulado = self._ceros
+        if rango < acumulado:
+            return 0
+        for indice in sorted(self._cubetas):
+            acumulado += self._cubetas[indice]
+            if rango < acumulado:
+                estimacion = 2 * self._gamma ** indice / (self._gamma + 1)
+                return min(max(estimacion, self.minimo), self.maximo)
+        return self.maximo
+
+    def merge(self, otro: "SketchCuantiles") -> None:
+        """
+        Incorpora los valores de otro sketch con la misma precisión.
+        
+        Args:
+            otro: Sketch a fusionar.
+            
+        Raises:
+            ValueError: Si las precisiones no coinciden.
+        """
+        if not isinstance(otro, SketchCuantiles) or otro.precision != self.precision:
+            raise ValueError("Solo se pueden fusionar sketches con la misma precisión")
+        for indice, veces in otro._cubetas.items():
+            self._cubetas[indice] = self._cubetas.get(indice, 0) + veces
+        self._ceros += otro._ceros
+        self.total += otro.total
+        for valor in (otro.minimo, otro.maximo):
+            if valor is not None:
+                self.minimo = valor if self.minimo is None else min(self.minimo, valor)
+                self.maximo = valor if self.maximo is None else max(self.maximo, valor)
+
+class MetricasIncrementales:
+    """
+    Acumulador de métricas con memoria constante.
+    
+    Recibe los procesos terminados de uno en uno (o por lotes) y guarda solo
+    sumas enteras y un SketchCuantiles por métrica, así que sirve para
+    cargas demasiado grandes para conservar un registro por proceso. Los
+    acumuladores de simulaciones independientes se combinan con `merge`.
+    """
+
+    def __init__(self, precision: float = 0.01):
+        """
+        Inicializa un acumulador vacío.
+        
+        Args:
+            precision: Error relativo máximo de los percentiles.
+            
+        Raises:
+            ValueError: Si la precisión no está en el intervalo (0, 1).
+        """
+        self.precision = precision
+        self.num_procesos = 0
+        self._sumas = {metrica: 0 for metrica in METRICAS}
+        self._sketches = {metrica: SketchCuantiles(precision) for metrica in METRICAS}
+
+    def agregar(self, proceso: Proceso) -> None:
+        """
+        Añade un proceso terminado.
+        
+        Args:
+            proceso: Proceso con tiempos de inicio y fin definidos.
+            
+        Raises:
+            ValueError: Si el proceso no es válido o no ha terminado.
+        """
+        if not isinstance(proceso, Proceso):
+            raise ValueError("El argumento debe ser una instancia de Proceso")
+        if proceso.tiempo_inicio is None or proceso.tiempo_fin is None:
+            raise ValueError(f"El proceso {proceso.pid} no tiene tiempos de inicio o fin definidos")
+        tiempo_retorno = proceso.tiempo_fin - proceso.tiempo_llegada
+        self.agregar_tiempos(proceso.tiempo_inicio - proceso.tiempo_llegada,
+                             tiempo_retorno, tiempo_retorno - proceso.duracion)
+
+    def agregar_tiempos(self, tiempo_respuesta: int, tiempo_retorno: int, tiempo_espera: int) -> None:
+        """
+        Añade las métricas ya calculadas de un proceso.
+        
+        Args:
+            tiempo_respuesta: Tiempo de respuesta del proceso.
+            tiempo_retorno: Tiempo de retorno del proceso.
+            tiempo_espera: Tiempo de espera del proceso.
+            
+        Raises:
+            ValueError: Si algún tiempo no es un entero no negativo; en ese
+                caso el acumulador no cambia.
+        """
+        valores = (tiempo_respuesta, tiempo_retorno, tiempo_espera)
+        for metrica, valor in zip(METRICAS, valores):
+            if isinstance(valor, bool) or not isinstance(valor, (int, np.integer)) or valor < 0:
+                raise ValueError(f"El {metrica.replace('_', ' ')} debe ser un entero no negativo")
+        for metrica, valor in zip(METRICAS, valores):
+            self._sumas[metrica] += valor
+            self._sketches[metrica].agregar(valor)
+        self.num_procesos += 1
+
+    def agregar_lote(self, tiempos_respuesta: Sequence[int], tiempos_retorno: Sequence[int],
+                     tiempos_espera: Sequence[int]) -> None:
+        """
+        Añade las métricas de muchos procesos a la vez.
+        
+        Args:
+            tiempos_respuesta: Tiempos de respuesta.
+            tiempos_retorno: Tiempos de retorno.
+            tiempos_espera: Tiempos de espera.
+            
+        Raises:
+            ValueError: Si las secuencias no tienen la misma longitud o algún
+                tiempo es negativo; en ese caso el acumulador no cambia.
+        """
+        columnas = [np.asarray(c, dtype=np.int64) for c in (tiempos_respuesta, tiempos_retorno, tiempos_espera)]
+        if len({c.size for c in columnas}) != 1:
+            raise ValueError("Todas las columnas deben tener la misma longitud")
+        if any((c < 0).any() for c in columnas):
+            raise ValueError("Los tiempos deben ser enteros no negativos")
+        for metrica, valores in zip(METRICAS, columnas):
+            self._sumas[metrica] += int(valores.sum())
+            self._sketches[metrica].agregar_lote(valores)
+        self.num_procesos += int(columnas[0].size)
+
+    def merge(self, otro: "MetricasIncrementales") -> None:
+        """
+        Incorpora los procesos acumulados por otro acumulador.
+        
+        Args:
+            otro: Acumulador con la misma precisión.
+            
+        Raises:
+            ValueError: Si el acumulador no es válido o su precisión es distinta.
+        """
+        if not isinstance(otro, MetricasIncrementales):
+            raise ValueError("El argumento debe ser una instancia de MetricasIncrementales")
+        for metrica in METRICAS:
+            self._sketches[metrica].merge(otro._sketches[metrica])
+            self._sumas[metrica] += otro._sumas[metrica]
+        self.num_procesos += otro.num_procesos
+
+    def obtener_metricas_promedio(self) -> Dict[str, float]:
+        """
+        Devuelve las métricas promedio de los procesos acumulados.
+        
+        Returns:
+            Diccionario con promedios de tiempo de respuesta, retorno y espera.
+            
+        Raises:
+            ValueError: Si no se ha acumulado ningún proceso.
+        """
+        if self.num_procesos == 0:
+            raise ValueError("No se ha acumulado ningún proceso")
+        return {
+            "promedio_respuesta": self._sumas["tiempo_respuesta"] / self.num_procesos,
+            "promedio_retorno": self._sumas["tiempo_retorno"] / self.num_procesos,
+            "promedio_espera": self._sumas["tiempo_espera"] / self.num_procesos
+        }
+
+    def percentil(self, metrica: str, percentil: float) -> float:
+        """
+        Estima un percentil de una métrica.
+        
+        Args:
+            metrica: "tiempo_respuesta", "tiempo_retorno" o "tiempo_espera".
+            percentil: Percentil entre 0 y 100.
+            
+        Returns:
+            Valor estimado del percentil.
+            
+        Raises:
+            ValueError: Si la métrica o el percentil no son válidos.
+        """
+        if metrica not in self._sketches:
+            raise ValueError(f"Métrica desconocida: {metrica}")
+        if not 0 <= percentil <= 100:
+            raise ValueError("El percentil debe estar entre 0 y 100")
+        return self._sketches[metrica].cuantil(percentil / 100)
+
+    def obtener_percentiles(self, percentiles: Sequence[float] = (50, 95, 99)) -> Dict[str, Dict[str, float]]:
+        """
+        Devuelve varios percentiles de cada métrica.
+        
+        Args:
+            percentiles: Percentiles a estimar (entre 0 y 100).
+            
+        Returns:
+            Diccionario métrica -> {"p50": valor, ...}.
+        """
+        return {
+            metrica: {f"p{p:g}": self.percentil(metrica, p) for p in percentiles}
+            for metrica in METRICAS
+        }
+
+    def __str__(self) -> str:
+        """
+        Representación en cadena de las métricas acumuladas.
+        """
+        promedios = self.obtener_metricas_promedio()
+        percentiles = self.obtener_percentiles()
+        result = [f"Métricas de {self.num_procesos} procesos:"]
+        for metrica, nombre, clave in zip(METRICAS, ("respuesta", "retorno", "espera"), promedios):
+            valores = ", ".join(f"{p}={v:.2f}" for p, v in percentiles[metrica].items())
+            result.append(f"  Tiempo de {nombre}: promedio={promedios[clave]:.2f}, {valores}")
+        return "\n".join(result)
 
 class Metrics:
     """Clase para calcular métricas de planificación de procesos."""
-
-    def __init__(self, procesos: List[Proceso], gantt: List[GanttEntry]):
+    
+    def __init__(self, procesos: Union[List[Proceso], TablaProcesos],
+                 gantt: Union[List[GanttEntry], GanttComprimido, GanttBuffer, ResultadoPlanificacion]):
         """
         Inicializa las métricas con los procesos y el diagrama de Gantt.
         
         Args:
-            procesos: Lista de procesos planificados.
-            gantt: Lista de entradas GanttEntry (pid, tiempo_inicio, tiempo_fin).
-            
+            procesos: Lista de procesos planificados o TablaProcesos planificada.
+            gantt: Lista de entradas GanttEntry (pid, tiempo_inicio, tiempo_fin)
+                o un GanttComprimido o GanttBuffer, que se validan sin recorrerlos.
+                Con un ResultadoPlanificacion los tiempos se toman de él y los
+                procesos pueden estar sin planificar.
+                
         Raises:
             ValueError: Si los procesos o el diagrama de Gantt son inválidos.
         """
-        if not procesos or not all(isinstance(p, Proceso) for p in procesos):
+        if isinstance(procesos, TablaProcesos):
+            if len(procesos) == 0:
+                raise ValueError("Se requiere una tabla de procesos no vacía")
+        elif not procesos or not all(isinstance(p, Proceso) for p in procesos):
             raise ValueError("Se requiere una lista no vacía de instancias de Proceso")
-        if not gantt or not all(isinstance(entry, tuple) and len(entry) == 3 for entry in gantt):
+        self.resultado = None
+        if isinstance(gantt, ResultadoPlanificacion):
+            pids = procesos.pids if isinstance(procesos, TablaProcesos) else [p.pid for p in procesos]
+            if list(gantt.pids) != list(pids):
+                raise ValueError("El resultado no corresponde a los procesos")
+            self.resultado = gantt
+            gantt = gantt.gantt
+        if isinstance(gantt, (GanttComprimido, GanttBuffer)):
+            if len(gantt) == 0:
+                raise ValueError("El diagrama de Gantt no tiene entradas")
+        elif not gantt or not all(isinstance(entry, tuple) and len(entry) == 3 for entry in gantt):
             raise ValueError("El diagrama de Gantt debe ser una lista no vacía de tuplas (pid, inicio, fin)")
-        for proceso in procesos:
-            if proceso.tiempo_inicio is None or proceso.tiempo_fin is None:
-                raise ValueError(f"El proceso {proceso.pid} no tiene tiempos de inicio o fin definidos")
+        if self.resultado is None and isinstance(procesos, TablaProcesos):
+            sin_tiempos = (procesos.tiempo_inicio == SIN_TIEMPO) | (procesos.tiempo_fin == SIN_TIEMPO)
+            if sin_tiempos.any():
+                pid = procesos.pids[int(np.argmax(sin_tiempos))]
+                raise ValueError(f"El proceso {pid} no tiene tiempos de inicio o fin definidos")
+        elif self.resultado is None:
+            for proceso in procesos:
+                if proceso.tiempo_inicio is None or proceso.tiempo_fin is None:
+                    raise ValueError(f"El proceso {proceso.pid} no tiene tiempos de inicio o fin definidos")
         
         self.procesos = procesos
         self.gantt = gantt
         self._metricas_por_proceso = None
         self._metricas_promedio = None
+        self._columnas = None  # Métricas por proceso como arrays
+        self._acumulador = None
         self._calcular_metricas()
 
+    @property
+    def acumulador(self) -> MetricasIncrementales:
+        """
+        Acumulador con las métricas de todos los procesos.
+        
+        Sus sketches de percentiles se construyen la primera vez que se pide.
+        """
+        if self._acumulador is None:
+            self._acumulador = MetricasIncrementales()
+            self._acumulador.agregar_lote(*self._columnas)
+        return self._acumulador
+
     def _calcular_metricas(self) -> None:
         """
         Calcula las métricas individuales y agregadas para los procesos.
         """
-        self._metricas_por_proceso = {}
-        suma_respuesta = 0
-        suma_retorno = 0
-        suma_espera = 0
-        num_procesos = len(self.procesos)
-
-        for proceso in self.procesos:
-            # Tiempo de respuesta = tiempo_inicio - tiempo_llegada
-            tiempo_respuesta = proceso.tiempo_inicio - proceso.tiempo_llegada
-            # Tiempo de retorno = tiempo_fin - tiempo_llegada
-            tiempo_retorno = proceso.tiempo_fin - proceso.tiempo_llegada
-            # Tiempo de espera = tiempo_retorno - duración
-            tiempo_espera = tiempo_retorno - proceso.duracion
-
-            self._metricas_por_proceso[proceso.pid] = {
-                "tiempo_respuesta": tiempo_respuesta,
-                "tiempo_retorno": tiempo_retorno,
-                "tiempo_espera": tiempo_espera
-            }
+        if self.resultado is not None:
+            _, duraciones, llegadas, _ = _columnas_carga(self.procesos)
+            self._calcular_metricas_vectorizadas(self.resultado.tiempo_inicio, self.resultado.tiempo_fin,
+                                                 np.asarray(llegadas, dtype=np.int64),
+                                                 np.asarray(duraciones, dtype=np.int64))
+            return
+        if isinstance(self.procesos, TablaProcesos):
+            tabla = self.procesos
+            self._calcular_metricas_vectorizadas(tabla.tiempo_inicio, tabla.tiempo_fin,
+                                                 tabla.tiempo_llegada, tabla.duracion)
+            return
+
+        procesos = self.procesos
+        self._calcular_metricas_vectorizadas(np.array([p.tiempo_inicio for p in procesos], dtype=np.int64),
+                                             np.array([p.tiempo_fin for p in procesos], dtype=np.int64),
+                                             np.array([p.tiempo_llegada for p in procesos], dtype=np.int64),
+                                             np.array([p.duracion for p in procesos], dtype=np.int64))
 
-            suma_respuesta += tiempo_respuesta
-            suma_retorno += tiempo_retorno
-            suma_espera += tiempo_espera
+    def _calcular_metricas_vectorizadas(self, inicios: np.ndarray, fines: np.ndarray,
+                                        llegadas: np.ndarray, duraciones: np.ndarray) -> None:
+        """
+        Calcula las métricas a partir de columnas con aritmética de arrays.
+        
+        Las sumas se hacen en enteros antes de dividir, así que los promedios
+        coinciden exactamente con los del cálculo proceso a proceso. El
+        diccionario por proceso y el acumulador se construyen solo si se piden.
+        
+        Raises:
+            ValueError: Si algún tiempo resulta negativo.
+        """
+        tiempo_respuesta = inicios - llegadas
+        tiempo_retorno = fines - llegadas
+        tiempo_espera = tiempo_retorno - duraciones
+        self._columnas = (tiempo_respuesta, tiempo_retorno, tiempo_espera)
+        if any(columna.min() < 0 for columna in self._columnas):
+            raise ValueError("Los tiempos deben ser enteros no negativos")
 
         # Calcular promedios
+        num_procesos = len(tiempo_respuesta)
         self._metricas_promedio = {
-            "promedio_respuesta": suma_respuesta / num_procesos,
-            "promedio_retorno": suma_retorno / num_procesos,
-            "promedio_espera": suma_espera / num_procesos
+            "promedio_respuesta": int(tiempo_respuesta.sum()) / num_procesos,
+            "promedio_retorno": int(tiempo_retorno.sum()) / num_procesos,
+            "promedio_espera": int(tiempo_espera.sum()) / num_procesos
         }
 
     def obtener_metricas_por_proceso(self) -> Dict[str, Dict[str, float]]:
@@ -72,6 +433,25 @@ class Metrics:
         Returns:
             Diccionario con métricas por PID.
         """
+        if self._metricas_por_proceso is None:
+            tiempo_respuesta, tiempo_retorno, tiempo_espera = self._columnas
+            if self.resultado is not None:
+                pids = self.resultado.pids
+            elif isinstance(self.procesos, TablaProcesos):
+                pids = self.procesos.pids
+            else:
+                pids = [p.pid for p in self.procesos]
+            self._metricas_por_proceso = {
+                pid: {
+                    "tiempo_respuesta": respuesta,
+                    "tiempo_retorno": retorno,
+                    "tiempo_espera": espera
+                }
+                for pid, respuesta, retorno, espera in zip(
+                    pids, tiempo_respuesta.tolist(),
+                    tiempo_retorno.tolist(), tiempo_espera.tolist()
+                )
+            }
         return self._metricas_por_proceso
 
     def obtener_metricas_promedio(self) -> Dict[str, float]:
@@ -83,12 +463,24 @@ class Metrics:
         """
         return self._metricas_promedio
 
+    def obtener_percentiles(self, percentiles: Sequence[float] = (50, 95, 99)) -> Dict[str, Dict[str, float]]:
+        """
+        Devuelve percentiles aproximados de cada métrica.
+        
+        Args:
+            percentiles: Percentiles a estimar (entre 0 y 100).
+            
+        Returns:
+            Diccionario métrica -> {"p50": valor, ...}.
+        """
+        return self.acumulador.obtener_percentiles(percentiles)
+
     def __str__(self) -> str:
         """
         Representación en cadena de las métricas.
         """
         result = ["Métricas por proceso:"]
-        for pid, metricas in self._metricas_por_proceso.items():
+        for pid, metricas in self.obtener_metricas_por_proceso().items():
             result.append(f"  {pid}:")
             result.append(f"    Tiempo de respuesta: {metricas['tiempo_respuesta']}")
             result.append(f"    Tiempo de retorno: {metricas['tiempo_retorno']}")
@@ -0,0 +1,249 @@
+import heapq
+from collections import deque
+from typing import Iterator, List, Optional, Sequence, Tuple
+import numpy as np
+from src.gantt import GanttEntry
+from src.scheduler import CargaTrabajo, ResultadoPlanificacion, Scheduler, _columnas_carga, _validar_carga
+from src.tabla import TablaProcesos, SIN_TIEMPO
+
+class ResultadoMultinucleo:
+    """
+    Planificación de una carga de trabajo en varios núcleos.
+    
+    Guarda un diagrama de Gantt por núcleo; `gantt()` los combina en orden
+    cronológico para pasarlos a Metrics.
+    """
+
+    def __init__(self, por_nucleo: List[List[GanttEntry]], ocupado: List[int], robos: int = 0):
+        """
+        Inicializa el resultado.
+        
+        Args:
+            por_nucleo: Entradas GanttEntry de cada núcleo, en orden cronológico.
+            ocupado: Unidades de tiempo que cada núcleo ha estado ejecutando.
+            robos: Procesos que un núcleo ocioso ha tomado de la cola de otro.
+        """
+        self.por_nucleo = por_nucleo
+        self.ocupado = ocupado
+        self.robos = robos
+        self.tiempo_total = max((gantt[-1][2] for gantt in por_nucleo if gantt), default=0)
+
+    def gantt(self) -> List[GanttEntry]:
+        """
+        Combina los diagramas de todos los núcleos.
+        
+        Returns:
+            Lista de entradas GanttEntry ordenada por tiempo de inicio.
+        """
+        return list(heapq.merge(*self.por_nucleo, key=lambda entrada: entrada[1]))
+
+    def utilizacion(self) -> List[float]:
+        """
+        Calcula la fracción del tiempo total que cada núcleo ha estado ocupado.
+        
+        Returns:
+            Lista con la utilización de cada núcleo, entre 0 y 1.
+        """
+        if self.tiempo_total == 0:
+            return [0.0] * len(self.ocupado)
+        return [ocupado / self.tiempo_total for ocupado in self.ocupado]
+
+class SchedulerMultinucleo(Scheduler):
+    """
+    Planificador que reparte la carga entre varios núcleos.
+    
+    Los núcleos en ejecución se guardan en un montículo ordenado por el
+    instante en que quedan libres, así que cada evento cuesta O(log nucleos)
+    y el tiempo ocioso se salta de una vez. Con una cola global todos los
+    núcleos comparten los procesos listos; con colas por núcleo cada
+    proceso se asigna a un núcleo al llegar y un núcleo sin trabajo roba
+    del final de la cola más larga.
+    """
+
+    quantum: Optional[int] = None  # None = cada proceso se ejecuta hasta terminar
+
+    def __init__(self, nucleos: int, colas_por_nucleo: bool = False):
+        """
+        Inicializa el planificador.
+        
+        Args:
+            nucleos: Número de núcleos.
+            colas_por_nucleo: True para una cola por núcleo con robo de
+                trabajo, False para una cola global.
+                
+        Raises:
+            ValueError: Si el número de núcleos no es un entero positivo.
+        """
+        if not isinstance(nucleos, int) or nucleos <= 0:
+            raise ValueError("El número de núcleos debe ser un entero positivo")
+        self.nucleos = nucleos
+        self.colas_por_nucleo = colas_por_nucleo
+
+    def planificar_iter(self, procesos: CargaTrabajo) -> Iterator[GanttEntry]:
+        """
+        Planifica los procesos y genera el diagrama combinado de todos los núcleos.
+        
+        Args:
+            procesos: Lista de procesos o TablaProcesos a planificar.
+            
+        Returns:
+            Iterador de entradas GanttEntry ordenadas por tiempo de inicio.
+            
+        Raises:
+            ValueError: Si la lista de procesos es inválida.
+        """
+        return iter(self.planificar_multinucleo(procesos).gantt())
+
+    def planificar_multinucleo(self, procesos: CargaTrabajo) -> ResultadoMultinucleo:
+        """
+        Planifica los procesos y devuelve el diagrama de cada núcleo.
+        
+        Args:
+            procesos: Lista de procesos o TablaProcesos a planificar.
+            
+        Returns:
+            ResultadoMultinucleo con los diagramas y la utilización por núcleo.
+            
+        Raises:
+            ValueError: Si la lista de procesos es inválida.
+        """
+        _validar_carga(procesos)
+        if isinstance(procesos, TablaProcesos):
+            resultado, inicios, fines = self._simular(procesos.pids, procesos.tiempo_restante.tolist(),
+                                                      procesos.tiempo_llegada.tolist())
+            sin_inicio = procesos.tiempo_inicio == SIN_TIEMPO
+            procesos.tiempo_inicio[sin_inicio] = np.asarray(inicios, dtype=np.int64)[sin_inicio]
+            procesos.tiempo_fin[:] = fines
+            procesos.tiempo_restante[:] = 0
+            return resultado
+
+        resultado, inicios, fines = self._simular([p.pid for p in procesos],
+                                                  [p.tiempo_restante for p in procesos],
+                                                  [p.tiempo_llegada for p in procesos])
+        for proceso, inicio, fin in zip(procesos, inicios, fines):
+            if proceso.tiempo_inicio is None:
+                proceso.establecer_tiempo_inicio(inicio)
+            proceso.reducir_tiempo_restante(proceso.tiempo_restante)
+            proceso.establecer_tiempo_fin(fin)
+        return resultado
+
+    def planificar_resultado(self, procesos: CargaTrabajo) -> ResultadoPlanificacion:
+        """
+        Planifica los procesos sin modificarlos.
+        
+        Args:
+            procesos: Lista de procesos o TablaProcesos a planificar.
+            
+        Returns:
+            ResultadoPlanificacion con el diagrama combinado de todos los núcleos.
+            
+        Raises:
+            ValueError: Si la lista de procesos es inválida.
+        """
+        _validar_carga(procesos, solo_lectura=True)
+        pids, duraciones, llegadas, _ = _columnas_carga(procesos)
+        resultado, inicios, fines = self._simular(pids, duraciones, llegadas)
+        return ResultadoPlanificacion(resultado.gantt(), pids, inicios, fines)
+
+    def _simular(self, pids: Sequence[str], restantes: List[int],
+                 llegadas: List[int]) -> Tuple[ResultadoMultinucleo, List[int], List[int]]:
+        """
+        Motor multinúcleo sobre columnas: no modifica ningún proceso.
+        
+        Args:
+            pids: Identificadores de los procesos.
+            restantes: Tiempo restante de cada proceso.
+            llegadas: Instante de llegada de cada proceso.
+            
+        Returns:
+            Tupla (resultado, tiempos de inicio, tiempos de fin) por posición.
+        """
+        n = len(pids)
+        quantum = self.quantum
+        restantes = list(restantes)
+        inicios: List[Optional[int]] = [None] * n
+        fines = [0] * n
+        por_nucleo: List[List[GanttEntry]] = [[] for _ in range(self.nucleos)]
+        ocupado = [0] * self.nucleos
+        robos = 0
+
+        colas = [deque() for _ in range(self.nucleos if self.colas_por_nucleo else 1)]
+        en_cola = 0
+        orden = sorted(range(n), key=llegadas.__getitem__)  # Estable: empates por posición
+        siguiente = 0
+        libres = list(range(self.nucleos))  # Montículo de núcleos ociosos por índice
+        en_ejecucion: List[Tuple[int, int, int]] = []  # Montículo (fin, núcleo, índice)
+
+        while siguiente < n or en_ejecucion:
+            # Siguiente instante con algún evento
+            tiempo = en_ejecucion[0][0] if en_ejecucion else llegadas[orden[siguiente]]
+            if siguiente < n and llegadas[orden[siguiente]] < tiempo:
+                tiempo = llegadas[orden[siguiente]]
+
+            terminados = []
+            while en_ejecucion and en_ejecucion[0][0] == tiempo:
+                _, nucleo, indice = heapq.heappop(en_ejecucion)
+                terminados.append((nucleo, indice))
+
+            # Las llegadas entran en la cola antes que los procesos que agotan su quantum
+            while siguiente < n and llegadas[orden[siguiente]] <= tiempo:
+                indice = orden[siguiente]
+                colas[siguiente % len(colas)].append(indice)
+                en_cola += 1
+                siguiente += 1
+
+            for nucleo, indice in terminados:
+                if restantes[indice] > 0:
+                    colas[nucleo if self.colas_por_nucleo else 0].append(indice)
+                    en_cola += 1
+                else:
+                    fines[indice] = tiempo
+                heapq.heappush(libres, nucleo)
+
+            # Despachar a los núcleos ociosos mientras haya procesos listos
+            while libres and en_cola:
+                nucleo = heapq.heappop(libres)
+                if not self.colas_por_nucleo:
+                    indice = colas[0].popleft()
+                elif colas[nucleo]:
+                    indice = colas[nucleo].popleft()
+                else:
+                    # Robo de trabajo: del final de la cola más larga
+                    victima = max(colas, key=len)
+                    indice = victima.pop()
+                    robos += 1
+                en_cola -= 1
+
+                rafaga = restantes[indice] if quantum is None else min(quantum, restantes[indice])
+                restantes[indice] -= rafaga
+                if inicios[indice] is None:
+                    inicios[indice] = tiempo
+                por_nucleo[nucleo].append((pids[indice], tiempo, tiempo + rafaga))
+                ocupado[nucleo] += rafaga
+                heapq.heappush(en_ejecucion, (tiempo + rafaga, nucleo, indice))
+
+        return ResultadoMultinucleo(por_nucleo, ocupado, robos), inicios, fines
+
+class FCFSMultinucleoScheduler(SchedulerMultinucleo):
+    """Planificador FCFS en varios núcleos: cada proceso se ejecuta entero."""
+    
+class RoundRobinMultinucleoScheduler(SchedulerMultinucleo):
+    """Planificador Round-Robin en varios núcleos con quantum configurable."""
+    
+    def __init__(self, quantum: int, nucleos: int, colas_por_nucleo: bool = False):
+        """
+        Inicializa el planificador.
+        
+        Args:
+            quantum: Tiempo máximo de ejecución por ciclo.
+            nucleos: Número de núcleos.
+            colas_por_nucleo: True para una cola por núcleo con robo de
+                trabajo, False para una cola global.
+                
+        Raises:
+            ValueError: Si el quantum o el número de núcleos no son positivos.
+        """
+        if not isinstance(quantum, int) or quantum <= 0:
+            raise ValueError("El quantum debe ser un entero positivo")
+        super().__init__(nucleos, colas_por_nucleo)
+        self.quantum = quantum
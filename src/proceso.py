@@ -1,31 +1,92 @@
+import gc
+import threading
+from contextlib import contextmanager
+from itertools import repeat
+from typing import Collection, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+_cerrojo_recolector = threading.Lock()
+_pausas_recolector = 0  # Bloques recolector_pausado abiertos en cualquier hilo
+_recolector_activo = True  # Estado del recolector antes del primero de ellos
+
+@contextmanager
+def recolector_pausado() -> Iterator[None]:
+    """
+    Pausa el recolector de basura durante una construcción masiva.
+    
+    Los procesos no forman ciclos, pero cada objeto creado cuenta para las
+    recolecciones automáticas, que con millones de objetos vivos recorren
+    todo el heap una y otra vez. El recolector es global al intérprete, así
+    que las bibliotecas no lo usan: es la aplicación quien envuelve sus
+    cargas masivas. Los bloques se pueden anidar y abrir desde varios hilos;
+    el recolector se reanuda al cerrarse el último, y solo si estaba activo
+    al abrirse el primero.
+    """
+    global _pausas_recolector, _recolector_activo
+    with _cerrojo_recolector:
+        if _pausas_recolector == 0:
+            _recolector_activo = gc.isenabled()
+            gc.disable()
+        _pausas_recolector += 1
+    try:
+        yield
+    finally:
+        with _cerrojo_recolector:
+            _pausas_recolector -= 1
+            if _pausas_recolector == 0 and _recolector_activo:
+                gc.enable()
+
+class ErrorLote(ValueError):
+    """
+    Error de validación de un lote de procesos.
+    
+    Reúne todas las filas inválidas en `errores`, como pares (fila, mensaje),
+    en lugar de detenerse en la primera.
+    """
+
+    MAX_MENSAJES = 10  # Filas detalladas en el mensaje del error
+
+    def __init__(self, errores: List[Tuple[int, str]]):
+        self.errores = errores
+        detalle = "; ".join(f"fila {fila}: {mensaje}" for fila, mensaje in errores[:self.MAX_MENSAJES])
+        if len(errores) > self.MAX_MENSAJES:
+            detalle += f"; ... y {len(errores) - self.MAX_MENSAJES} más"
+        super().__init__(f"{len(errores)} errores en el lote: {detalle}")
+
 class Proceso:
-    # Conjunto estático para almacenar los PIDs utilizados
-    _pids_usados = set()
+    """
+    Registro compacto de un proceso.
+    
+    Usa __slots__ para no reservar un diccionario por instancia. La unicidad
+    del PID no es global: la garantiza el contenedor que agrupa los procesos
+    (RepositorioProcesos o TablaProcesos), de modo que dos cargas de trabajo
+    independientes pueden reutilizar los mismos PIDs.
+    """
+
+    __slots__ = ("_pid", "_duracion", "_prioridad", "_tiempo_restante",
+                 "_tiempo_llegada", "_tiempo_inicio", "_tiempo_fin")
 
-    def __init__(self, pid: str, duracion: int, prioridad: int):
+    def __init__(self, pid: str, duracion: int, prioridad: int, tiempo_llegada: int = 0):
         """
         Inicializa un nuevo proceso con los atributos especificados.
         
         Args:
-            pid (str): Identificador único del proceso.
+            pid (str): Identificador del proceso.
             duracion (int): Tiempo total de CPU requerido.
             prioridad (int): Valor de prioridad (menor valor = mayor prioridad).
-        
+            tiempo_llegada (int): Instante en que el proceso llega al sistema.
+            
         Raises:
-            ValueError: Si los argumentos son inválidos o el PID está duplicado.
+            ValueError: Si los argumentos son inválidos.
         """
         # Validaciones
         if not isinstance(pid, str) or not pid.strip():
             raise ValueError("El PID debe ser una cadena no vacía")
-        if pid in Proceso._pids_usados:
-            raise ValueError(f"El PID '{pid}' ya está en uso")
         if not isinstance(duracion, int) or duracion <= 0:
             raise ValueError("La duración debe ser un entero positivo")
         if not isinstance(prioridad, int) or prioridad < 0:
             raise ValueError("La prioridad debe ser un entero no negativo")
-
-        # Registrar el PID
-        Proceso._pids_usados.add(pid)
+        if not isinstance(tiempo_llegada, int) or tiempo_llegada < 0:
+            raise ValueError("El tiempo de llegada debe ser un entero no negativo")
 
         # Atributos básicos
         self._pid = pid
@@ -34,17 +95,10 @@ class Proceso:
 
         # Atributos adicionales
         self._tiempo_restante = duracion  # Tiempo de CPU restante
-        self._tiempo_llegada = 0  # Asumido como 0 para simplificación
+        self._tiempo_llegada = tiempo_llegada  # Instante de llegada al sistema
         self._tiempo_inicio = None  # Se establecerá cuando el proceso comience
         self._tiempo_fin = None  # Se establecerá cuando el proceso termine
 
-    def __del__(self):
-        """
-        Libera el PID cuando el objeto es destruido.
-        """
-        if self._pid in Proceso._pids_usados:
-            Proceso._pids_usados.remove(self._pid)
-
     # Propiedades para acceder a los atributos
     @property
     def pid(self) -> str:
@@ -81,7 +135,7 @@ class Proceso:
         
         Args:
             tiempo (int): Cantidad de tiempo a reducir.
-        
+            
         Raises:
             ValueError: Si el tiempo es inválido o excede el tiempo restante.
         """
@@ -97,7 +151,7 @@ class Proceso:
         
         Args:
             tiempo (int): Tiempo de inicio.
-        
+            
         Raises:
             ValueError: Si el tiempo es inválido o ya está establecido.
         """
@@ -113,7 +167,7 @@ class Proceso:
         
         Args:
             tiempo (int): Tiempo de finalización.
-        
+            
         Raises:
             ValueError: Si el tiempo es inválido o ya está establecido.
         """
@@ -128,4 +182,159 @@ class Proceso:
         Representación en cadena del proceso.
         """
         return (f"Proceso(pid={self._pid}, duracion={self._duracion}, "
-                f"prioridad={self._prioridad}, tiempo_restante={self._tiempo_restante})")
\ No newline at end of file
+                f"prioridad={self._prioridad}, tiempo_restante={self._tiempo_restante})")
+
+    @classmethod
+    def _sin_validar(cls, pid: str, duracion: int, prioridad: int, tiempo_llegada: int = 0) -> "Proceso":
+        """
+        Crea un proceso cuyos argumentos ya se han validado.
+        """
+        proceso = cls.__new__(cls)
+        proceso._pid = pid
+        proceso._duracion = duracion
+        proceso._prioridad = prioridad
+        proceso._tiempo_restante = duracion
+        proceso._tiempo_llegada = tiempo_llegada
+        proceso._tiempo_inicio = None
+        proceso._tiempo_fin = None
+        return proceso
+
+    @staticmethod
+    def validar_lote(pids: Sequence[str], duraciones: Sequence[int], prioridades: Sequence[int],
+                     pids_existentes: Collection[str] = (),
+                     llegadas: Optional[Sequence[int]] = None) -> List[Tuple[int, str]]:
+        """
+        Valida un lote de procesos por columnas en una sola pasada.
+        
+        Args:
+            pids: Identificadores de los procesos.
+            duraciones: Duraciones de los procesos.
+            prioridades: Prioridades de los procesos.
+            pids_existentes: PIDs ya en uso fuera del lote (p. ej. los de un repositorio).
+            llegadas: Tiempos de llegada de los procesos (por defecto, todos 0).
+            
+        Returns:
+            Lista de pares (fila, mensaje) con todos los errores encontrados.
+            
+        Raises:
+            ValueError: Si las columnas no tienen la misma longitud.
+        """
+        columnas = (pids, duraciones, prioridades) if llegadas is None else (pids, duraciones, prioridades, llegadas)
+        if len(set(map(len, columnas))) != 1:
+            raise ValueError("Todas las columnas deben tener la misma longitud")
+        if not pids:
+            return []
+
+        # Camino rápido: comprobaciones por columna con operaciones de conjuntos
+        # y funciones nativas; solo si fallan se recorre fila a fila
+        if set(map(type, pids)) == {str} and all(map(str.strip, pids)):
+            unicos = set(pids)
+            if (len(unicos) == len(pids) and unicos.isdisjoint(pids_existentes)
+                    and set(map(type, duraciones)) == {int} and min(duraciones) > 0
+                    and set(map(type, prioridades)) == {int} and min(prioridades) >= 0
+                    and (llegadas is None or (set(map(type, llegadas)) == {int} and min(llegadas) >= 0))):
+                return []
+
+        errores: List[Tuple[int, str]] = []
+        vistos = set()
+        filas = zip(pids, duraciones, prioridades, repeat(0) if llegadas is None else llegadas)
+        for fila, (pid, duracion, prioridad, llegada) in enumerate(filas):
+            if not isinstance(pid, str) or not pid.strip():
+                errores.append((fila, "El PID debe ser una cadena no vacía"))
+            elif pid in vistos:
+                errores.append((fila, f"El PID '{pid}' está duplicado en el lote"))
+            elif pid in pids_existentes:
+                errores.append((fila, f"El PID '{pid}' ya existe en el repositorio"))
+            else:
+                vistos.add(pid)
+            if not isinstance(duracion, int) or duracion <= 0:
+                errores.append((fila, "La duración debe ser un entero positivo"))
+            if not isinstance(prioridad, int) or prioridad < 0:
+                errores.append((fila, "La prioridad debe ser un entero no negativo"))
+            if not isinstance(llegada, int) or llegada < 0:
+                errores.append((fila, "El tiempo de llegada debe ser un entero no negativo"))
+        return errores
+
+    @classmethod
+    def crear_lote(cls, filas: Optional[Iterable[Sequence]] = None, *,
+                   pids: Optional[Sequence[str]] = None,
+                   duraciones: Optional[Sequence[int]] = None,
+                   prioridades: Optional[Sequence[int]] = None,
+                   llegadas: Optional[Sequence[int]] = None,
+                   pids_existentes: Collection[str] = ()) -> List["Proceso"]:
+        """
+        Crea muchos procesos validando el lote completo una sola vez.
+        
+        Acepta un iterable de filas (pid, duracion, prioridad[, tiempo_llegada])
+        o las columnas por separado; sin llegada, los procesos llegan en 0.
+        Si hay errores no se crea ningún proceso. Con lotes de millones de
+        procesos, la aplicación puede envolver la llamada en
+        recolector_pausado().
+        
+        Args:
+            filas: Iterable de filas (pid, duracion, prioridad[, tiempo_llegada]).
+            pids: Columna de identificadores.
+            duraciones: Columna de duraciones.
+            prioridades: Columna de prioridades.
+            llegadas: Columna opcional de tiempos de llegada.
+            pids_existentes: PIDs ya en uso fuera del lote.
+            
+        Returns:
+            Lista de procesos en el orden del lote.
+            
+        Raises:
+            ErrorLote: Si alguna fila es inválida; incluye todas las filas erróneas.
+            ValueError: Si se mezclan filas y columnas o faltan columnas.
+        """
+        pids, duraciones, prioridades, llegadas, errores = cls._columnas_lote(filas, pids, duraciones,
+                                                                              prioridades, llegadas)
+        # Las filas mal formadas ya tienen su error; no se validan sus campos
+        mal_formadas = {fila for fila, _ in errores}
+        errores.extend(error for error in cls.validar_lote(pids, duraciones, prioridades, pids_existentes,
+                                                           llegadas)
+                       if error[0] not in mal_formadas)
+        if errores:
+            raise ErrorLote(sorted(errores))
+        if llegadas is None:
+            return [cls._sin_validar(pid, duracion, prioridad)
+                    for pid, duracion, prioridad in zip(pids, duraciones, prioridades)]
+        return [cls._sin_validar(pid, duracion, prioridad, llegada)
+                for pid, duracion, prioridad, llegada in zip(pids, duraciones, prioridades, llegadas)]
+
+    @staticmethod
+    def _columnas_lote(filas, pids, duraciones, prioridades, llegadas):
+        """
+        Normaliza la entrada de crear_lote a columnas.
+        
+        Returns:
+            Tupla (pids, duraciones, prioridades, llegadas, errores de forma de
+            las filas); llegadas es None si ninguna fila ni columna la indica.
+        """
+        if filas is None:
+            if pids is None or duraciones is None or prioridades is None:
+                raise ValueError("Se requieren filas o las columnas pids, duraciones y prioridades")
+            return (list(pids), list(duraciones), list(prioridades),
+                    None if llegadas is None else list(llegadas), [])
+        if pids is not None or duraciones is not None or prioridades is not None or llegadas is not None:
+            raise ValueError("Use filas o columnas, no ambas")
+
+        filas = list(filas)
+        try:
+            campos = set(map(len, filas))
+            if campos <= {3} or campos == {4}:
+                # Camino rápido: todas las filas tienen los mismos campos
+                columnas = tuple(map(list, zip(*filas))) or ([], [], [])
+                return columnas[0], columnas[1], columnas[2], (columnas[3] if campos == {4} else None), []
+        except TypeError:
+            pass  # Alguna fila no es una secuencia; se informa abajo
+
+        errores: List[Tuple[int, str]] = []
+        columnas = ([], [], [], [])
+        for fila, valores in enumerate(filas):
+            if not isinstance(valores, (tuple, list)) or len(valores) not in (3, 4):
+                errores.append((fila, "La fila debe tener tres o cuatro campos "
+                                      "(pid, duracion, prioridad[, tiempo_llegada])"))
+                valores = (None, None, None, 0)
+            for columna, valor in zip(columnas, (*valores, 0)):
+                columna.append(valor)
+        return columnas[0], columnas[1], columnas[2], columnas[3], errores
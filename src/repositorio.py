@@ -1,14 +1,146 @@
 import json
 import csv
-from typing import List, Optional
+import hashlib
+import os
+import tempfile
+import uuid
+from contextlib import contextmanager
+from itertools import islice
+from typing import IO, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple
 from src.proceso import Proceso
 
+@contextmanager
+def escritura_atomica(archivo: str, modo: str = "w", **opciones) -> Iterator[IO]:
+    """
+    Escribe un archivo completo de forma atómica.
+    
+    Se escribe en un temporal del mismo directorio, se fuerza a disco y se
+    renombra sobre el destino: si el proceso se interrumpe a mitad, el
+    archivo anterior queda intacto.
+    
+    Args:
+        archivo: Ruta del archivo de destino.
+        modo: Modo de apertura ("w" o "wb").
+        **opciones: Argumentos adicionales de open (encoding, newline...).
+        
+    Yields:
+        El archivo temporal abierto.
+    """
+    directorio = os.path.dirname(os.path.abspath(archivo))
+    descriptor, temporal = tempfile.mkstemp(dir=directorio, suffix=".tmp")
+    try:
+        with os.fdopen(descriptor, modo, **opciones) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporal, archivo)
+    except BaseException:
+        os.remove(temporal)
+        raise
+
 class RepositorioProcesos:
-    """Clase que gestiona un conjunto de procesos activos con persistencia."""
+    """
+    Clase que gestiona un conjunto de procesos activos con persistencia.
+    
+    El repositorio es el dueño del espacio de PIDs: dentro de él cada PID es
+    único, pero repositorios distintos no interfieren entre sí.
+    """
 
     def __init__(self):
         """Inicializa un repositorio vacío."""
         self._procesos = {}  # Diccionario: pid -> Proceso
+        self._huella: Optional[int] = 0  # None = por calcular
+        self._huellas: Dict[str, int] = {}  # Huella de cada proceso mientras se conoce la total
+        self._secuencia = 0  # Posición del siguiente proceso en la huella
+        self._observadores: List[Callable[[int], None]] = []
+        # Cambios desde el último guardado incremental: pid -> "agregar",
+        # "modificar" o "eliminar" (None = hay que reescribirlo todo)
+        self._cambios: Optional[Dict[str, str]] = None
+        self._persistido_en: Optional[str] = None  # Archivo del último guardado incremental
+        self._generacion = ""  # Generación de la instantánea de ese archivo
+        self._registros_log = 0  # Registros de su log de cambios
+        self._tamano_log = 0  # Bytes escritos en su log de cambios
+
+    @staticmethod
+    def _huella_proceso(proceso: Proceso, secuencia: int) -> int:
+        """Huella estable de 64 bits de la definición de un proceso y su posición."""
+        datos = repr((proceso.pid, proceso.duracion, proceso.prioridad, proceso.tiempo_llegada, secuencia))
+        return int.from_bytes(hashlib.blake2b(datos.encode("utf-8"), digest_size=8).digest(), "little")
+
+    @property
+    def huella(self) -> int:
+        """
+        Huella del contenido del repositorio.
+        
+        Es la suma módulo 2^64 de las huellas de cada proceso (PID, duración,
+        prioridad, llegada y orden de inserción), así que agregar o eliminar
+        un proceso la actualiza en O(1). Tras una carga completa se recalcula
+        la primera vez que se pide. Dos repositorios con la misma huella
+        tienen los mismos procesos en el mismo orden.
+        """
+        if self._huella is None:
+            self._huellas = {
+                proceso.pid: self._huella_proceso(proceso, secuencia)
+                for secuencia, proceso in enumerate(self._procesos.values())
+            }
+            self._secuencia = len(self._procesos)
+            self._huella = sum(self._huellas.values()) % 2**64
+        return self._huella
+
+    def observar(self, observador: Callable[[int], None]) -> None:
+        """
+        Registra una función que se llama con la huella anterior cada vez
+        que cambia el contenido del repositorio.
+        
+        Args:
+            observador: Función que recibe la huella que deja de ser válida.
+        """
+        self._observadores.append(observador)
+
+    def _avisar(self) -> None:
+        """Avisa a los observadores de que la huella actual deja de ser válida."""
+        if self._huella is not None:
+            for observador in self._observadores:
+                observador(self._huella)
+
+    def _reiniciar_huella(self) -> None:
+        """Invalida la huella tras un cambio masivo; se recalculará al pedirla."""
+        self._avisar()
+        self._huella = None
+        self._huellas = {}
+
+    def _marcar(self, pid: str, operacion: str) -> None:
+        """
+        Anota un cambio para el próximo guardado incremental.
+        
+        Solo se anotan cambios si ya hay un guardado incremental y no está
+        pendiente una reescritura completa. Un proceso agregado pasa al final
+        de los cambios, como en el repositorio.
+        """
+        if self._persistido_en is None or self._cambios is None:
+            return
+        if operacion == "agregar":
+            self._cambios.pop(pid, None)
+        elif operacion == "modificar" and self._cambios.get(pid) == "agregar":
+            return  # Se guardará con su estado actual
+        self._cambios[pid] = operacion
+
+    def marcar_modificado(self, pid: str) -> None:
+        """
+        Indica que el estado de un proceso ha cambiado (p. ej. al planificarlo).
+        
+        Los procesos no avisan al repositorio cuando cambian sus tiempos, así
+        que el siguiente guardado incremental solo los incluye si se marcan.
+        
+        Args:
+            pid: Identificador del proceso.
+            
+        Raises:
+            ValueError: Si el PID no existe.
+        """
+        if pid not in self._procesos:
+            raise ValueError(f"El PID '{pid}' no existe en el repositorio")
+        self._marcar(pid, "modificar")
 
     def agregar(self, proceso: Proceso) -> None:
         """
@@ -22,9 +154,68 @@ class RepositorioProcesos:
         """
         if not isinstance(proceso, Proceso):
             raise ValueError("El argumento debe ser una instancia de Proceso")
+        self._registrar(proceso)
+
+    def _registrar(self, proceso: Proceso) -> None:
+        """
+        Registra un proceso ya validado comprobando que su PID sea único.
+        
+        Raises:
+            ValueError: Si el pid ya existe.
+        """
         if proceso.pid in self._procesos:
             raise ValueError(f"El PID '{proceso.pid}' ya existe en el repositorio")
         self._procesos[proceso.pid] = proceso
+        self._marcar(proceso.pid, "agregar")
+        if self._huella is not None:
+            self._avisar()
+            huella = self._huella_proceso(proceso, self._secuencia)
+            self._secuencia += 1
+            self._huellas[proceso.pid] = huella
+            self._huella = (self._huella + huella) % 2**64
+
+    def agregar_lote(self, filas: Optional[Iterable[Sequence]] = None, *,
+                     pids: Optional[Sequence[str]] = None,
+                     duraciones: Optional[Sequence[int]] = None,
+                     prioridades: Optional[Sequence[int]] = None,
+                     llegadas: Optional[Sequence[int]] = None) -> List[Proceso]:
+        """
+        Crea y agrega muchos procesos validando el lote completo una sola vez.
+        
+        Acepta las mismas formas de entrada que Proceso.crear_lote. Si alguna
+        fila es inválida o su PID ya existe en el repositorio, no se agrega
+        ningún proceso.
+        
+        Args:
+            filas: Iterable de filas (pid, duracion, prioridad[, tiempo_llegada]).
+            pids: Columna de identificadores.
+            duraciones: Columna de duraciones.
+            prioridades: Columna de prioridades.
+            llegadas: Columna opcional de tiempos de llegada.
+            
+        Returns:
+            Lista de procesos agregados.
+            
+        Raises:
+            ErrorLote: Si hay filas inválidas; incluye todas las filas erróneas.
+            ValueError: Si se mezclan filas y columnas o faltan columnas.
+        """
+        procesos = Proceso.crear_lote(filas, pids=pids, duraciones=duraciones, prioridades=prioridades,
+                                      llegadas=llegadas, pids_existentes=self._procesos.keys())
+        self._registrar_lote(procesos)
+        return procesos
+
+    def _registrar_lote(self, procesos: List[Proceso]) -> None:
+        """
+        Registra procesos ya validados cuyos PIDs son únicos y no existen aún.
+        
+        La huella se recalcula una sola vez para todo el lote.
+        """
+        self._procesos.update(zip([p.pid for p in procesos], procesos))
+        for proceso in procesos:
+            self._marcar(proceso.pid, "agregar")
+        if procesos:
+            self._reiniciar_huella()
 
     def listar(self) -> List[Proceso]:
         """
@@ -48,6 +239,10 @@ class RepositorioProcesos:
         if pid not in self._procesos:
             raise ValueError(f"El PID '{pid}' no existe en el repositorio")
         del self._procesos[pid]
+        self._marcar(pid, "eliminar")
+        if self._huella is not None:
+            self._avisar()
+            self._huella = (self._huella - self._huellas.pop(pid)) % 2**64
 
     def obtener(self, pid: str) -> Optional[Proceso]:
         """
@@ -61,6 +256,42 @@ class RepositorioProcesos:
         """
         return self._procesos.get(pid)
 
+    @staticmethod
+    def _a_diccionario(proceso: Proceso) -> dict:
+        """Estado de un proceso en la forma que usan los formatos JSON."""
+        return {
+            "pid": proceso.pid,
+            "duracion": proceso.duracion,
+            "prioridad": proceso.prioridad,
+            "tiempo_restante": proceso.tiempo_restante,
+            "tiempo_llegada": proceso.tiempo_llegada,
+            "tiempo_inicio": proceso.tiempo_inicio,
+            "tiempo_fin": proceso.tiempo_fin
+        }
+
+    @staticmethod
+    def _desde_diccionario(item: dict) -> Proceso:
+        """
+        Reconstruye un proceso guardado con _a_diccionario.
+        
+        Raises:
+            KeyError: Si falta algún campo.
+            ValueError: Si el elemento no es un diccionario o sus datos no son válidos.
+        """
+        if not isinstance(item, dict):
+            raise ValueError("Cada proceso debe ser un diccionario")
+        proceso = Proceso(
+            pid=item["pid"],
+            duracion=item["duracion"],
+            prioridad=item["prioridad"]
+        )
+        # Restaurar atributos adicionales
+        proceso._tiempo_restante = item["tiempo_restante"]
+        proceso._tiempo_llegada = item["tiempo_llegada"]
+        proceso._tiempo_inicio = item["tiempo_inicio"]
+        proceso._tiempo_fin = item["tiempo_fin"]
+        return proceso
+
     def guardar_json(self, archivo: str) -> None:
         """
         Guarda los procesos en un archivo JSON.
@@ -72,19 +303,8 @@ class RepositorioProcesos:
             IOError: Si no se puede escribir en el archivo.
         """
         try:
-            datos = [
-                {
-                    "pid": p.pid,
-                    "duracion": p.duracion,
-                    "prioridad": p.prioridad,
-                    "tiempo_restante": p.tiempo_restante,
-                    "tiempo_llegada": p.tiempo_llegada,
-                    "tiempo_inicio": p.tiempo_inicio,
-                    "tiempo_fin": p.tiempo_fin
-                }
-                for p in self._procesos.values()
-            ]
-            with open(archivo, 'w', encoding='utf-8') as f:
+            datos = [self._a_diccionario(p) for p in self._procesos.values()]
+            with escritura_atomica(archivo, 'w', encoding='utf-8') as f:
                 json.dump(datos, f, indent=4)
         except IOError as e:
             raise IOError(f"Error al guardar en JSON: {e}")
@@ -107,23 +327,12 @@ class RepositorioProcesos:
                 raise ValueError("El archivo JSON debe contener una lista de procesos")
                 
             # Limpiar procesos existentes
+            self._reiniciar_huella()
             self._procesos.clear()
-            Proceso._pids_usados.clear()
+            self._cambios = None
             
             for item in datos:
-                if not isinstance(item, dict):
-                    raise ValueError("Cada proceso debe ser un diccionario")
-                proceso = Proceso(
-                    pid=item["pid"],
-                    duracion=item["duracion"],
-                    prioridad=item["prioridad"]
-                )
-                # Restaurar atributos adicionales
-                proceso._tiempo_restante = item["tiempo_restante"]
-                proceso._tiempo_llegada = item["tiempo_llegada"]
-                proceso._tiempo_inicio = item["tiempo_inicio"]
-                proceso._tiempo_fin = item["tiempo_fin"]
-                self._procesos[proceso.pid] = proceso
+                self._registrar(self._desde_diccionario(item))
         except IOError as e:
             raise IOError(f"Error al cargar desde JSON: {e}")
         except KeyError as e:
@@ -131,6 +340,308 @@ class RepositorioProcesos:
         except ValueError as e:
             raise ValueError(f"Error en los datos del JSON: {e}")
 
+    @classmethod
+    def _lineas_jsonl(cls, procesos: Iterable[Proceso]) -> Iterator[str]:
+        """Genera una línea JSON por proceso, sin construir el documento completo."""
+        for proceso in procesos:
+            if not isinstance(proceso, Proceso):
+                raise ValueError("Cada elemento debe ser una instancia de Proceso")
+            yield json.dumps(cls._a_diccionario(proceso)) + "\n"
+
+    def guardar_jsonl(self, archivo: str) -> None:
+        """
+        Guarda los procesos en un archivo JSON Lines (un proceso por línea).
+        
+        Cada línea se serializa y escribe por separado, así que la memoria
+        extra no depende del número de procesos.
+        
+        Args:
+            archivo: Ruta del archivo.
+            
+        Raises:
+            IOError: Si no se puede escribir en el archivo.
+        """
+        try:
+            with escritura_atomica(archivo, 'w', encoding='utf-8') as f:
+                f.writelines(self._lineas_jsonl(self._procesos.values()))
+        except IOError as e:
+            raise IOError(f"Error al guardar en JSON Lines: {e}")
+
+    @classmethod
+    def anexar_jsonl(cls, archivo: str, procesos: Iterable[Proceso]) -> None:
+        """
+        Añade procesos al final de un archivo JSON Lines sin reescribirlo.
+        
+        Si el archivo no existe se crea. No comprueba que los PIDs no estén
+        ya en el archivo: un duplicado se detecta al cargarlo. Las líneas se
+        serializan antes de abrir el archivo, así que un elemento inválido no
+        deja líneas a medias.
+        
+        Args:
+            archivo: Ruta del archivo.
+            procesos: Procesos a añadir, en orden.
+            
+        Raises:
+            IOError: Si no se puede escribir en el archivo.
+            ValueError: Si algún elemento no es un Proceso; el archivo no cambia.
+        """
+        texto = "".join(cls._lineas_jsonl(procesos))
+        try:
+            with open(archivo, 'a', encoding='utf-8') as f:
+                f.write(texto)
+        except IOError as e:
+            raise IOError(f"Error al guardar en JSON Lines: {e}")
+
+    @classmethod
+    def _leer_jsonl(cls, f: TextIO, primera_linea: int = 1) -> Iterator[Tuple[int, Proceso]]:
+        """
+        Reconstruye los procesos de un archivo JSON Lines de uno en uno.
+        
+        Yields:
+            Pares (número de línea, proceso); las líneas en blanco se omiten.
+            
+        Raises:
+            ValueError: Si una línea no es válida; el mensaje indica cuál.
+        """
+        for numero, linea in enumerate(f, primera_linea):
+            if not linea.strip():
+                continue
+            try:
+                yield numero, cls._desde_diccionario(json.loads(linea))
+            except KeyError as e:
+                raise ValueError(f"línea {numero}: falta el campo {e}")
+            except ValueError as e:
+                raise ValueError(f"línea {numero}: {e}")
+
+    @classmethod
+    def leer_jsonl(cls, archivo: str, tamano_bloque: int = 10_000) -> Iterator[List[Proceso]]:
+        """
+        Lee un archivo JSON Lines por bloques sin cargarlo entero.
+        
+        Permite recorrer cargas mayores que la memoria disponible: solo se
+        mantiene vivo el bloque actual. No comprueba PIDs duplicados entre
+        bloques.
+        
+        Args:
+            archivo: Ruta del archivo.
+            tamano_bloque: Número máximo de procesos por bloque.
+            
+        Yields:
+            Listas de como mucho `tamano_bloque` procesos, en orden.
+            
+        Raises:
+            IOError: Si no se puede leer el archivo.
+            ValueError: Si el tamaño de bloque no es válido o una línea es incorrecta.
+        """
+        if not isinstance(tamano_bloque, int) or tamano_bloque <= 0:
+            raise ValueError("El tamaño de bloque debe ser un entero positivo")
+        try:
+            with open(archivo, 'r', encoding='utf-8') as f:
+                lineas = cls._leer_jsonl(f)
+                while True:
+                    bloque = [proceso for _, proceso in islice(lineas, tamano_bloque)]
+                    if not bloque:
+                        return
+                    yield bloque
+        except IOError as e:
+            raise IOError(f"Error al cargar desde JSON Lines: {e}")
+        except ValueError as e:
+            raise ValueError(f"Error en los datos del JSON Lines: {e}")
+
+    def cargar_jsonl(self, archivo: str, tamano_bloque: int = 10_000) -> None:
+        """
+        Carga procesos desde un archivo JSON Lines, reemplazando los existentes.
+        
+        El archivo se lee por bloques de `tamano_bloque` líneas, así que la
+        memoria extra no depende de su tamaño. Si alguna línea es inválida
+        o repite un PID, el repositorio queda como estaba.
+        
+        Args:
+            archivo: Ruta del archivo.
+            tamano_bloque: Número máximo de procesos leídos a la vez.
+            
+        Raises:
+            IOError: Si no se puede leer el archivo.
+            ValueError: Si el formato es inválido o los datos son incorrectos.
+        """
+        procesos: Dict[str, Proceso] = {}
+        for bloque in self.leer_jsonl(archivo, tamano_bloque):
+            for proceso in bloque:
+                if proceso.pid in procesos:
+                    raise ValueError(f"Error en los datos del JSON Lines: "
+                                     f"el PID '{proceso.pid}' está repetido")
+                procesos[proceso.pid] = proceso
+        self._reiniciar_huella()
+        self._procesos = procesos
+        self._cambios = None
+
+    @staticmethod
+    def _ruta_log(archivo: str) -> str:
+        """Archivo del log de cambios asociado a una instantánea."""
+        return archivo + ".log"
+
+    def guardar_incremental(self, archivo: str, max_registros: Optional[int] = None) -> None:
+        """
+        Guarda los procesos escribiendo solo lo que ha cambiado.
+        
+        El formato es una instantánea en JSON Lines (`archivo`) más un log
+        de cambios que solo crece (`archivo.log`). Si el repositorio se cargó
+        o guardó antes en este mismo archivo, se añaden al log los procesos
+        agregados, modificados (ver marcar_modificado) y eliminados desde
+        entonces. En otro caso, o cuando el log supera `max_registros`, se
+        compacta: se reescribe la instantánea y se vacía el log, ambos de
+        forma atómica. Las reescrituras completas con cargar_json,
+        cargar_csv o cargar_jsonl también obligan a compactar.
+        
+        Args:
+            archivo: Ruta de la instantánea.
+            max_registros: Registros del log a partir de los cuales se
+                compacta (por defecto, el número de procesos y al menos 1000).
+                
+        Raises:
+            IOError: Si no se puede escribir en los archivos.
+        """
+        log = self._ruta_log(archivo)
+        if max_registros is None:
+            max_registros = max(1000, len(self._procesos))
+        try:
+            if (self._cambios is None or self._persistido_en != archivo
+                    or self._registros_log + len(self._cambios) > max_registros
+                    or not os.path.exists(log) or os.path.getsize(log) != self._tamano_log):
+                self._compactar(archivo)
+            elif self._cambios:
+                with open(log, 'a', encoding='utf-8') as f:
+                    f.writelines(self._registros_cambios())
+                    f.flush()
+                    os.fsync(f.fileno())
+                self._registros_log += len(self._cambios)
+                self._tamano_log = os.path.getsize(log)
+                self._cambios = {}
+        except IOError as e:
+            raise IOError(f"Error al guardar de forma incremental: {e}")
+
+    def _registros_cambios(self) -> Iterator[str]:
+        """Genera una línea del log por cada cambio pendiente, en orden."""
+        for pid, operacion in self._cambios.items():
+            if operacion == "eliminar":
+                registro = {"op": operacion, "pid": pid}
+            else:
+                registro = {"op": operacion, "proceso": self._a_diccionario(self._procesos[pid])}
+            yield json.dumps(registro) + "\n"
+
+    def _compactar(self, archivo: str) -> None:
+        """
+        Reescribe la instantánea con todos los procesos y vacía el log.
+        
+        Cada generación de instantánea tiene un identificador que se repite en
+        la cabecera de su log; si el proceso se interrumpe entre las dos
+        escrituras, el log anterior no coincide y se ignora al cargar.
+        """
+        generacion = uuid.uuid4().hex
+        cabecera = json.dumps({"generacion": generacion}) + "\n"
+        with escritura_atomica(archivo, 'w', encoding='utf-8') as f:
+            f.write(cabecera)
+            f.writelines(self._lineas_jsonl(self._procesos.values()))
+        log = self._ruta_log(archivo)
+        with escritura_atomica(log, 'w', encoding='utf-8') as f:
+            f.write(cabecera)
+        self._persistido_en = archivo
+        self._generacion = generacion
+        self._registros_log = 0
+        self._tamano_log = os.path.getsize(log)
+        self._cambios = {}
+
+    def cargar_incremental(self, archivo: str) -> None:
+        """
+        Carga procesos guardados con guardar_incremental, reemplazando los existentes.
+        
+        Lee la instantánea y aplica después su log de cambios. Una última
+        línea del log sin terminar (una escritura interrumpida) se descarta.
+        Si algún dato es inválido, el repositorio queda como estaba.
+        
+        Args:
+            archivo: Ruta de la instantánea.
+            
+        Raises:
+            IOError: Si no se puede leer alguno de los archivos.
+            ValueError: Si el formato es inválido o los datos son incorrectos.
+        """
+        log = self._ruta_log(archivo)
+        procesos: Dict[str, Proceso] = {}
+        registros = 0
+        try:
+            with open(archivo, 'r', encoding='utf-8') as f:
+                generacion = self._generacion_de(f.readline())
+                for _, proceso in self._leer_jsonl(f, primera_linea=2):
+                    if proceso.pid in procesos:
+                        raise ValueError(f"el PID '{proceso.pid}' está repetido")
+                    procesos[proceso.pid] = proceso
+
+            tamano_log = -1  # Sin log utilizable: el siguiente guardado compacta
+            if os.path.exists(log):
+                with open(log, 'r', encoding='utf-8') as f:
+                    if self._generacion_de(f.readline()) == generacion:
+                        completo = True
+                        for numero, linea in enumerate(f, 2):
+                            if not linea.endswith("\n"):
+                                completo = False  # Escritura interrumpida
+                                break
+                            self._aplicar_cambio(procesos, linea, numero)
+                            registros += 1
+                        if completo:
+                            tamano_log = os.path.getsize(log)
+        except IOError as e:
+            raise IOError(f"Error al cargar de forma incremental: {e}")
+        except KeyError as e:
+            raise ValueError(f"Error en los datos guardados: falta el campo {e}")
+        except ValueError as e:
+            raise ValueError(f"Error en los datos guardados: {e}")
+
+        self._reiniciar_huella()
+        self._procesos = procesos
+        self._persistido_en = archivo
+        self._generacion = generacion
+        self._registros_log = registros
+        self._tamano_log = tamano_log
+        self._cambios = {}
+
+    @staticmethod
+    def _generacion_de(cabecera: str) -> str:
+        """
+        Extrae la generación de la cabecera de una instantánea o de un log.
+        
+        Raises:
+            ValueError: Si la cabecera no es válida.
+        """
+        try:
+            return json.loads(cabecera)["generacion"]
+        except (ValueError, KeyError, TypeError):
+            raise ValueError("línea 1: falta la cabecera del guardado incremental")
+
+    def _aplicar_cambio(self, procesos: Dict[str, Proceso], linea: str, numero: int) -> None:
+        """
+        Aplica un registro del log de cambios sobre los procesos cargados.
+        
+        Raises:
+            ValueError: Si el registro no es válido; el mensaje indica la línea.
+        """
+        try:
+            registro = json.loads(linea)
+            operacion = registro["op"]
+            if operacion == "eliminar":
+                procesos.pop(registro["pid"], None)
+            elif operacion in ("agregar", "modificar"):
+                proceso = self._desde_diccionario(registro["proceso"])
+                if operacion == "agregar":
+                    procesos.pop(proceso.pid, None)  # Un proceso agregado va al final
+                procesos[proceso.pid] = proceso
+            else:
+                raise ValueError(f"operación desconocida '{operacion}'")
+        except KeyError as e:
+            raise ValueError(f"línea {numero} del log: falta el campo {e}")
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"línea {numero} del log: {e}")
+
     def guardar_csv(self, archivo: str) -> None:
         """
         Guarda los procesos en un archivo CSV (separador: ;).
@@ -142,7 +653,7 @@ class RepositorioProcesos:
             IOError: Si no se puede escribir en el archivo.
         """
         try:
-            with open(archivo, 'w', encoding='utf-8', newline='') as f:
+            with escritura_atomica(archivo, 'w', encoding='utf-8', newline='') as f:
                 writer = csv.writer(f, delimiter=';')
                 # Escribir encabezado
                 writer.writerow([
@@ -179,8 +690,9 @@ class RepositorioProcesos:
                     raise ValueError("El CSV debe contener todas las columnas requeridas")
                 
                 # Limpiar procesos existentes
+                self._reiniciar_huella()
                 self._procesos.clear()
-                Proceso._pids_usados.clear()
+                self._cambios = None
                 
                 for row in reader:
                     # Convertir tipos
@@ -201,7 +713,7 @@ class RepositorioProcesos:
                     proceso._tiempo_llegada = tiempo_llegada
                     proceso._tiempo_inicio = tiempo_inicio
                     proceso._tiempo_fin = tiempo_fin
-                    self._procesos[proceso.pid] = proceso
+                    self._registrar(proceso)
         except IOError as e:
             raise IOError(f"Error al cargar desde CSV: {e}")
         except (ValueError, KeyError) as e:
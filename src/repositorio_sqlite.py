@@ -0,0 +1,209 @@
+import sqlite3
+from typing import Iterable, List, Optional, Sequence
+from src.proceso import Proceso
+from src.repositorio import RepositorioProcesos
+
+_CAMPOS = ("pid", "duracion", "prioridad", "tiempo_restante",
+           "tiempo_llegada", "tiempo_inicio", "tiempo_fin")
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS procesos (
+    pid TEXT PRIMARY KEY,
+    duracion INTEGER NOT NULL,
+    prioridad INTEGER NOT NULL,
+    tiempo_restante INTEGER NOT NULL,
+    tiempo_llegada INTEGER NOT NULL,
+    tiempo_inicio INTEGER,
+    tiempo_fin INTEGER
+);
+CREATE INDEX IF NOT EXISTS procesos_prioridad ON procesos (prioridad);
+"""
+
+_INSERTAR = (f"INSERT INTO procesos ({', '.join(_CAMPOS)}) "
+             f"VALUES ({', '.join(':' + campo for campo in _CAMPOS)})")
+
+class RepositorioSQLite(RepositorioProcesos):
+    """
+    Repositorio de procesos persistido en una base de datos SQLite.
+    
+    Mantiene la misma API que RepositorioProcesos y los mismos objetos
+    Proceso en memoria, pero cada alta o baja se escribe también en la base
+    de datos, así que el contenido sobrevive a un reinicio sin reescribir un
+    archivo completo. Usa una única conexión en modo WAL y las cargas
+    masivas se insertan con executemany en una sola transacción. El orden
+    de inserción se conserva mediante el rowid de la tabla.
+    
+    Los planificadores modifican los tiempos de los procesos en memoria;
+    sincronizar() los vuelca a la base de datos.
+    """
+
+    def __init__(self, archivo: str = ":memory:"):
+        """
+        Abre (o crea) la base de datos y carga sus procesos.
+        
+        Args:
+            archivo: Ruta de la base de datos (":memory:" = sin persistencia).
+            
+        Raises:
+            IOError: Si no se puede abrir la base de datos.
+            ValueError: Si la base de datos contiene procesos inválidos.
+        """
+        super().__init__()
+        self.archivo = archivo
+        try:
+            self._conexion = sqlite3.connect(archivo)
+            self._conexion.execute("PRAGMA journal_mode=WAL")
+            self._conexion.execute("PRAGMA synchronous=NORMAL")
+            self._conexion.executescript(_ESQUEMA)
+            filas = self._conexion.execute(f"SELECT {', '.join(_CAMPOS)} FROM procesos ORDER BY rowid")
+            for fila in filas:
+                self._registrar(self._desde_diccionario(dict(zip(_CAMPOS, fila))))
+        except sqlite3.Error as e:
+            raise IOError(f"Error al abrir la base de datos: {e}")
+
+    def __enter__(self) -> "RepositorioSQLite":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.cerrar()
+
+    def cerrar(self) -> None:
+        """Cierra la conexión; los cambios ya están guardados."""
+        self._conexion.close()
+
+    def _escribir(self, sentencias: Iterable[tuple]) -> None:
+        """
+        Ejecuta varias sentencias en una sola transacción.
+        
+        Args:
+            sentencias: Pares (sql, parámetros); si los parámetros son una
+                lista o un generador de filas se usa executemany.
+                
+        Raises:
+            IOError: Si la base de datos rechaza la escritura; se deshace entera.
+        """
+        try:
+            with self._conexion:
+                for sql, parametros in sentencias:
+                    if isinstance(parametros, (dict, tuple)):
+                        self._conexion.execute(sql, parametros)
+                    else:
+                        self._conexion.executemany(sql, parametros)
+        except sqlite3.Error as e:
+            raise IOError(f"Error al escribir en la base de datos: {e}")
+
+    def _filas(self, procesos: Iterable[Proceso]) -> Iterable[dict]:
+        """Parámetros de inserción de cada proceso, generados bajo demanda."""
+        return (self._a_diccionario(proceso) for proceso in procesos)
+
+    def agregar(self, proceso: Proceso) -> None:
+        """
+        Agrega un proceso al repositorio y a la base de datos.
+        
+        Args:
+            proceso: Instancia de Proceso a agregar.
+            
+        Raises:
+            ValueError: Si el proceso no es válido o el pid ya existe.
+            IOError: Si no se puede escribir en la base de datos.
+        """
+        if not isinstance(proceso, Proceso):
+            raise ValueError("El argumento debe ser una instancia de Proceso")
+        if proceso.pid in self._procesos:
+            raise ValueError(f"El PID '{proceso.pid}' ya existe en el repositorio")
+        self._escribir([(_INSERTAR, self._a_diccionario(proceso))])
+        self._registrar(proceso)
+
+    def agregar_lote(self, filas: Optional[Iterable[Sequence]] = None, *,
+                     pids: Optional[Sequence[str]] = None,
+                     duraciones: Optional[Sequence[int]] = None,
+                     prioridades: Optional[Sequence[int]] = None,
+                     llegadas: Optional[Sequence[int]] = None) -> List[Proceso]:
+        """
+        Crea y agrega muchos procesos con una única transacción.
+        
+        Igual que RepositorioProcesos.agregar_lote; si la escritura falla no
+        se agrega ningún proceso.
+        
+        Args:
+            filas: Iterable de filas (pid, duracion, prioridad[, tiempo_llegada]).
+            pids: Columna de identificadores.
+            duraciones: Columna de duraciones.
+            prioridades: Columna de prioridades.
+            llegadas: Columna opcional de tiempos de llegada.
+            
+        Returns:
+            Lista de procesos agregados.
+            
+        Raises:
+            ErrorLote: Si hay filas inválidas; incluye todas las filas erróneas.
+            ValueError: Si se mezclan filas y columnas o faltan columnas.
+            IOError: Si no se puede escribir en la base de datos.
+        """
+        procesos = Proceso.crear_lote(filas, pids=pids, duraciones=duraciones, prioridades=prioridades,
+                                      llegadas=llegadas, pids_existentes=self._procesos.keys())
+        self._escribir([(_INSERTAR, self._filas(procesos))])
+        self._registrar_lote(procesos)
+        return procesos
+
+    def eliminar(self, pid: str) -> None:
+        """
+        Elimina un proceso del repositorio y de la base de datos.
+        
+        Args:
+            pid: Identificador del proceso.
+            
+        Raises:
+            ValueError: Si el PID no existe.
+            IOError: Si no se puede escribir en la base de datos.
+        """
+        if pid not in self._procesos:
+            raise ValueError(f"El PID '{pid}' no existe en el repositorio")
+        self._escribir([("DELETE FROM procesos WHERE pid = ?", (pid,))])
+        super().eliminar(pid)
+
+    def sincronizar(self) -> None:
+        """
+        Guarda en la base de datos el estado actual de todos los procesos.
+        
+        Raises:
+            IOError: Si no se puede escribir en la base de datos.
+        """
+        self._escribir([
+            ("DELETE FROM procesos", ()),
+            (_INSERTAR, self._filas(self._procesos.values()))
+        ])
+
+    def listar_por_prioridad(self, prioridad: int) -> List[Proceso]:
+        """
+        Devuelve los procesos con una prioridad dada usando el índice.
+        
+        Args:
+            prioridad: Prioridad buscada.
+            
+        Returns:
+            Procesos con esa prioridad, en orden de inserción.
+        """
+        filas = self._conexion.execute(
+            "SELECT pid FROM procesos WHERE prioridad = ? ORDER BY rowid", (prioridad,))
+        return [self._procesos[pid] for pid, in filas]
+
+    def cargar_json(self, archivo: str) -> None:
+        """Carga procesos desde JSON y reemplaza también los de la base de datos."""
+        super().cargar_json(archivo)
+        self.sincronizar()
+
+    def cargar_jsonl(self, archivo: str, tamano_bloque: int = 10_000) -> None:
+        """Carga procesos desde JSON Lines y reemplaza también los de la base de datos."""
+        super().cargar_jsonl(archivo, tamano_bloque)
+        self.sincronizar()
+
+    def cargar_csv(self, archivo: str) -> None:
+        """Carga procesos desde CSV y reemplaza también los de la base de datos."""
+        super().cargar_csv(archivo)
+        self.sincronizar()
+
+    def cargar_incremental(self, archivo: str) -> None:
+        """Carga un guardado incremental y reemplaza también los procesos de la base de datos."""
+        super().cargar_incremental(archivo)
+        self.sincronizar()
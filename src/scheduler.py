@@ -1,61 +1,420 @@
 from abc import ABC, abstractmethod
-from typing import List, Tuple
+from itertools import chain
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+import numpy as np
 from src.proceso import Proceso
+from src.gantt import GanttEntry, GanttBuffer, GanttComprimido, SegmentoRR, _VistaColumna
+from src.tabla import TablaProcesos, SIN_TIEMPO
+from src.simulacion import (Politica, PoliticaCFS, PoliticaLoteria, PoliticaMLFQ,
+                            PoliticaPrioridad, PoliticaRoundRobin, PoliticaStride,
+                            PoliticaTrabajoMasCorto, SimuladorEventos)
 
-# Definición de GanttEntry como una tupla
-GanttEntry = Tuple[str, int, int]  # (pid, tiempo_inicio, tiempo_fin)
+# Carga de trabajo aceptada por los planificadores
+CargaTrabajo = Union[List[Proceso], TablaProcesos]
+
+def _validar_carga(procesos: CargaTrabajo, solo_lectura: bool = False) -> None:
+    """
+    Comprueba que la carga de trabajo sea una tabla o una lista de Proceso no vacías.
+    
+    Args:
+        procesos: Carga de trabajo a comprobar.
+        solo_lectura: True si la carga no se va a modificar, en cuyo caso
+            puede estar ya planificada.
+            
+    Raises:
+        ValueError: Si la carga de trabajo es inválida.
+    """
+    if isinstance(procesos, TablaProcesos):
+        if len(procesos) == 0:
+            raise ValueError("Se requiere una tabla de procesos no vacía")
+        if not solo_lectura and (procesos.tiempo_fin != SIN_TIEMPO).any():
+            raise ValueError("El tiempo de finalización ya está establecido")
+    elif not procesos or not all(isinstance(p, Proceso) for p in procesos):
+        raise ValueError("Se requiere una lista no vacía de instancias de Proceso")
+
+def _columnas_carga(procesos: CargaTrabajo) -> Tuple[List[str], List[int], List[int], List[int]]:
+    """
+    Extrae la definición de la carga por columnas, sin su estado de ejecución.
+    
+    Returns:
+        Tupla (pids, duraciones, llegadas, prioridades) en el orden de la carga.
+    """
+    if isinstance(procesos, TablaProcesos):
+        return (procesos.pids, procesos.duracion.tolist(), procesos.tiempo_llegada.tolist(),
+                procesos.prioridad.tolist())
+    return ([p.pid for p in procesos], [p.duracion for p in procesos],
+            [p.tiempo_llegada for p in procesos], [p.prioridad for p in procesos])
+
+def _gantt_secuencial(pids: Sequence[str], inicios: np.ndarray, fines: np.ndarray,
+                      orden: Optional[np.ndarray] = None) -> GanttComprimido:
+    """
+    Diagrama de procesos que se ejecutan enteros uno tras otro.
+    
+    Los segmentos leen sus pids y duraciones de las columnas bajo demanda,
+    así que construir el diagrama no crea objetos por proceso.
+    
+    Args:
+        pids: Identificadores de los procesos.
+        inicios: Instante de inicio de cada proceso, en orden de ejecución.
+        fines: Instante de fin de cada proceso, en orden de ejecución.
+        orden: Índice en `pids` del proceso que se ejecuta en cada posición
+            (por defecto, `pids` ya está en orden de ejecución).
+            
+    Returns:
+        Diagrama con un segmento por cada tramo continuo de CPU ocupada.
+    """
+    cortes = np.concatenate(([0], np.flatnonzero(inicios[1:] != fines[:-1]) + 1))
+    duraciones = fines - inicios
+    quanta = np.maximum.reduceat(duraciones, cortes).tolist()
+    inicios = inicios[cortes].tolist()
+    cortes = cortes.tolist()
+    return GanttComprimido([
+        SegmentoRR(inicio, quantum, 0, _VistaColumna(pids, orden, a, b), _VistaColumna(duraciones, None, a, b))
+        for inicio, quantum, a, b in zip(inicios, quanta, cortes, cortes[1:] + [len(duraciones)])
+    ])
+
+class ResultadoPlanificacion:
+    """
+    Planificación de una carga de trabajo, separada de sus procesos.
+    
+    Guarda el diagrama de Gantt y los tiempos de inicio y fin de cada
+    proceso como arrays en el orden de la carga. Los procesos no se
+    modifican, así que la misma carga puede planificarse varias veces o
+    desde varios hilos a la vez; `aplicar` escribe los tiempos en ellos
+    como haría `planificar`.
+    """
+
+    __slots__ = ("gantt", "pids", "tiempo_inicio", "tiempo_fin")
+
+    def __init__(self, gantt: Union[GanttComprimido, List[GanttEntry]], pids: Sequence[str],
+                 tiempo_inicio: Sequence[int], tiempo_fin: Sequence[int]):
+        """
+        Inicializa el resultado.
+        
+        Args:
+            gantt: Diagrama de Gantt, comprimido o como lista de entradas.
+            pids: Identificadores de los procesos, en el orden de la carga.
+            tiempo_inicio: Instante en que cada proceso empezó a ejecutarse.
+            tiempo_fin: Instante en que terminó cada proceso.
+        """
+        self.gantt = gantt
+        self.pids = pids
+        self.tiempo_inicio = np.asarray(tiempo_inicio, dtype=np.int64)
+        self.tiempo_fin = np.asarray(tiempo_fin, dtype=np.int64)
+
+    def __len__(self) -> int:
+        """Número de procesos planificados."""
+        return len(self.pids)
+
+    @property
+    def tiempo_total(self) -> int:
+        """Instante en que termina el último proceso."""
+        return int(self.tiempo_fin.max())
+
+    def tiempos_por_proceso(self) -> Dict[str, Tuple[int, int]]:
+        """
+        Devuelve los tiempos de inicio y fin de cada proceso.
+        
+        Returns:
+            Diccionario pid -> (tiempo_inicio, tiempo_fin).
+        """
+        return dict(zip(self.pids, zip(self.tiempo_inicio.tolist(), self.tiempo_fin.tolist())))
+
+    def aplicar(self, procesos: CargaTrabajo) -> None:
+        """
+        Escribe los tiempos en la carga de trabajo planificada.
+        
+        Los procesos que ya tenían tiempo de inicio lo conservan; el tiempo
+        restante pasa a 0.
+        
+        Args:
+            procesos: La misma carga de trabajo, sin planificar.
+            
+        Raises:
+            ValueError: Si la carga no corresponde al resultado o ya tiene
+                tiempo de fin.
+        """
+        _validar_carga(procesos)
+        if len(procesos) != len(self.pids):
+            raise ValueError("El resultado no corresponde a la carga de trabajo")
+        if isinstance(procesos, TablaProcesos):
+            sin_inicio = procesos.tiempo_inicio == SIN_TIEMPO
+            procesos.tiempo_inicio[sin_inicio] = self.tiempo_inicio[sin_inicio]
+            procesos.tiempo_fin[:] = self.tiempo_fin
+            procesos.tiempo_restante[:] = 0
+            return
+
+        for proceso, inicio, fin in zip(procesos, self.tiempo_inicio.tolist(), self.tiempo_fin.tolist()):
+            if proceso.tiempo_inicio is None:
+                proceso.establecer_tiempo_inicio(inicio)
+            proceso.reducir_tiempo_restante(proceso.tiempo_restante)
+            proceso.establecer_tiempo_fin(fin)
 
 class Scheduler(ABC):
     """Clase abstracta que define la interfaz de un planificador."""
     
     @abstractmethod
-    def planificar(self, procesos: List[Proceso]) -> List[GanttEntry]:
+    def planificar_iter(self, procesos: CargaTrabajo) -> Iterator[GanttEntry]:
+        """
+        Planifica los procesos y genera el diagrama de Gantt entrada a entrada.
+        
+        La carga se valida al llamar al método; las entradas se producen a
+        medida que se consumen, sin construir la lista completa.
+        
+        Args:
+            procesos: Lista de procesos o TablaProcesos a planificar.
+            
+        Returns:
+            Iterador de entradas GanttEntry (pid, tiempo_inicio, tiempo_fin).
+        """
+        pass
+
+    @abstractmethod
+    def planificar_resultado(self, procesos: CargaTrabajo) -> ResultadoPlanificacion:
+        """
+        Planifica los procesos sin modificarlos.
+        
+        La carga se trata como de solo lectura: se planifica desde su
+        definición (duración, prioridad y llegada), aunque ya se hubiera
+        planificado antes.
+        
+        Args:
+            procesos: Lista de procesos o TablaProcesos a planificar.
+            
+        Returns:
+            ResultadoPlanificacion con el diagrama y los tiempos de cada proceso.
+        """
+        pass
+
+    def clave_configuracion(self) -> Optional[Tuple]:
+        """
+        Identifica el tipo y los parámetros del planificador.
+        
+        Returns:
+            Tupla hashable: dos planificadores con la misma clave planifican
+            igual la misma carga. None si la planificación no es reproducible.
+        """
+        return (type(self).__name__, tuple(sorted(vars(self).items())))
+
+    def planificar(self, procesos: CargaTrabajo) -> List[GanttEntry]:
         """
         Planifica los procesos y devuelve un diagrama de Gantt.
         
         Args:
-            procesos: Lista de procesos a planificar.
+            procesos: Lista de procesos o TablaProcesos a planificar.
             
         Returns:
             Lista de entradas GanttEntry (pid, tiempo_inicio, tiempo_fin).
         """
-        pass
+        return list(self.planificar_iter(procesos))
+
+    def planificar_buffer(self, procesos: CargaTrabajo, buffer: Optional[GanttBuffer] = None) -> GanttBuffer:
+        """
+        Planifica los procesos volcando el diagrama en un GanttBuffer compacto.
+        
+        Args:
+            procesos: Lista de procesos o TablaProcesos a planificar.
+            buffer: Buffer de destino (por defecto uno nuevo sin límite de memoria).
+            
+        Returns:
+            El GanttBuffer con las entradas añadidas.
+        """
+        iterador = self.planificar_iter(procesos)
+        if buffer is None:
+            buffer = GanttBuffer()
+        buffer.extender(iterador)
+        return buffer
+
+    def _simular(self, procesos: CargaTrabajo, politica: Politica) -> Iterator[SegmentoRR]:
+        """
+        Ejecuta la carga en el SimuladorEventos y aplica los tiempos resultantes.
+        
+        Los procesos reciben su tiempo de inicio y de fin a medida que la
+        simulación avanza; una tabla se actualiza al agotar el iterador.
+        
+        Args:
+            procesos: Lista de procesos o TablaProcesos ya validada.
+            politica: Política de despacho a simular.
+            
+        Returns:
+            Iterador de tramos SegmentoRR.
+        """
+        simulador = SimuladorEventos(politica)
+        if isinstance(procesos, TablaProcesos):
+            tramos = simulador.simular(procesos.pids, procesos.duracion.tolist(),
+                                       procesos.tiempo_llegada.tolist(), procesos.prioridad.tolist(),
+                                       procesos.tiempo_restante.tolist())
+            return self._volcar_tabla(procesos, simulador, tramos)
+
+        def al_iniciar(indice: int, tiempo: int) -> None:
+            if procesos[indice].tiempo_inicio is None:
+                procesos[indice].establecer_tiempo_inicio(tiempo)
+
+        def al_terminar(indice: int, tiempo: int) -> None:
+            proceso = procesos[indice]
+            proceso.reducir_tiempo_restante(proceso.tiempo_restante)
+            proceso.establecer_tiempo_fin(tiempo)
+
+        return simulador.simular([p.pid for p in procesos], [p.duracion for p in procesos],
+                                 [p.tiempo_llegada for p in procesos], [p.prioridad for p in procesos],
+                                 [p.tiempo_restante for p in procesos], al_iniciar, al_terminar)
+
+    @staticmethod
+    def _entradas(tramos: Iterator[SegmentoRR]) -> Iterator[GanttEntry]:
+        """Expande perezosamente los tramos de una simulación en entradas GanttEntry."""
+        return chain.from_iterable(tramo.entradas() for tramo in tramos)
+
+    @staticmethod
+    def _resultado(procesos: CargaTrabajo, politica: Politica) -> ResultadoPlanificacion:
+        """
+        Ejecuta la carga en el SimuladorEventos sin modificarla.
+        
+        Args:
+            procesos: Lista de procesos o TablaProcesos ya validada.
+            politica: Política de despacho a simular.
+            
+        Returns:
+            ResultadoPlanificacion con el diagrama comprimido.
+        """
+        pids, duraciones, llegadas, prioridades = _columnas_carga(procesos)
+        simulador = SimuladorEventos(politica)
+        gantt = GanttComprimido.desde_tramos(simulador.simular(pids, duraciones, llegadas, prioridades))
+        return ResultadoPlanificacion(gantt, pids, simulador.inicios, simulador.fines)
+
+    @staticmethod
+    def _volcar_tabla(tabla: TablaProcesos, simulador: SimuladorEventos,
+                      tramos: Iterator[SegmentoRR]) -> Iterator[SegmentoRR]:
+        """Reenvía los tramos y, al terminar, escribe los tiempos en la tabla."""
+        yield from tramos
+        inicios = np.array([SIN_TIEMPO if t is None else t for t in simulador.inicios], dtype=np.int64)
+        sin_inicio = tabla.tiempo_inicio == SIN_TIEMPO
+        tabla.tiempo_inicio[sin_inicio] = inicios[sin_inicio]
+        tabla.tiempo_fin[:] = simulador.fines
+        tabla.tiempo_restante[:] = 0
 
 class FCFSScheduler(Scheduler):
     """Planificador First-Come, First-Served (FCFS)."""
     
-    def planificar(self, procesos: List[Proceso]) -> List[GanttEntry]:
+    def planificar_iter(self, procesos: CargaTrabajo) -> Iterator[GanttEntry]:
         """
         Planifica procesos en orden de llegada.
         
         Args:
-            procesos: Lista de procesos a planificar.
+            procesos: Lista de procesos o TablaProcesos a planificar.
+            
+        Returns:
+            Iterador de entradas GanttEntry.
+            
+        Raises:
+            ValueError: Si la lista de procesos es inválida.
+        """
+        _validar_carga(procesos)
+        if isinstance(procesos, TablaProcesos):
+            return iter(self.planificar_comprimido(procesos))
+        return self._despachar(procesos)
+
+    def planificar_comprimido(self, procesos: CargaTrabajo) -> GanttComprimido:
+        """
+        Planifica procesos en orden de llegada y devuelve el diagrama comprimido.
+        
+        Cada tramo sin huecos de CPU inactiva es una única vuelta de cierre en
+        la que cada proceso se ejecuta entero. El cálculo es vectorizado
+        tanto para una TablaProcesos como para una lista de procesos.
+        
+        Args:
+            procesos: Lista de procesos o TablaProcesos a planificar.
             
         Returns:
-            Lista de entradas GanttEntry.
+            Diagrama GanttComprimido.
             
         Raises:
             ValueError: Si la lista de procesos es inválida.
         """
-        if not procesos or not all(isinstance(p, Proceso) for p in procesos):
-            raise ValueError("Se requiere una lista no vacía de instancias de Proceso")
+        _validar_carga(procesos)
+        if not isinstance(procesos, TablaProcesos):
+            resultado = self._vectorizado(*self._columnas_lista(procesos))
+            resultado.aplicar(procesos)
+            return resultado.gantt
+
+        tabla = procesos
+        if (tabla.tiempo_inicio != SIN_TIEMPO).any():
+            raise ValueError("El tiempo de inicio ya está establecido")
+        resultado = self._vectorizado(tabla.pids, tabla.tiempo_llegada, tabla.tiempo_restante)
+        resultado.aplicar(tabla)
+        return resultado.gantt
 
-        gantt: List[GanttEntry] = []
-        tiempo_actual = 0
+    def planificar_resultado(self, procesos: CargaTrabajo) -> ResultadoPlanificacion:
+        """
+        Planifica procesos en orden de llegada sin modificarlos.
+        
+        Args:
+            procesos: Lista de procesos o TablaProcesos a planificar.
+            
+        Returns:
+            ResultadoPlanificacion con el diagrama comprimido.
+            
+        Raises:
+            ValueError: Si la lista de procesos es inválida.
+        """
+        _validar_carga(procesos, solo_lectura=True)
+        if isinstance(procesos, TablaProcesos):
+            return self._vectorizado(procesos.pids, procesos.tiempo_llegada, procesos.duracion)
+        pids, llegadas, _ = self._columnas_lista(procesos)
+        return self._vectorizado(pids, llegadas, np.array([p.duracion for p in procesos], dtype=np.int64))
 
-        for proceso in procesos:
-            # Establecer tiempo de inicio
-            proceso.establecer_tiempo_inicio(tiempo_actual)
-            # El proceso se ejecuta completamente
-            tiempo_actual += proceso.duracion
-            # Establecer tiempo de fin
-            proceso.establecer_tiempo_fin(tiempo_actual)
-            # Reducir tiempo restante a 0
+    def _despachar(self, procesos: List[Proceso]) -> Iterator[GanttEntry]:
+        """Aplica los tiempos de cada proceso a medida que se produce su entrada."""
+        pids, llegadas, restantes = self._columnas_lista(procesos)
+        orden, inicios, fines = self._tiempos(llegadas, restantes)
+        indices = range(len(pids)) if orden is None else orden.tolist()
+        for indice, inicio, fin in zip(indices, inicios.tolist(), fines.tolist()):
+            proceso = procesos[indice]
+            if proceso.tiempo_inicio is None:
+                proceso.establecer_tiempo_inicio(inicio)
             proceso.reducir_tiempo_restante(proceso.tiempo_restante)
-            # Agregar entrada al diagrama de Gantt
-            gantt.append((proceso.pid, proceso.tiempo_inicio, proceso.tiempo_fin))
+            proceso.establecer_tiempo_fin(fin)
+            yield (pids[indice], inicio, fin)
 
-        return gantt
+    @staticmethod
+    def _columnas_lista(procesos: List[Proceso]) -> Tuple[List[str], np.ndarray, np.ndarray]:
+        """Columnas (pids, llegadas, restantes) de una lista de procesos."""
+        return ([p.pid for p in procesos],
+                np.array([p.tiempo_llegada for p in procesos], dtype=np.int64),
+                np.array([p.tiempo_restante for p in procesos], dtype=np.int64))
+
+    @staticmethod
+    def _tiempos(llegadas: np.ndarray, duraciones: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Orden de ejecución FCFS y tiempos de inicio y fin en ese orden.
+        
+        Ordenados por llegada, fin[i] = max(fin[i-1], llegada[i]) + duracion[i],
+        que se resuelve con una suma acumulada y un máximo acumulado. Si las
+        llegadas ya están ordenadas no se reordena nada y el orden es None.
+        """
+        orden = None
+        if (llegadas[1:] < llegadas[:-1]).any():
+            orden = np.argsort(llegadas, kind="stable")
+            llegadas, duraciones = llegadas[orden], duraciones[orden]
+        acumuladas = np.cumsum(duraciones)
+        # fin[i] - acumuladas[i] es el tiempo inactivo acumulado hasta i
+        fines = np.subtract(llegadas, acumuladas)
+        fines += duraciones
+        np.maximum.accumulate(fines, out=fines)
+        fines += acumuladas
+        return orden, fines - duraciones, fines
+
+    @classmethod
+    def _vectorizado(cls, pids: List[str], llegadas: np.ndarray, duraciones: np.ndarray) -> ResultadoPlanificacion:
+        """FCFS sobre columnas con aritmética de arrays; no modifica las columnas."""
+        orden, inicios, fines = cls._tiempos(llegadas, duraciones)
+        tiempo_inicio, tiempo_fin = inicios, fines
+        if orden is not None:
+            tiempo_inicio = np.empty_like(inicios)
+            tiempo_fin = np.empty_like(fines)
+            tiempo_inicio[orden] = inicios
+            tiempo_fin[orden] = fines
+        gantt = _gantt_secuencial(pids, inicios, fines, orden)
+        return ResultadoPlanificacion(gantt, pids, tiempo_inicio, tiempo_fin)
 
 class RoundRobinScheduler(Scheduler):
     """Planificador Round-Robin con quantum configurable."""
@@ -74,45 +433,297 @@ class RoundRobinScheduler(Scheduler):
             raise ValueError("El quantum debe ser un entero positivo")
         self.quantum = quantum
 
-    def planificar(self, procesos: List[Proceso]) -> List[GanttEntry]:
+    def planificar_iter(self, procesos: CargaTrabajo) -> Iterator[GanttEntry]:
         """
         Planifica procesos usando Round-Robin.
         
+        Las entradas se producen a medida que avanza la simulación; las
+        vueltas completas se expanden desde su segmento sin pasar por la
+        cola de eventos.
+        
         Args:
-            procesos: Lista de procesos a planificar.
+            procesos: Lista de procesos o TablaProcesos a planificar.
             
         Returns:
-            Lista de entradas GanttEntry.
+            Iterador de entradas GanttEntry.
             
         Raises:
             ValueError: Si la lista de procesos es inválida.
         """
-        if not procesos or not all(isinstance(p, Proceso) for p in procesos):
-            raise ValueError("Se requiere una lista no vacía de instancias de Proceso")
+        _validar_carga(procesos)
+        return self._entradas(self._simular(procesos, PoliticaRoundRobin(self.quantum)))
 
-        gantt: List[GanttEntry] = []
-        tiempo_actual = 0
-        cola = procesos.copy()  # Copia de la lista para no modificar la original
-        procesos_pendientes = len(cola)
+    def planificar_comprimido(self, procesos: CargaTrabajo) -> GanttComprimido:
+        """
+        Planifica procesos usando Round-Robin y devuelve el diagrama comprimido.
+        
+        Mientras todos los procesos de la cola tengan más de k quanta
+        pendientes y no llegue ningún otro, se avanzan k vueltas completas de
+        una sola vez; después se da una vuelta de cierre en la que termina al
+        menos uno. Cada tramo se guarda como un SegmentoRR, así que sin
+        llegadas intermedias el tamaño del diagrama no depende de la
+        duración de los procesos.
+        
+        Args:
+            procesos: Lista de procesos o TablaProcesos a planificar.
+            
+        Returns:
+            Diagrama GanttComprimido.
+            
+        Raises:
+            ValueError: Si la lista de procesos es inválida.
+        """
+        _validar_carga(procesos)
+        return GanttComprimido.desde_tramos(self._simular(procesos, PoliticaRoundRobin(self.quantum)))
 
-        while procesos_pendientes > 0:
-            proceso = cola.pop(0)  # Tomar el primer proceso de la cola
-            if proceso.tiempo_inicio is None:
-                proceso.establecer_tiempo_inicio(tiempo_actual)
-
-            # Determinar cuánto tiempo ejecutar
-            tiempo_ejecucion = min(self.quantum, proceso.tiempo_restante)
-            tiempo_inicio = tiempo_actual
-            tiempo_actual += tiempo_ejecucion
-            proceso.reducir_tiempo_restante(tiempo_ejecucion)
-
-            # Agregar entrada al diagrama de Gantt
-            gantt.append((proceso.pid, tiempo_inicio, tiempo_actual))
-
-            if proceso.tiempo_restante > 0:
-                # El proceso no ha terminado, vuelve a la cola
-                cola.append(proceso)
-            else:
-                # El proceso ha terminado, establecer tiempo de fin
-                proceso.establecer_tiempo_fin(tiempo_actual)
-                procesos
\ No newline at end of file
+    def planificar_resultado(self, procesos: CargaTrabajo) -> ResultadoPlanificacion:
+        """
+        Planifica procesos usando Round-Robin sin modificarlos.
+        
+        Args:
+            procesos: Lista de procesos o TablaProcesos a planificar.
+            
+        Returns:
+            ResultadoPlanificacion con el diagrama comprimido.
+            
+        Raises:
+            ValueError: Si la lista de procesos es inválida.
+        """
+        _validar_carga(procesos, solo_lectura=True)
+        return self._resultado(procesos, PoliticaRoundRobin(self.quantum))
+
+class SchedulerPorEventos(Scheduler):
+    """
+    Planificador que delega el despacho en una Politica del SimuladorEventos.
+    
+    Las subclases solo indican qué política usar con `_politica`.
+    """
+
+    @abstractmethod
+    def _politica(self) -> Politica:
+        """Política de despacho equivalente a este planificador."""
+        pass
+
+    def planificar_iter(self, procesos: CargaTrabajo) -> Iterator[GanttEntry]:
+        """
+        Planifica los procesos simulando la política del planificador.
+        
+        Args:
+            procesos: Lista de procesos o TablaProcesos a planificar.
+            
+        Returns:
+            Iterador de entradas GanttEntry.
+            
+        Raises:
+            ValueError: Si la lista de procesos es inválida.
+        """
+        _validar_carga(procesos)
+        return self._entradas(self._simular(procesos, self._politica()))
+
+    def planificar_comprimido(self, procesos: CargaTrabajo) -> GanttComprimido:
+        """
+        Planifica los procesos y devuelve el diagrama comprimido.
+        
+        Args:
+            procesos: Lista de procesos o TablaProcesos a planificar.
+            
+        Returns:
+            Diagrama GanttComprimido.
+            
+        Raises:
+            ValueError: Si la lista de procesos es inválida.
+        """
+        _validar_carga(procesos)
+        return GanttComprimido.desde_tramos(self._simular(procesos, self._politica()))
+
+    def planificar_resultado(self, procesos: CargaTrabajo) -> ResultadoPlanificacion:
+        """
+        Planifica los procesos sin modificarlos.
+        
+        Args:
+            procesos: Lista de procesos o TablaProcesos a planificar.
+            
+        Returns:
+            ResultadoPlanificacion con el diagrama comprimido.
+            
+        Raises:
+            ValueError: Si la lista de procesos es inválida.
+        """
+        _validar_carga(procesos, solo_lectura=True)
+        return self._resultado(procesos, self._politica())
+
+class PrioridadScheduler(SchedulerPorEventos):
+    """
+    Planificador por prioridad no expropiativo (menor valor = mayor prioridad).
+    
+    A igual prioridad se atiende antes al que entró antes en la cola.
+    """
+    
+    expropiativo = False
+    
+    def __init__(self, envejecimiento: Optional[int] = None):
+        """
+        Inicializa el planificador.
+        
+        Args:
+            envejecimiento: Unidades de espera tras las que un proceso gana un
+                nivel de prioridad (None = sin envejecimiento).
+                
+        Raises:
+            ValueError: Si el envejecimiento no es un entero positivo.
+        """
+        if envejecimiento is not None and (not isinstance(envejecimiento, int) or envejecimiento <= 0):
+            raise ValueError("El envejecimiento debe ser un entero positivo")
+        self.envejecimiento = envejecimiento
+
+    def _politica(self) -> PoliticaPrioridad:
+        return PoliticaPrioridad(self.expropiativo, self.envejecimiento)
+
+class PrioridadExpropiativaScheduler(PrioridadScheduler):
+    """
+    Planificador por prioridad expropiativo.
+    
+    Cuando llega un proceso más prioritario que el que está en CPU, este
+    vuelve a la cola con el tiempo que le quede.
+    """
+
+    expropiativo = True
+
+class SJFScheduler(SchedulerPorEventos):
+    """
+    Planificador Shortest Job First (SJF) no expropiativo.
+    
+    Entre los procesos listos se ejecuta entero el de menor tiempo
+    restante; a igualdad, el que entró antes en la cola.
+    """
+
+    def _politica(self) -> PoliticaTrabajoMasCorto:
+        return PoliticaTrabajoMasCorto(expropiativa=False)
+
+class SRTFScheduler(SchedulerPorEventos):
+    """
+    Planificador Shortest Remaining Time First (SRTF).
+    
+    Variante expropiativa de SJF: una llegada expulsa al proceso en CPU
+    solo si su tiempo restante es estrictamente menor que lo que le queda
+    a este.
+    """
+
+    def _politica(self) -> PoliticaTrabajoMasCorto:
+        return PoliticaTrabajoMasCorto(expropiativa=True)
+
+class MLFQScheduler(SchedulerPorEventos):
+    """
+    Planificador de colas multinivel con retroalimentación (MLFQ).
+    
+    Los procesos empiezan en el nivel más prioritario y bajan un nivel cada
+    vez que agotan su quantum. Una llegada a un nivel superior expulsa al
+    proceso en CPU, y el boost periódico devuelve todos los procesos al
+    nivel 0 para evitar la inanición.
+    """
+
+    def __init__(self, quanta: Sequence[int] = (2, 4, 8), intervalo_boost: Optional[int] = None):
+        """
+        Inicializa el planificador.
+        
+        Args:
+            quanta: Quantum de cada nivel, del más prioritario al menos; su
+                longitud es el número de niveles.
+            intervalo_boost: Cada cuántas unidades de tiempo vuelven todos
+                los procesos al nivel 0 (None = sin boost).
+                
+        Raises:
+            ValueError: Si los quanta o el intervalo no son enteros positivos.
+        """
+        # Validar ahora y no al planificar
+        PoliticaMLFQ(quanta, intervalo_boost)
+        self.quanta = tuple(quanta)
+        self.intervalo_boost = intervalo_boost
+
+    def _politica(self) -> PoliticaMLFQ:
+        return PoliticaMLFQ(self.quanta, self.intervalo_boost)
+
+class CFSScheduler(SchedulerPorEventos):
+    """
+    Planificador completamente justo (CFS).
+    
+    Ejecuta siempre el proceso con menor tiempo virtual de ejecución; la
+    prioridad fija el peso con el que se reparte la CPU (menor valor =
+    más peso).
+    """
+
+    def __init__(self, latencia_objetivo: int = 20, granularidad_minima: int = 4):
+        """
+        Inicializa el planificador.
+        
+        Args:
+            latencia_objetivo: Periodo en el que todos los procesos listos
+                deberían ejecutarse al menos una vez.
+            granularidad_minima: Rebanada mínima de un proceso.
+            
+        Raises:
+            ValueError: Si algún parámetro no es un entero positivo.
+        """
+        # Validar ahora y no al planificar
+        PoliticaCFS(latencia_objetivo, granularidad_minima)
+        self.latencia_objetivo = latencia_objetivo
+        self.granularidad_minima = granularidad_minima
+
+    def _politica(self) -> PoliticaCFS:
+        return PoliticaCFS(self.latencia_objetivo, self.granularidad_minima)
+
+class LoteriaScheduler(SchedulerPorEventos):
+    """
+    Planificador por lotería.
+    
+    En cada quantum se sortea el proceso a ejecutar; los boletos de cada
+    uno salen de su prioridad (menor valor = más boletos).
+    """
+
+    def __init__(self, quantum: int, semilla: Optional[int] = None):
+        """
+        Inicializa el planificador.
+        
+        Args:
+            quantum: Tiempo máximo de ejecución por sorteo.
+            semilla: Semilla para reproducir los sorteos (None = aleatoria).
+            
+        Raises:
+            ValueError: Si el quantum no es positivo.
+        """
+        if not isinstance(quantum, int) or quantum <= 0:
+            raise ValueError("El quantum debe ser un entero positivo")
+        self.quantum = quantum
+        self.semilla = semilla
+
+    def clave_configuracion(self) -> Optional[Tuple]:
+        # Sin semilla cada planificación es distinta
+        return None if self.semilla is None else super().clave_configuracion()
+
+    def _politica(self) -> PoliticaLoteria:
+        return PoliticaLoteria(self.quantum, self.semilla)
+
+class StrideScheduler(SchedulerPorEventos):
+    """
+    Planificador por stride.
+    
+    Reparte la CPU en proporción a los boletos de cada proceso, como la
+    lotería, pero de forma determinista.
+    """
+
+    def __init__(self, quantum: int):
+        """
+        Inicializa el planificador.
+        
+        Args:
+            quantum: Tiempo máximo de ejecución por turno.
+            
+        Raises:
+            ValueError: Si el quantum no es positivo.
+        """
+        if not isinstance(quantum, int) or quantum <= 0:
+            raise ValueError("El quantum debe ser un entero positivo")
+        self.quantum = quantum
+
+    def _politica(self) -> PoliticaStride:
+        return PoliticaStride(self.quantum)
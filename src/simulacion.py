@@ -0,0 +1,810 @@
+import heapq
+import random
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Callable, Iterator, List, Optional, Sequence, Tuple
+from src.gantt import SegmentoRR
+
+# Tipos de evento. A igualdad de instante las llegadas se atienden antes que
+# los fines de ráfaga, así un proceso que agota su quantum vuelve a la cola
+# detrás de los que acaban de llegar.
+LLEGADA = 0
+FIN_RAFAGA = 1
+
+# Notificación de inicio o fin de un proceso: (índice, tiempo)
+Observador = Callable[[int, int], None]
+
+class Politica(ABC):
+    """
+    Política de despacho que se conecta al SimuladorEventos.
+    
+    El núcleo avisa de cada proceso listo con `encolar` y pide el siguiente
+    con `seleccionar`; la política decide el orden y la longitud de cada
+    ráfaga. Las políticas expropiativas redefinen `expropiar` y las que
+    pueden avanzar vueltas completas de golpe redefinen `rotacion`.
+    """
+
+    def iniciar(self, simulador: "SimuladorEventos") -> None:
+        """
+        Prepara la política para una simulación nueva.
+        
+        Args:
+            simulador: Núcleo que la ejecuta; expone duraciones, prioridades
+                y tiempos restantes por índice de proceso.
+        """
+        self.simulador = simulador
+
+    @abstractmethod
+    def encolar(self, indice: int, tiempo: int) -> None:
+        """
+        Recibe un proceso listo para ejecutarse.
+        
+        Args:
+            indice: Posición del proceso en la carga de trabajo.
+            tiempo: Instante en que queda listo.
+        """
+        pass
+
+    def encolar_varios(self, indices: Sequence[int], tiempo: int) -> None:
+        """
+        Recibe varios procesos listos en el mismo instante, en orden.
+        
+        Args:
+            indices: Posiciones de los procesos en la carga de trabajo.
+            tiempo: Instante en que quedan listos.
+        """
+        for indice in indices:
+            self.encolar(indice, tiempo)
+
+    @abstractmethod
+    def seleccionar(self, tiempo: int) -> Optional[Tuple[int, Optional[int]]]:
+        """
+        Saca de la cola el siguiente proceso a ejecutar.
+        
+        Args:
+            tiempo: Instante del despacho.
+            
+        Returns:
+            Tupla (índice, ráfaga máxima), con None como ráfaga para ejecutar
+            hasta terminar, o None si no hay procesos listos.
+        """
+        pass
+
+    def expropiar(self, actual: int, tiempo: int) -> bool:
+        """
+        Decide, tras una llegada, si el proceso en CPU debe ser expulsado.
+        
+        Args:
+            actual: Índice del proceso en ejecución.
+            tiempo: Instante de la llegada.
+            
+        Returns:
+            True para expulsarlo y devolverlo a la cola.
+        """
+        return False
+
+    def rotacion(self, tiempo: int, limite: Optional[int]) -> Optional[Tuple[List[int], int, int]]:
+        """
+        Propone ejecutar una rotación de la cola sin pasar por la cola de eventos.
+        
+        La rotación son `vueltas` vueltas completas de `quantum` seguidas de
+        una vuelta de cierre en la que cada proceso ejecuta lo que le quede,
+        como mucho un quantum. Los índices propuestos salen de la cola; el
+        núcleo devuelve con `encolar_varios`, en el mismo orden, los que no terminan.
+        
+        Args:
+            tiempo: Instante actual, con la CPU libre.
+            limite: Instante del próximo evento (None si no quedan); la
+                rotación debe terminar antes.
+                
+        Returns:
+            Tupla (índices en orden, quantum, vueltas) o None para despachar
+            normalmente.
+        """
+        return None
+
+class SimuladorEventos:
+    """
+    Núcleo de simulación por eventos discretos.
+    
+    Los eventos de llegada y de fin de ráfaga (fin de quantum, expulsión o
+    terminación) se guardan en un montículo binario, así que cada uno cuesta
+    O(log n). Cuando la CPU queda libre sin procesos listos se salta
+    directamente al siguiente evento, sin recorrer el tiempo inactivo.
+    La simulación produce tramos SegmentoRR: una ráfaga suelta o una
+    rotación completa propuesta por `Politica.rotacion`.
+    """
+
+    def __init__(self, politica: Politica):
+        """
+        Inicializa el núcleo con una política de despacho.
+        
+        Args:
+            politica: Política que decide qué proceso se ejecuta.
+        """
+        if not isinstance(politica, Politica):
+            raise ValueError("La política debe ser una instancia de Politica")
+        self.politica = politica
+
+    def simular(self, pids: Sequence[str], duraciones: Sequence[int], llegadas: Sequence[int],
+                prioridades: Optional[Sequence[int]] = None, restantes: Optional[Sequence[int]] = None,
+                al_iniciar: Optional[Observador] = None,
+                al_terminar: Optional[Observador] = None) -> Iterator[SegmentoRR]:
+        """
+        Simula la carga de trabajo descrita por columnas.
+        
+        Args:
+            pids: Identificadores de los procesos.
+            duraciones: Duración de cada proceso.
+            llegadas: Instante de llegada de cada proceso.
+            prioridades: Prioridad de cada proceso (0 por defecto).
+            restantes: Tiempo pendiente de cada proceso (la duración por defecto).
+            al_iniciar: Se llama con (índice, tiempo) la primera vez que un
+                proceso entra en CPU.
+            al_terminar: Se llama con (índice, tiempo) cuando un proceso termina.
+            
+        Returns:
+            Iterador de tramos SegmentoRR en orden cronológico. Los avisos de
+            un tramo se emiten antes de producirlo.
+        """
+        n = len(pids)
+        self.pids = pids
+        self.duraciones = list(duraciones)
+        self.llegadas = list(llegadas)
+        self.prioridades = [0] * n if prioridades is None else list(prioridades)
+        self.restantes = list(self.duraciones if restantes is None else restantes)
+        self.inicios: List[Optional[int]] = [None] * n
+        self.fines: List[Optional[int]] = [None] * n
+        self.tiempo = 0
+        self.actual: Optional[int] = None  # Proceso con una ráfaga pendiente en el montículo
+        self.inicio_rafaga = 0
+        self._al_iniciar = al_iniciar
+        self._al_terminar = al_terminar
+        self.politica.iniciar(self)
+
+        # (tiempo, tipo, orden, índice): las llegadas simultáneas se atienden
+        # en el orden de la carga; en los fines de ráfaga `orden` es la versión
+        # del despacho, que permite descartar los de ráfagas expulsadas
+        eventos = [(llegada, LLEGADA, i, i) for i, llegada in enumerate(self.llegadas)]
+        heapq.heapify(eventos)
+        return self._bucle(eventos)
+
+    def _bucle(self, eventos: list) -> Iterator[SegmentoRR]:
+        """Procesa los eventos hasta vaciar el montículo."""
+        politica = self.politica
+        actual = None  # Proceso en CPU
+        version = 0
+
+        while eventos:
+            tiempo, tipo, orden, indice = heapq.heappop(eventos)
+            self.tiempo = tiempo
+            if tipo == LLEGADA:
+                # Las llegadas simultáneas se entregan juntas
+                llegadas = [indice]
+                while eventos and eventos[0][0] == tiempo and eventos[0][1] == LLEGADA:
+                    llegadas.append(heapq.heappop(eventos)[3])
+                politica.encolar_varios(llegadas, tiempo)
+                # Un proceso que termina justo ahora no se expulsa: lo cierra su propio evento
+                if (actual is not None and self.restante_en(actual, tiempo) > 0
+                        and politica.expropiar(actual, tiempo)):
+                    # Expulsión: su fin de ráfaga pendiente queda obsoleto
+                    yield self._rafaga(actual, self.inicio_rafaga, tiempo)
+                    politica.encolar(actual, tiempo)
+                    actual = self.actual = None
+                    version += 1
+            elif orden == version:
+                yield self._rafaga(actual, self.inicio_rafaga, tiempo)
+                if self.restantes[actual] > 0:
+                    politica.encolar(actual, tiempo)
+                actual = self.actual = None
+
+            # Despachar mientras la CPU esté libre y no queden eventos en este instante
+            while actual is None and (not eventos or eventos[0][0] > tiempo):
+                limite = eventos[0][0] if eventos else None
+                propuesta = politica.rotacion(tiempo, limite)
+                while propuesta is not None:
+                    yield self._rotar(tiempo, *propuesta)
+                    tiempo = self.tiempo
+                    propuesta = politica.rotacion(tiempo, limite)
+                seleccion = politica.seleccionar(tiempo)
+                if seleccion is None:
+                    break
+                actual, rafaga = seleccion
+                restante = self.restantes[actual]
+                fin = tiempo + (restante if rafaga is None else min(rafaga, restante))
+                self._iniciar(actual, tiempo)
+                if limite is None or fin < limite:
+                    # Ningún evento puede interrumpir la ráfaga: se cierra
+                    # sin pasar por el montículo
+                    yield self._rafaga(actual, tiempo, fin)
+                    if self.restantes[actual] > 0:
+                        politica.encolar(actual, fin)
+                    actual = None
+                    tiempo = self.tiempo = fin
+                else:
+                    self.actual = actual
+                    self.inicio_rafaga = tiempo
+                    version += 1
+                    heapq.heappush(eventos, (fin, FIN_RAFAGA, version, actual))
+
+    def restante_en(self, indice: int, tiempo: int) -> int:
+        """
+        Tiempo pendiente de un proceso en un instante, descontando la ráfaga en curso.
+        
+        Args:
+            indice: Posición del proceso en la carga de trabajo.
+            tiempo: Instante de la consulta, no anterior al inicio de la ráfaga.
+            
+        Returns:
+            Unidades de CPU que le faltan al proceso.
+        """
+        if indice == self.actual:
+            return self.restantes[indice] - (tiempo - self.inicio_rafaga)
+        return self.restantes[indice]
+
+    def _iniciar(self, indice: int, tiempo: int) -> None:
+        """Registra la primera entrada en CPU de un proceso."""
+        if self.inicios[indice] is None:
+            self.inicios[indice] = tiempo
+            if self._al_iniciar is not None:
+                self._al_iniciar(indice, tiempo)
+
+    def _rafaga(self, indice: int, inicio: int, fin: int) -> SegmentoRR:
+        """Cierra una ráfaga, descuenta su duración y detecta la terminación."""
+        duracion = fin - inicio
+        self.restantes[indice] -= duracion
+        if self.restantes[indice] == 0:
+            self.fines[indice] = fin
+            if self._al_terminar is not None:
+                self._al_terminar(indice, fin)
+        return SegmentoRR(inicio, duracion, 0, (self.pids[indice],), (duracion,))
+
+    def _rotar(self, tiempo: int, indices: List[int], quantum: int, vueltas: int) -> SegmentoRR:
+        """Ejecuta de una vez una rotación propuesta por la política."""
+        restantes = self.restantes
+        inicios = self.inicios
+        avance = vueltas * quantum
+        inicio = tiempo
+
+        if vueltas > 0:
+            for posicion, indice in enumerate(indices):
+                if inicios[indice] is None:
+                    self._iniciar(indice, tiempo + posicion * quantum)
+            tiempo += vueltas * len(indices) * quantum
+
+        # Vuelta de cierre: cada proceso ejecuta como mucho un quantum
+        cierre = []
+        supervivientes = []
+        for indice in indices:
+            if inicios[indice] is None:
+                self._iniciar(indice, tiempo)
+            restante = restantes[indice] - avance
+            if restante > quantum:
+                restantes[indice] = restante - quantum
+                tiempo += quantum
+                cierre.append(quantum)
+                supervivientes.append(indice)
+            else:
+                restantes[indice] = 0
+                tiempo += restante
+                cierre.append(restante)
+                self.fines[indice] = tiempo
+                if self._al_terminar is not None:
+                    self._al_terminar(indice, tiempo)
+
+        self.tiempo = tiempo
+        self.politica.encolar_varios(supervivientes, tiempo)
+        return SegmentoRR(inicio, quantum, vueltas, tuple(self.pids[i] for i in indices), tuple(cierre))
+
+class PoliticaFCFS(Politica):
+    """Atiende los procesos en orden de llegada, cada uno hasta terminar."""
+    
+    def iniciar(self, simulador: "SimuladorEventos") -> None:
+        super().iniciar(simulador)
+        self.cola = deque()
+
+    def encolar(self, indice: int, tiempo: int) -> None:
+        self.cola.append(indice)
+
+    def seleccionar(self, tiempo: int) -> Optional[Tuple[int, Optional[int]]]:
+        if not self.cola:
+            return None
+        return self.cola.popleft(), None
+
+class PoliticaRoundRobin(Politica):
+    """
+    Cola FIFO circular con un quantum fijo.
+    
+    Cada vuelta de la cola se propone como una rotación: mientras todos los
+    procesos tengan más de k quanta pendientes se avanzan k vueltas de golpe
+    y después una vuelta de cierre. Solo si una llegada cae dentro de la
+    vuelta se despacha ráfaga a ráfaga.
+    """
+
+    def __init__(self, quantum: int):
+        """
+        Inicializa la política.
+        
+        Args:
+            quantum: Tiempo máximo de ejecución por ráfaga.
+            
+        Raises:
+            ValueError: Si el quantum no es positivo.
+        """
+        if not isinstance(quantum, int) or quantum <= 0:
+            raise ValueError("El quantum debe ser un entero positivo")
+        self.quantum = quantum
+
+    def iniciar(self, simulador: "SimuladorEventos") -> None:
+        super().iniciar(simulador)
+        self.cola = deque()
+        self._hasta_rotacion = 0  # Despachos que faltan para volver a intentar una rotación
+
+    def encolar(self, indice: int, tiempo: int) -> None:
+        self.cola.append(indice)
+
+    def encolar_varios(self, indices: Sequence[int], tiempo: int) -> None:
+        self.cola.extend(indices)
+
+    def seleccionar(self, tiempo: int) -> Optional[Tuple[int, Optional[int]]]:
+        if not self.cola:
+            return None
+        self._hasta_rotacion -= 1
+        return self.cola.popleft(), self.quantum
+
+    def rotacion(self, tiempo: int, limite: Optional[int]) -> Optional[Tuple[List[int], int, int]]:
+        if self._hasta_rotacion > 0 or not self.cola:
+            return None
+        quantum = self.quantum
+        restantes = self.simulador.restantes
+        duracion_vuelta = len(self.cola) * quantum
+        # Vueltas completas en las que ningún proceso de la cola termina
+        vueltas = (min(map(restantes.__getitem__, self.cola)) - 1) // quantum
+        if limite is not None:
+            avance = vueltas * quantum
+            cierre = sum(min(quantum, restantes[i] - avance) for i in self.cola)
+            if tiempo + vueltas * duracion_vuelta + cierre >= limite:
+                # Recortar para acabar antes de la llegada; la vuelta de
+                # cierre pasa a ser otra vuelta completa
+                vueltas = (limite - tiempo - 1) // duracion_vuelta - 1
+                if vueltas < 0:
+                    # Vuelta a vuelta hasta después de la llegada
+                    self._hasta_rotacion = len(self.cola)
+                    return None
+        indices = list(self.cola)
+        self.cola.clear()
+        return indices, quantum, vueltas
+
+class PoliticaPrioridad(Politica):
+    """
+    Cola de listos ordenada por prioridad (menor valor = mayor prioridad).
+    
+    Un montículo binario da despachos en O(log n); a igual prioridad se
+    respeta el orden de llegada a la cola con un contador de secuencia.
+    Con envejecimiento, cada `envejecimiento` unidades de espera cuentan
+    como un nivel de prioridad ganado. Como todos los procesos en espera
+    envejecen al mismo ritmo, el orden entre ellos no cambia con el tiempo
+    y basta con ordenar por prioridad * envejecimiento + instante de
+    encolado: ninguna clave se recalcula mientras el proceso espera.
+    """
+
+    def __init__(self, expropiativa: bool = False, envejecimiento: Optional[int] = None):
+        """
+        Inicializa la política.
+        
+        Args:
+            expropiativa: Si una llegada más prioritaria expulsa al proceso en CPU.
+            envejecimiento: Unidades de espera por nivel de prioridad ganado
+                (None = sin envejecimiento).
+                
+        Raises:
+            ValueError: Si el envejecimiento no es un entero positivo.
+        """
+        if envejecimiento is not None and (not isinstance(envejecimiento, int) or envejecimiento <= 0):
+            raise ValueError("El envejecimiento debe ser un entero positivo")
+        self.expropiativa = expropiativa
+        self.envejecimiento = envejecimiento
+
+    def iniciar(self, simulador: "SimuladorEventos") -> None:
+        super().iniciar(simulador)
+        self.listos: List[Tuple[int, int, int]] = []  # (clave, secuencia, índice)
+        self._secuencia = 0
+
+    def _clave(self, indice: int, tiempo: int) -> int:
+        """Clave de orden de un proceso que entra en la cola en `tiempo`."""
+        prioridad = self.simulador.prioridades[indice]
+        if self.envejecimiento is None:
+            return prioridad
+        return prioridad * self.envejecimiento + tiempo
+
+    def encolar(self, indice: int, tiempo: int) -> None:
+        heapq.heappush(self.listos, (self._clave(indice, tiempo), self._secuencia, indice))
+        self._secuencia += 1
+
+    def seleccionar(self, tiempo: int) -> Optional[Tuple[int, Optional[int]]]:
+        if not self.listos:
+            return None
+        return heapq.heappop(self.listos)[2], None
+
+    def expropiar(self, actual: int, tiempo: int) -> bool:
+        # Se compara con la clave que tendría el proceso en CPU si volviera ahora a la cola
+        return self.expropiativa and self.listos[0][0] < self._clave(actual, tiempo)
+
+class PoliticaTrabajoMasCorto(PoliticaPrioridad):
+    """
+    Cola de listos ordenada por tiempo restante (SJF y SRTF).
+    
+    La clave de cada proceso es su tiempo restante al entrar en la cola,
+    que no cambia mientras espera. En la variante expropiativa una llegada
+    solo expulsa al proceso en CPU si necesita estrictamente menos tiempo
+    del que a este le queda.
+    """
+
+    def __init__(self, expropiativa: bool = False):
+        """
+        Inicializa la política.
+        
+        Args:
+            expropiativa: True para SRTF, False para SJF.
+        """
+        super().__init__(expropiativa)
+
+    def _clave(self, indice: int, tiempo: int) -> int:
+        return self.simulador.restantes[indice]
+
+    def expropiar(self, actual: int, tiempo: int) -> bool:
+        return self.expropiativa and self.listos[0][0] < self.simulador.restante_en(actual, tiempo)
+
+class PoliticaMLFQ(Politica):
+    """
+    Cola multinivel con retroalimentación (MLFQ).
+    
+    Cada nivel es una deque FIFO con su propio quantum. Los procesos llegan
+    al nivel 0; el que agota su quantum baja un nivel y el expulsado por
+    una llegada más prioritaria conserva el suyo. Un mapa de bits marca los
+    niveles no vacíos, así que elegir el siguiente proceso es O(1) sin
+    recorrer los niveles. Cada `intervalo_boost` unidades todos los
+    procesos vuelven al nivel 0; el boost se aplica en la siguiente
+    decisión de planificación y no interrumpe la ráfaga en curso.
+    """
+
+    def __init__(self, quanta: Sequence[int], intervalo_boost: Optional[int] = None):
+        """
+        Inicializa la política.
+        
+        Args:
+            quanta: Quantum de cada nivel, del más prioritario al menos.
+            intervalo_boost: Periodo de la subida general al nivel 0
+                (None = sin boost).
+                
+        Raises:
+            ValueError: Si los quanta o el intervalo no son enteros positivos.
+        """
+        if not quanta or not all(isinstance(q, int) and q > 0 for q in quanta):
+            raise ValueError("Se requiere al menos un nivel y quanta enteros positivos")
+        if intervalo_boost is not None and (not isinstance(intervalo_boost, int) or intervalo_boost <= 0):
+            raise ValueError("El intervalo de boost debe ser un entero positivo")
+        self.quanta = tuple(quanta)
+        self.intervalo_boost = intervalo_boost
+
+    def iniciar(self, simulador: "SimuladorEventos") -> None:
+        super().iniciar(simulador)
+        self.colas = [deque() for _ in self.quanta]
+        self.niveles = [0] * len(simulador.pids)
+        self._mapa = 0  # Bit k activo si la cola del nivel k no está vacía
+        self._epoca = 0  # Número de boosts aplicados
+        self._despachado: Optional[int] = None
+        self._epoca_despacho = 0
+        self._expulsado: Optional[int] = None
+
+    def _boost(self, tiempo: int) -> None:
+        """Aplica el boost pendiente, si ya ha pasado un intervalo completo."""
+        if self.intervalo_boost is None or tiempo // self.intervalo_boost == self._epoca:
+            return
+        self._epoca = tiempo // self.intervalo_boost
+        superior = self.colas[0]
+        for cola in self.colas[1:]:
+            for indice in cola:
+                self.niveles[indice] = 0
+            superior.extend(cola)
+            cola.clear()
+        if superior:
+            self._mapa = 1
+        if self._despachado is not None:
+            self.niveles[self._despachado] = 0
+
+    def encolar(self, indice: int, tiempo: int) -> None:
+        self._boost(tiempo)
+        if indice == self._expulsado:
+            # Expulsado por una llegada: conserva su nivel
+            self._expulsado = None
+        elif indice == self._despachado:
+            # Agotó su quantum: baja un nivel, salvo que haya habido boost
+            if self._epoca == self._epoca_despacho:
+                self.niveles[indice] = min(self.niveles[indice] + 1, len(self.quanta) - 1)
+        else:
+            self.niveles[indice] = 0
+        nivel = self.niveles[indice]
+        self.colas[nivel].append(indice)
+        self._mapa |= 1 << nivel
+
+    def seleccionar(self, tiempo: int) -> Optional[Tuple[int, Optional[int]]]:
+        self._boost(tiempo)
+        if not self._mapa:
+            return None
+        nivel = (self._mapa & -self._mapa).bit_length() - 1
+        cola = self.colas[nivel]
+        indice = cola.popleft()
+        if not cola:
+            self._mapa &= ~(1 << nivel)
+        self._despachado = indice
+        self._epoca_despacho = self._epoca
+        return indice, self.quanta[nivel]
+
+    def expropiar(self, actual: int, tiempo: int) -> bool:
+        self._boost(tiempo)
+        # Hay algún nivel no vacío por encima del proceso en CPU
+        if self._mapa & ((1 << self.niveles[actual]) - 1):
+            self._expulsado = actual
+            return True
+        return False
+
+# Peso de un proceso de prioridad 0; cada nivel de prioridad divide el peso
+# entre 1,25, como la tabla nice -> peso de Linux
+PESO_BASE = 1024
+
+def peso_prioridad(prioridad: int) -> int:
+    """
+    Convierte una prioridad (menor valor = mayor prioridad) en un peso entero.
+    
+    Args:
+        prioridad: Prioridad no negativa del proceso.
+        
+    Returns:
+        Peso positivo: PESO_BASE para la prioridad 0 y nunca menos de 1.
+    """
+    return max(1, round(PESO_BASE / 1.25 ** prioridad))
+
+class PoliticaCFS(Politica):
+    """
+    Planificación completamente justa (CFS) por tiempo virtual de ejecución.
+    
+    Cada proceso acumula vruntime = tiempo ejecutado * PESO_BASE / peso, así
+    que los más prioritarios (más peso) envejecen más despacio y reciben
+    más CPU. Siempre se ejecuta el de menor vruntime, tomado de un
+    montículo con inserción y extracción del mínimo en O(log n). Su rebanada
+    es la parte de `latencia_objetivo` proporcional a su peso, nunca menor
+    que `granularidad_minima`. Los que llegan entran con el vruntime mínimo
+    de la cola, para no acaparar la CPU, y expulsan al proceso en CPU si
+    este les saca más de una granularidad.
+    """
+
+    def __init__(self, latencia_objetivo: int = 20, granularidad_minima: int = 4):
+        """
+        Inicializa la política.
+        
+        Args:
+            latencia_objetivo: Periodo en el que todos los procesos listos
+                deberían ejecutarse al menos una vez.
+            granularidad_minima: Rebanada mínima de un proceso.
+            
+        Raises:
+            ValueError: Si algún parámetro no es un entero positivo.
+        """
+        if not isinstance(latencia_objetivo, int) or latencia_objetivo <= 0:
+            raise ValueError("La latencia objetivo debe ser un entero positivo")
+        if not isinstance(granularidad_minima, int) or granularidad_minima <= 0:
+            raise ValueError("La granularidad mínima debe ser un entero positivo")
+        self.latencia_objetivo = latencia_objetivo
+        self.granularidad_minima = granularidad_minima
+
+    def iniciar(self, simulador: "SimuladorEventos") -> None:
+        super().iniciar(simulador)
+        self.pesos = [peso_prioridad(p) for p in simulador.prioridades]
+        self.vruntime = [0.0] * len(self.pesos)
+        self.listos: List[Tuple[float, int, int]] = []  # (vruntime, secuencia, índice)
+        self.min_vruntime = 0.0
+        self.peso_total = 0  # Peso de los procesos listos o en CPU
+        self._secuencia = 0
+        self._en_cpu: Optional[int] = None
+        self._restante_despacho = 0
+
+    def _ejecutado(self, indice: int, tiempo: int) -> int:
+        """Tiempo que lleva en CPU el proceso despachado en su ráfaga actual."""
+        return self._restante_despacho - self.simulador.restante_en(indice, tiempo)
+
+    def encolar(self, indice: int, tiempo: int) -> None:
+        if indice == self._en_cpu:
+            # Vuelve de la CPU: se carga lo ejecutado a su vruntime
+            ejecutado = self._restante_despacho - self.simulador.restantes[indice]
+            self.vruntime[indice] += ejecutado * PESO_BASE / self.pesos[indice]
+            self._en_cpu = None
+        else:
+            self.vruntime[indice] = max(self.vruntime[indice], self.min_vruntime)
+            self.peso_total += self.pesos[indice]
+        heapq.heappush(self.listos, (self.vruntime[indice], self._secuencia, indice))
+        self._secuencia += 1
+
+    def seleccionar(self, tiempo: int) -> Optional[Tuple[int, Optional[int]]]:
+        if self._en_cpu is not None:
+            # El anterior no volvió a la cola: ha terminado
+            self.peso_total -= self.pesos[self._en_cpu]
+            self._en_cpu = None
+        if not self.listos:
+            return None
+        vruntime, _, indice = heapq.heappop(self.listos)
+        self.min_vruntime = max(self.min_vruntime, vruntime)
+        self._en_cpu = indice
+        self._restante_despacho = self.simulador.restantes[indice]
+        rebanada = self.latencia_objetivo * self.pesos[indice] // self.peso_total
+        return indice, max(self.granularidad_minima, rebanada)
+
+    def expropiar(self, actual: int, tiempo: int) -> bool:
+        peso = self.pesos[actual]
+        vruntime_actual = self.vruntime[actual] + self._ejecutado(actual, tiempo) * PESO_BASE / peso
+        return self.listos[0][0] + self.granularidad_minima * PESO_BASE / peso < vruntime_actual
+
+class ArbolFenwick:
+    """
+    Árbol de Fenwick (binary indexed tree) de enteros no negativos.
+    
+    Actualiza una posición y localiza la posición que contiene un valor
+    acumulado dado en O(log n), sin recorrer el array.
+    """
+
+    def __init__(self, n: int):
+        """
+        Inicializa un árbol de n posiciones a cero.
+        
+        Args:
+            n: Número de posiciones.
+        """
+        self._arbol = [0] * (n + 1)
+        self._mayor_potencia = 1 << n.bit_length() if n else 0
+        self.total = 0
+
+    def agregar(self, posicion: int, delta: int) -> None:
+        """
+        Suma `delta` al valor de una posición.
+        
+        Args:
+            posicion: Posición, empezando en 0.
+            delta: Cantidad a sumar (negativa para restar).
+        """
+        self.total += delta
+        i = posicion + 1
+        while i < len(self._arbol):
+            self._arbol[i] += delta
+            i += i & -i
+
+    def buscar(self, objetivo: int) -> int:
+        """
+        Localiza la posición en la que la suma acumulada supera `objetivo`.
+        
+        Args:
+            objetivo: Valor entre 0 y total - 1.
+            
+        Returns:
+            La menor posición p con suma(0..p) > objetivo.
+        """
+        posicion = 0
+        paso = self._mayor_potencia
+        while paso:
+            siguiente = posicion + paso
+            if siguiente < len(self._arbol) and self._arbol[siguiente] <= objetivo:
+                posicion = siguiente
+                objetivo -= self._arbol[siguiente]
+            paso >>= 1
+        return posicion
+
+class PoliticaLoteria(Politica):
+    """
+    Planificación por lotería.
+    
+    Cada proceso listo tiene tantos boletos como su peso de prioridad y en
+    cada quantum se sortea uno. Los boletos viven en un árbol de Fenwick,
+    así que cada sorteo y cada alta o baja en la cola es O(log n). Con la
+    misma semilla se obtiene siempre el mismo resultado.
+    """
+
+    def __init__(self, quantum: int, semilla: Optional[int] = None):
+        """
+        Inicializa la política.
+        
+        Args:
+            quantum: Tiempo máximo de ejecución por sorteo.
+            semilla: Semilla del generador de números aleatorios.
+            
+        Raises:
+            ValueError: Si el quantum no es positivo.
+        """
+        if not isinstance(quantum, int) or quantum <= 0:
+            raise ValueError("El quantum debe ser un entero positivo")
+        self.quantum = quantum
+        self.semilla = semilla
+
+    def iniciar(self, simulador: "SimuladorEventos") -> None:
+        super().iniciar(simulador)
+        self.boletos = [peso_prioridad(p) for p in simulador.prioridades]
+        self.arbol = ArbolFenwick(len(self.boletos))
+        self.azar = random.Random(self.semilla)
+        self._listos = 0
+        # El proceso sorteado conserva sus boletos en el árbol mientras está
+        # en CPU (nadie sortea hasta que termina su ráfaga); solo se retiran
+        # si no vuelve a la cola
+        self._en_cpu: Optional[int] = None
+
+    def encolar(self, indice: int, tiempo: int) -> None:
+        if indice == self._en_cpu:
+            self._en_cpu = None
+        else:
+            self.arbol.agregar(indice, self.boletos[indice])
+        self._listos += 1
+
+    def seleccionar(self, tiempo: int) -> Optional[Tuple[int, Optional[int]]]:
+        if self._en_cpu is not None:
+            # Terminó: sus boletos salen del sorteo
+            self.arbol.agregar(self._en_cpu, -self.boletos[self._en_cpu])
+            self._en_cpu = None
+        if not self._listos:
+            return None
+        indice = self.arbol.buscar(self.azar.randrange(self.arbol.total))
+        self._en_cpu = indice
+        self._listos -= 1
+        return indice, self.quantum
+
+# Numerador de los pasos de stride: paso = STRIDE_BASE / boletos
+STRIDE_BASE = 1 << 20
+
+class PoliticaStride(Politica):
+    """
+    Planificación por stride: reparto proporcional determinista.
+    
+    Cada proceso avanza su `pase` en STRIDE_BASE / boletos por quantum
+    ejecutado (proporcionalmente si usa menos) y siempre se ejecuta el de
+    menor pase, tomado de un montículo. Los que llegan empiezan en el pase
+    global, para no adelantar a los que ya esperaban.
+    """
+
+    def __init__(self, quantum: int):
+        """
+        Inicializa la política.
+        
+        Args:
+            quantum: Tiempo máximo de ejecución por turno.
+            
+        Raises:
+            ValueError: Si el quantum no es positivo.
+        """
+        if not isinstance(quantum, int) or quantum <= 0:
+            raise ValueError("El quantum debe ser un entero positivo")
+        self.quantum = quantum
+
+    def iniciar(self, simulador: "SimuladorEventos") -> None:
+        super().iniciar(simulador)
+        self.pasos = [STRIDE_BASE // peso_prioridad(p) for p in simulador.prioridades]
+        self.pases = [0] * len(self.pasos)
+        self.pase_global = 0
+        self.listos: List[Tuple[int, int, int]] = []  # (pase, secuencia, índice)
+        self._secuencia = 0
+        self._en_cpu: Optional[int] = None
+        self._restante_despacho = 0
+
+    def encolar(self, indice: int, tiempo: int) -> None:
+        if indice == self._en_cpu:
+            ejecutado = self._restante_despacho - self.simulador.restantes[indice]
+            self.pases[indice] += self.pasos[indice] * ejecutado // self.quantum
+            self._en_cpu = None
+        else:
+            self.pases[indice] = max(self.pases[indice], self.pase_global)
+        heapq.heappush(self.listos, (self.pases[indice], self._secuencia, indice))
+        self._secuencia += 1
+
+    def seleccionar(self, tiempo: int) -> Optional[Tuple[int, Optional[int]]]:
+        if not self.listos:
+            return None
+        pase, _, indice = heapq.heappop(self.listos)
+        self.pase_global = max(self.pase_global, pase)
+        self._en_cpu = indice
+        self._restante_despacho = self.simulador.restantes[indice]
+        return indice, self.quantum
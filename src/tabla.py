@@ -0,0 +1,630 @@
+import csv
+import io
+import mmap
+import os
+import tempfile
+from itertools import chain, compress, islice
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+import numpy as np
+from src.repositorio import RepositorioProcesos
+
+# Valor centinela para tiempos de inicio o fin no establecidos (None en Proceso)
+SIN_TIEMPO = -1
+
+# Formato binario: cabecera (firma, número de procesos, bytes de PIDs), las
+# columnas int64 little-endian en el orden de _COLUMNAS_BINARIAS, los n + 1
+# desplazamientos de la tabla de PIDs y los PIDs en UTF-8 concatenados.
+_FIRMA_BINARIA = b"TABLAPR1"
+_CABECERA_BINARIA = np.dtype([("firma", "S8"), ("n", "<i8"), ("bytes_pids", "<i8")])
+_COLUMNAS_BINARIAS = ("duracion", "prioridad", "tiempo_restante",
+                      "tiempo_llegada", "tiempo_inicio", "tiempo_fin")
+
+# Columnas del formato CSV de RepositorioProcesos (separador: ;)
+_COLUMNAS_CSV = ("pid", "duracion", "prioridad", "tiempo_restante",
+                 "tiempo_llegada", "tiempo_inicio", "tiempo_fin")
+_BYTES_BLOQUE_CSV = 1 << 23  # Texto leído por bloque en la carga rápida de CSV
+_BASE_FNV = np.uint64(0xCBF29CE484222325)
+_PRIMO_FNV = np.uint64(0x100000001B3)
+
+def _columna_csv(valores: List[str], nombre: str, opcional: bool = False) -> np.ndarray:
+    """
+    Convierte una columna de texto de un CSV a int64 con int().
+    
+    Es la vía lenta de _enteros_csv: acepta y rechaza exactamente lo mismo
+    que RepositorioProcesos.cargar_csv.
+    
+    Args:
+        valores: Textos de la columna.
+        nombre: Nombre de la columna, para los mensajes de error.
+        opcional: Si es True, las celdas vacías se convierten en SIN_TIEMPO.
+        
+    Returns:
+        Array int64 con los valores.
+        
+    Raises:
+        ValueError: Si algún valor no es un entero.
+    """
+    try:
+        if opcional:
+            return np.array([int(valor) if valor else SIN_TIEMPO for valor in valores], dtype=np.int64)
+        return np.array([int(valor) for valor in valores], dtype=np.int64)
+    except (ValueError, OverflowError) as e:
+        raise ValueError(f"La columna '{nombre}' contiene valores no enteros ({e})")
+
+def _validar_pids(pids: List[str]) -> None:
+    """
+    Comprueba que todos los PIDs sean cadenas no vacías.
+    
+    Raises:
+        ValueError: Si algún PID no es una cadena o solo tiene espacios.
+    """
+    try:
+        validos = all(map(str.strip, pids))
+    except TypeError:  # Algún PID no es una cadena
+        validos = False
+    if not validos:
+        raise ValueError("El PID debe ser una cadena no vacía")
+
+def _celdas_csv(datos: np.ndarray, inicios: np.ndarray, fines: np.ndarray) -> np.ndarray:
+    """
+    Copia las celdas de una columna de un CSV a una matriz de bytes.
+    
+    Args:
+        datos: Bytes del bloque de texto.
+        inicios: Posición del primer byte de cada celda.
+        fines: Posición del separador que cierra cada celda.
+        
+    Returns:
+        Matriz uint8 con una fila por celda: sus bytes, un ';' y ceros de
+        relleno hasta la anchura de la celda más larga más uno.
+    """
+    longitudes = fines - inicios
+    columnas = np.arange(int(longitudes.max(initial=0)) + 1)
+    celdas = datos.take(inicios[:, None] + columnas, mode="clip")
+    relativas = columnas - longitudes[:, None]
+    celdas[relativas > 0] = 0
+    celdas[relativas == 0] = ord(";")
+    return celdas
+
+def _textos_csv(celdas: np.ndarray) -> List[str]:
+    """Decodifica las celdas de _celdas_csv con un único split."""
+    textos = celdas.tobytes().replace(b"\0", b"").decode("utf-8").split(";")
+    textos.pop()
+    return textos
+
+def _pids_en_blanco(celdas: np.ndarray, pids: List[str]) -> bool:
+    """
+    Indica si algún PID de _celdas_csv está vacío o solo tiene espacios.
+    
+    Solo se llama a str.strip con los PIDs cuyo primer byte puede empezar
+    un espacio: ';' (celda vacía), un espacio ASCII o un byte no ASCII.
+    """
+    primeros = celdas[:, 0]
+    dudosos = ((primeros == ord(";")) | (primeros >= 0x80) | ((primeros >= 0x09) & (primeros <= 0x0D))
+               | ((primeros >= 0x1C) & (primeros <= 0x20)))
+    if not dudosos.any():
+        return False
+    return not all(map(str.strip, compress(pids, dudosos.tolist())))
+
+def _enteros_csv(datos: np.ndarray, inicios: np.ndarray, fines: np.ndarray,
+                 nombre: str, opcional: bool = False) -> np.ndarray:
+    """
+    Convierte una columna de un CSV a int64 directamente desde los bytes.
+    
+    Las cifras se acumulan de derecha a izquierda, una posición por
+    pasada, sin crear una cadena por celda. Si alguna celda no es un
+    número sin signo de hasta 18 cifras (o está vacía en una columna
+    obligatoria), la columna se convierte con _columna_csv, que da el mismo
+    resultado o error que int().
+    
+    Args:
+        datos: Bytes del bloque de texto.
+        inicios: Posición del primer byte de cada celda.
+        fines: Posición del separador que cierra cada celda.
+        nombre: Nombre de la columna, para los mensajes de error.
+        opcional: Si es True, las celdas vacías se convierten en SIN_TIEMPO.
+        
+    Returns:
+        Array int64 con los valores.
+        
+    Raises:
+        ValueError: Si algún valor no es un entero.
+    """
+    longitudes = fines - inicios
+    cifras_maximas = int(longitudes.max(initial=0))
+    cifras_minimas = int(longitudes.min(initial=cifras_maximas))
+    if cifras_maximas <= 18 and (opcional or cifras_minimas > 0):
+        # Con hasta 9 cifras las sumas caben en int32, que es más rápido
+        tipo = np.int32 if cifras_maximas <= 9 else np.int64
+        valores = np.zeros(len(fines), dtype=tipo)
+        mayor = 0
+        posiciones = fines
+        for k in range(cifras_maximas):
+            posiciones = posiciones - 1
+            # Los bytes que no son cifras quedan por encima de 9 al restar '0'
+            cifras = datos.take(posiciones, mode="clip") - np.uint8(ord("0"))
+            if k >= cifras_minimas:
+                cifras *= longitudes > k
+            mayor = max(mayor, int(cifras.max(initial=0)))
+            valores += cifras.astype(tipo) * tipo(10 ** k)
+        if mayor <= 9:
+            valores = valores.astype(np.int64)
+            valores[longitudes == 0] = SIN_TIEMPO
+            return valores
+    return _columna_csv(_textos_csv(_celdas_csv(datos, inicios, fines)), nombre, opcional)
+
+def _firmas_pids(celdas: np.ndarray) -> np.ndarray:
+    """
+    Hash FNV-1a de 64 bits de cada fila de _celdas_csv.
+    
+    Los ceros de relleno no cambian el hash, así que un mismo PID tiene la
+    misma firma en bloques con anchuras distintas.
+    """
+    firmas = np.full(len(celdas), _BASE_FNV, dtype=np.uint64)
+    for columna in celdas.T:
+        firmas = np.where(columna != 0, (firmas ^ columna) * _PRIMO_FNV, firmas)
+    return firmas
+
+def _hay_duplicados(pids: List[str], firmas: np.ndarray) -> bool:
+    """
+    Comprueba si hay PIDs repetidos ordenando sus firmas.
+    
+    Ordenar un array uint64 es mucho más rápido que construir un conjunto
+    de cadenas; solo los PIDs cuya firma se repite se comparan como texto.
+    """
+    ordenadas = np.sort(firmas)
+    repetidas = ordenadas[1:][ordenadas[1:] == ordenadas[:-1]]
+    if not len(repetidas):
+        return False
+    candidatos = list(compress(pids, np.isin(firmas, repetidas).tolist()))
+    return len(set(candidatos)) != len(candidatos)
+
+class _TablaPids(Sequence):
+    """
+    Secuencia de PIDs leída bajo demanda de una tabla de cadenas.
+    
+    Cada PID se decodifica al accederlo, así que abrir un archivo con millones
+    de procesos no crea millones de cadenas. Al serializarse se convierte en
+    una lista normal.
+    """
+
+    def __init__(self, desplazamientos: np.ndarray, datos: memoryview):
+        self._desplazamientos = desplazamientos
+        self._datos = datos
+
+    def __len__(self) -> int:
+        return len(self._desplazamientos) - 1
+
+    def __getitem__(self, indice: Union[int, slice]) -> Union[str, List[str]]:
+        if isinstance(indice, slice):
+            return [self[i] for i in range(*indice.indices(len(self)))]
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError("Índice de PID fuera de rango")
+        inicio, fin = self._desplazamientos[indice:indice + 2].tolist()
+        return str(self._datos[inicio:fin], "utf-8")
+
+    def __iter__(self) -> Iterator[str]:
+        datos = self._datos
+        limites = self._desplazamientos.tolist()
+        for inicio, fin in zip(limites, limites[1:]):
+            yield str(datos[inicio:fin], "utf-8")
+
+    def __reduce__(self):
+        return (list, (list(self),))
+
+class TablaProcesos:
+    """
+    Conjunto de procesos almacenado por columnas en arrays contiguos de NumPy.
+    
+    Es una alternativa a las listas de Proceso para cargas muy grandes: no
+    crea un objeto por proceso y cada atributo vive en un array int64. Los
+    tiempos de inicio y fin no establecidos se guardan como SIN_TIEMPO.
+    """
+
+    def __init__(self, pids: Sequence[str], duraciones: Sequence[int],
+                 prioridades: Sequence[int], tiempos_llegada: Optional[Sequence[int]] = None):
+        """
+        Inicializa la tabla validando todas las columnas de una vez.
+        
+        Args:
+            pids: Identificadores únicos de los procesos.
+            duraciones: Tiempo total de CPU requerido por cada proceso.
+            prioridades: Prioridad de cada proceso (menor valor = mayor prioridad).
+            tiempos_llegada: Instante de llegada de cada proceso (0 por defecto).
+            
+        Raises:
+            ValueError: Si alguna columna es inválida o hay PIDs duplicados.
+        """
+        pids = list(pids)
+        _validar_pids(pids)
+        if len(set(pids)) != len(pids):
+            raise ValueError("La tabla contiene PIDs duplicados")
+        self._asignar_columnas(pids, duraciones, prioridades, tiempos_llegada)
+
+    def _asignar_columnas(self, pids: List[str], duraciones: Sequence[int],
+                          prioridades: Sequence[int], tiempos_llegada: Optional[Sequence[int]]) -> None:
+        """Valida las columnas numéricas y las asigna junto a los PIDs ya validados."""
+        n = len(pids)
+        duracion = np.asarray(duraciones, dtype=np.int64)
+        prioridad = np.asarray(prioridades, dtype=np.int64)
+        if tiempos_llegada is None:
+            tiempo_llegada = np.zeros(n, dtype=np.int64)
+        else:
+            tiempo_llegada = np.asarray(tiempos_llegada, dtype=np.int64)
+        if duracion.shape != (n,) or prioridad.shape != (n,) or tiempo_llegada.shape != (n,):
+            raise ValueError("Todas las columnas deben tener la misma longitud")
+        if (duracion <= 0).any():
+            raise ValueError("La duración debe ser un entero positivo")
+        if (prioridad < 0).any():
+            raise ValueError("La prioridad debe ser un entero no negativo")
+        if (tiempo_llegada < 0).any():
+            raise ValueError("El tiempo de llegada debe ser un entero no negativo")
+
+        self.pids: List[str] = pids
+        self.duracion = duracion
+        self.prioridad = prioridad
+        self.tiempo_llegada = tiempo_llegada
+        self.tiempo_inicio = np.full(n, SIN_TIEMPO, dtype=np.int64)
+        self.tiempo_fin = np.full(n, SIN_TIEMPO, dtype=np.int64)
+        self.tiempo_restante = duracion.copy()
+        self._indices: Optional[Dict[str, int]] = None
+
+    def __len__(self) -> int:
+        return len(self.pids)
+
+    def indice(self, pid: str) -> int:
+        """
+        Devuelve la posición de un proceso en la tabla.
+        
+        Args:
+            pid: Identificador del proceso.
+            
+        Returns:
+            Índice de la fila del proceso.
+            
+        Raises:
+            ValueError: Si el PID no existe.
+        """
+        if self._indices is None:
+            self._indices = {pid: i for i, pid in enumerate(self.pids)}
+        if pid not in self._indices:
+            raise ValueError(f"El PID '{pid}' no existe en la tabla")
+        return self._indices[pid]
+
+    def guardar_csv(self, archivo: str, tamano_bloque: int = 100_000) -> None:
+        """
+        Guarda la tabla en el mismo formato CSV que RepositorioProcesos.
+        
+        Las filas se escriben por bloques con writerows a partir de las
+        columnas convertidas de una vez, sin pasar por objetos Proceso.
+        
+        Args:
+            archivo: Ruta del archivo.
+            tamano_bloque: Número de filas convertidas y escritas a la vez.
+            
+        Raises:
+            IOError: Si no se puede escribir en el archivo.
+        """
+        try:
+            with open(archivo, 'w', encoding='utf-8', newline='') as f:
+                writer = csv.writer(f, delimiter=';')
+                writer.writerow(_COLUMNAS_CSV)
+                for inicio in range(0, len(self), tamano_bloque):
+                    fin = inicio + tamano_bloque
+                    columnas = [self.pids[inicio:fin]]
+                    for nombre in _COLUMNAS_CSV[1:]:
+                        columna = getattr(self, nombre)[inicio:fin]
+                        if nombre in ("tiempo_inicio", "tiempo_fin"):
+                            # Los tiempos no establecidos se escriben vacíos
+                            valores = columna.astype(object)
+                            valores[columna == SIN_TIEMPO] = None
+                            columna = valores
+                        columnas.append(columna.tolist())
+                    writer.writerows(zip(*columnas))
+        except IOError as e:
+            raise IOError(f"Error al guardar en CSV: {e}")
+
+    @classmethod
+    def cargar_csv(cls, archivo: str) -> "TablaProcesos":
+        """
+        Crea una tabla desde un CSV escrito por RepositorioProcesos.guardar_csv.
+        
+        Es la vía rápida para archivos grandes: el archivo se lee en bloques
+        de bytes, los separadores se localizan con NumPy y cada columna
+        numérica se convierte directamente desde los bytes, sin diccionarios
+        por fila, cadenas por celda ni objetos Proceso. Los PIDs se
+        decodifican con un único split por bloque y su unicidad se comprueba
+        ordenando un hash de sus bytes. Los bloques con campos entre
+        comillas (PIDs con ; o saltos de línea) se leen con el módulo csv y
+        el resultado es el mismo.
+        
+        Args:
+            archivo: Ruta del archivo.
+            
+        Returns:
+            Nueva TablaProcesos con el estado completo de los procesos.
+            
+        Raises:
+            IOError: Si no se puede leer el archivo.
+            ValueError: Si el formato es inválido o los datos son incorrectos.
+        """
+        try:
+            with open(archivo, 'rb') as f:
+                encabezado = next(csv.reader([f.readline().decode("utf-8")], delimiter=';'), [])
+                if not all(columna in encabezado for columna in _COLUMNAS_CSV):
+                    raise ValueError("El CSV debe contener todas las columnas requeridas")
+                posiciones = [encabezado.index(columna) for columna in _COLUMNAS_CSV]
+
+                pids: List[str] = []
+                firmas: List[Optional[np.ndarray]] = []
+                partes: Dict[str, List[np.ndarray]] = {nombre: [] for nombre in _COLUMNAS_CSV[1:]}
+                for pids_bloque, firmas_bloque, columnas_bloque in cls._bloques_csv(f, len(encabezado), posiciones):
+                    pids.extend(pids_bloque)
+                    firmas.append(firmas_bloque)
+                    for nombre, columna in zip(_COLUMNAS_CSV[1:], columnas_bloque):
+                        partes[nombre].append(columna)
+
+            # Los bloques leídos con el módulo csv no tienen firmas
+            if any(firma is None for firma in firmas):
+                duplicados = len(set(pids)) != len(pids)
+            else:
+                duplicados = _hay_duplicados(pids, np.concatenate(firmas) if firmas else np.zeros(0, np.uint64))
+            if duplicados:
+                raise ValueError("La tabla contiene PIDs duplicados")
+            columnas = {nombre: np.concatenate(columna) if columna else np.zeros(0, dtype=np.int64)
+                        for nombre, columna in partes.items()}
+            tabla = cls.__new__(cls)
+            tabla._asignar_columnas(pids, columnas["duracion"], columnas["prioridad"], columnas["tiempo_llegada"])
+        except IOError as e:
+            raise IOError(f"Error al cargar desde CSV: {e}")
+        except (ValueError, csv.Error) as e:
+            raise ValueError(f"Error en los datos del CSV: {e}")
+        tabla.tiempo_restante = columnas["tiempo_restante"]
+        tabla.tiempo_inicio = columnas["tiempo_inicio"]
+        tabla.tiempo_fin = columnas["tiempo_fin"]
+        return tabla
+
+    @staticmethod
+    def _bloques_csv(f: io.BufferedIOBase, campos: int,
+                     posiciones: List[int]) -> Iterator[Tuple[List[str], Optional[np.ndarray], List[np.ndarray]]]:
+        """
+        Lee el cuerpo de un CSV por bloques y convierte sus columnas.
+        
+        Mientras el texto no tenga comillas, cada bloque se analiza como
+        bytes: las filas y celdas se delimitan con las posiciones de los
+        saltos de línea y los ';'. Desde el primer bloque que tenga comillas
+        o un retorno de carro suelto, el resto del archivo se lee con
+        csv.reader. Las líneas en blanco se omiten, como hace csv.DictReader.
+        
+        Args:
+            f: Archivo abierto en modo binario y situado tras el encabezado.
+            campos: Número de campos por fila.
+            posiciones: Posición en la fila de cada columna de _COLUMNAS_CSV.
+            
+        Yields:
+            Tuplas (pids, firmas de los pids o None, columnas numéricas en el
+            orden de _COLUMNAS_CSV).
+            
+        Raises:
+            ValueError: Si alguna fila no tiene el número de campos esperado.
+        """
+        pendiente = b""
+        while True:
+            leido = f.read(_BYTES_BLOQUE_CSV)
+            pendiente += leido
+            if b'"' in pendiente:
+                break
+            corte = pendiente.rfind(b"\n") + 1 if leido else len(pendiente)
+            bloque, pendiente = pendiente[:corte], pendiente[corte:]
+            if bloque.strip(b"\r\n"):
+                convertido = TablaProcesos._bloque_bytes(bloque, campos, posiciones)
+                if convertido is None:
+                    pendiente = bloque + pendiente
+                    break
+                yield convertido
+            if not leido:
+                return
+
+        # Completar la línea en curso: csv.reader no une filas partidas
+        inicio = io.StringIO((pendiente + f.readline()).decode("utf-8"), newline="")
+        lector = csv.reader(chain(inicio, io.TextIOWrapper(f, encoding="utf-8", newline="")), delimiter=';')
+        while True:
+            filas = [fila for fila in islice(lector, 100_000) if fila]
+            if not filas:
+                return
+            if any(len(fila) != campos for fila in filas):
+                raise ValueError("Alguna fila no tiene el número de columnas del encabezado")
+            columnas = list(zip(*filas))
+            pids = list(columnas[posiciones[0]])
+            _validar_pids(pids)
+            yield (pids, None,
+                   [_columna_csv(list(columnas[posicion]), nombre, nombre in ("tiempo_inicio", "tiempo_fin"))
+                    for nombre, posicion in zip(_COLUMNAS_CSV[1:], posiciones[1:])])
+
+    @staticmethod
+    def _bloque_bytes(bloque: bytes, campos: int,
+                      posiciones: List[int]) -> Optional[Tuple[List[str], np.ndarray, List[np.ndarray]]]:
+        """
+        Convierte un bloque de líneas completas sin comillas; ver _bloques_csv.
+        
+        Devuelve None si el bloque tiene un retorno de carro que no precede a
+        un salto de línea: el módulo csv lo trata como un fin de fila, así que
+        el bloque se le deja a él.
+        """
+        if not bloque.endswith(b"\n"):
+            bloque += b"\n"
+        datos = np.frombuffer(bloque, dtype=np.uint8)
+        saltos = np.flatnonzero(datos == ord("\n"))
+        if bloque.count(b"\r") != np.count_nonzero(datos.take(saltos - 1, mode="clip") == ord("\r")):
+            return None
+        separadores = np.flatnonzero(datos == ord(";"))
+        n = len(saltos)
+        if len(separadores) != n * (campos - 1):
+            # Líneas en blanco (o filas mal formadas): se quitan y se reintenta
+            limpio = b"\n".join(linea for linea in bloque.replace(b"\r\n", b"\n").split(b"\n") if linea)
+            datos = np.frombuffer(limpio + b"\n", dtype=np.uint8)
+            saltos = np.flatnonzero(datos == ord("\n"))
+            separadores = np.flatnonzero(datos == ord(";"))
+            n = len(saltos)
+        separadores = separadores.reshape(n, campos - 1) if len(separadores) == n * (campos - 1) else None
+        if (separadores is None or (separadores[:, -1] > saltos).any()
+                or (separadores[1:, 0] < saltos[:-1]).any()):
+            raise ValueError("Alguna fila no tiene el número de columnas del encabezado")
+
+        # La última celda de cada línea termina en su salto o en el \r que lo precede
+        fin_linea = saltos - (datos.take(saltos - 1, mode="clip") == ord("\r"))
+        inicio_linea = np.concatenate(([0], saltos[:-1] + 1))
+
+        def limites(posicion: int) -> Tuple[np.ndarray, np.ndarray]:
+            inicios = inicio_linea if posicion == 0 else separadores[:, posicion - 1] + 1
+            fines = fin_linea if posicion == campos - 1 else separadores[:, posicion]
+            return inicios, fines
+
+        inicios, fines = limites(posiciones[0])
+        celdas = _celdas_csv(datos, inicios, fines)
+        pids = _textos_csv(celdas)
+        if _pids_en_blanco(celdas, pids):
+            raise ValueError("El PID debe ser una cadena no vacía")
+        columnas = [_enteros_csv(datos, *limites(posicion), nombre, nombre in ("tiempo_inicio", "tiempo_fin"))
+                    for nombre, posicion in zip(_COLUMNAS_CSV[1:], posiciones[1:])]
+        return pids, _firmas_pids(celdas), columnas
+
+    def guardar_binario(self, archivo: str) -> None:
+        """
+        Guarda la tabla en formato binario por columnas.
+        
+        Las columnas se vuelcan tal cual, sin convertir a texto, en una sola
+        pasada. Se escribe en un archivo temporal que después sustituye al
+        destino, de modo que una tabla abierta con abrir_binario sobre el
+        archivo anterior sigue siendo válida.
+        
+        Args:
+            archivo: Ruta del archivo.
+            
+        Raises:
+            IOError: Si no se puede escribir en el archivo.
+        """
+        codificados = [pid.encode("utf-8") for pid in self.pids]
+        desplazamientos = np.zeros(len(codificados) + 1, dtype="<i8")
+        np.cumsum([len(pid) for pid in codificados], out=desplazamientos[1:])
+        cabecera = np.array([(_FIRMA_BINARIA, len(self), desplazamientos[-1])], dtype=_CABECERA_BINARIA)
+        directorio = os.path.dirname(os.path.abspath(archivo))
+        try:
+            descriptor, temporal = tempfile.mkstemp(dir=directorio, suffix=".tmp")
+            try:
+                with os.fdopen(descriptor, "wb") as f:
+                    f.write(cabecera.tobytes())
+                    for nombre in _COLUMNAS_BINARIAS:
+                        f.write(np.ascontiguousarray(getattr(self, nombre), dtype="<i8").tobytes())
+                    f.write(desplazamientos.tobytes())
+                    f.write(b"".join(codificados))
+                os.replace(temporal, archivo)
+            except BaseException:
+                os.remove(temporal)
+                raise
+        except IOError as e:
+            raise IOError(f"Error al guardar en binario: {e}")
+
+    @classmethod
+    def abrir_binario(cls, archivo: str) -> "TablaProcesos":
+        """
+        Abre una tabla guardada con guardar_binario proyectándola en memoria.
+        
+        Las columnas son vistas sobre el archivo mapeado con mmap: abrirlo
+        cuesta lo mismo sea cual sea su tamaño, y el sistema operativo lee
+        cada página la primera vez que se usa. Los cambios en la tabla (por
+        ejemplo al planificarla) quedan en memoria y no modifican el archivo.
+        Los datos no se vuelven a validar, ya que se escribieron desde una
+        tabla válida.
+        
+        Args:
+            archivo: Ruta del archivo.
+            
+        Returns:
+            Nueva TablaProcesos respaldada por el archivo.
+            
+        Raises:
+            IOError: Si no se puede leer el archivo.
+            ValueError: Si el archivo no tiene el formato binario de tabla.
+        """
+        try:
+            with open(archivo, "rb") as f:
+                tamano = os.fstat(f.fileno()).st_size
+                if tamano < _CABECERA_BINARIA.itemsize:
+                    raise ValueError("El archivo no es una tabla de procesos binaria")
+                mapa = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        except IOError as e:
+            raise IOError(f"Error al cargar desde binario: {e}")
+
+        cabecera = np.frombuffer(mapa, dtype=_CABECERA_BINARIA, count=1)[0]
+        n, bytes_pids = int(cabecera["n"]), int(cabecera["bytes_pids"])
+        columnas = len(_COLUMNAS_BINARIAS) * n * 8
+        if (cabecera["firma"] != _FIRMA_BINARIA or n < 0 or bytes_pids < 0
+                or tamano != _CABECERA_BINARIA.itemsize + columnas + (n + 1) * 8 + bytes_pids):
+            raise ValueError("El archivo no es una tabla de procesos binaria")
+
+        tabla = cls.__new__(cls)
+        posicion = _CABECERA_BINARIA.itemsize
+        for nombre in _COLUMNAS_BINARIAS:
+            setattr(tabla, nombre, np.frombuffer(mapa, dtype="<i8", count=n, offset=posicion))
+            posicion += n * 8
+        desplazamientos = np.frombuffer(mapa, dtype="<i8", count=n + 1, offset=posicion)
+        posicion += (n + 1) * 8
+        tabla.pids = _TablaPids(desplazamientos, memoryview(mapa)[posicion:])
+        tabla._indices = None
+        return tabla
+
+    @classmethod
+    def desde_repositorio(cls, repositorio: RepositorioProcesos) -> "TablaProcesos":
+        """
+        Construye una tabla con el estado completo de los procesos de un repositorio.
+        
+        Args:
+            repositorio: Repositorio de origen.
+            
+        Returns:
+            Nueva TablaProcesos.
+        """
+        procesos = repositorio.listar()
+        tabla = cls(
+            [p.pid for p in procesos],
+            [p.duracion for p in procesos],
+            [p.prioridad for p in procesos],
+            [p.tiempo_llegada for p in procesos]
+        )
+        tabla.tiempo_restante[:] = [p.tiempo_restante for p in procesos]
+        tabla.tiempo_inicio[:] = [SIN_TIEMPO if p.tiempo_inicio is None else p.tiempo_inicio
+                                  for p in procesos]
+        tabla.tiempo_fin[:] = [SIN_TIEMPO if p.tiempo_fin is None else p.tiempo_fin
+                               for p in procesos]
+        return tabla
+
+    def a_repositorio(self) -> RepositorioProcesos:
+        """
+        Crea un repositorio con un Proceso por fila de la tabla.
+        
+        Los procesos se crean con un único lote; después se restaura el
+        estado de ejecución de las filas que ya han empezado.
+        
+        Returns:
+            Nuevo RepositorioProcesos.
+        """
+        repositorio = RepositorioProcesos()
+        procesos = repositorio.agregar_lote(pids=self.pids, duraciones=self.duracion.tolist(),
+                                            prioridades=self.prioridad.tolist(),
+                                            llegadas=self.tiempo_llegada.tolist())
+        empezadas = np.flatnonzero((self.tiempo_restante != self.duracion)
+                                   | (self.tiempo_inicio != SIN_TIEMPO) | (self.tiempo_fin != SIN_TIEMPO))
+        columnas = zip(
+            empezadas.tolist(), self.tiempo_restante[empezadas].tolist(),
+            self.tiempo_inicio[empezadas].tolist(), self.tiempo_fin[empezadas].tolist()
+        )
+        for fila, restante, inicio, fin in columnas:
+            # Restaurar atributos adicionales
+            proceso = procesos[fila]
+            proceso._tiempo_restante = restante
+            proceso._tiempo_inicio = None if inicio == SIN_TIEMPO else inicio
+            proceso._tiempo_fin = None if fin == SIN_TIEMPO else fin
+        return repositorio
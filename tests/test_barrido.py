@@ -0,0 +1,66 @@
+import random
+import unittest
+from src.barrido import Configuracion, barrer, formatear_tabla, rejilla
+from src.metrics import Metrics
+from src.multinucleo import RoundRobinMultinucleoScheduler
+from src.proceso import Proceso
+from src.scheduler import MLFQScheduler, RoundRobinScheduler
+from src.tabla import TablaProcesos
+
+class TestBarrido(unittest.TestCase):
+    def crear_procesos(self):
+        rnd = random.Random(5)
+        return [Proceso(f"P{i}", rnd.randint(1, 20), rnd.randint(0, 5), rnd.randint(0, 100)) for i in range(40)]
+
+    def test_rejilla(self):
+        configuraciones = rejilla("rr_multinucleo", quantum=[2, 4], nucleos=[1, 2, 4])
+        self.assertEqual(len(configuraciones), 6)
+        self.assertEqual(configuraciones[0], Configuracion("rr_multinucleo", (("quantum", 2), ("nucleos", 1))))
+        self.assertEqual(str(configuraciones[-1]), "rr_multinucleo(quantum=4, nucleos=4)")
+        self.assertEqual(rejilla("fcfs"), [Configuracion("fcfs")])
+
+    def test_barrido_coincide_con_ejecucion_directa(self):
+        procesos = self.crear_procesos()
+        configuraciones = (rejilla("rr", quantum=[2, 5]) + rejilla("mlfq", quanta=[(2, 4), (1, 3, 9)])
+                           + rejilla("rr_multinucleo", quantum=[3], nucleos=[2]))
+        filas = barrer(procesos, configuraciones, trabajadores=2)
+        self.assertEqual([fila.configuracion for fila in filas], configuraciones)
+
+        esperados = [RoundRobinScheduler(2), RoundRobinScheduler(5), MLFQScheduler((2, 4)),
+                     MLFQScheduler((1, 3, 9)), RoundRobinMultinucleoScheduler(3, 2)]
+        for fila, scheduler in zip(filas, esperados):
+            copia = [Proceso(p.pid, p.duracion, p.prioridad, p.tiempo_llegada) for p in procesos]
+            metricas = Metrics(copia, scheduler.planificar(copia))
+            self.assertEqual(fila.promedios, metricas.obtener_metricas_promedio())
+            self.assertEqual(fila.percentiles, metricas.obtener_percentiles())
+            self.assertEqual(fila.tiempo_total, max(p.tiempo_fin for p in copia))
+
+        # La carga original no se planifica
+        self.assertTrue(all(p.tiempo_fin is None for p in procesos))
+
+    def test_en_proceso_y_en_paralelo_coinciden(self):
+        procesos = self.crear_procesos()
+        tabla = TablaProcesos([p.pid for p in procesos], [p.duracion for p in procesos],
+                              [p.prioridad for p in procesos], [p.tiempo_llegada for p in procesos])
+        configuraciones = rejilla("fcfs") + rejilla("srtf") + rejilla("cfs") + rejilla("stride", quantum=[1, 4])
+        secuencial = barrer(procesos, configuraciones, trabajadores=1)
+        paralelo = barrer(tabla, configuraciones, trabajadores=3)
+        self.assertEqual([(f.promedios, f.percentiles, f.tiempo_total) for f in secuencial],
+                         [(f.promedios, f.percentiles, f.tiempo_total) for f in paralelo])
+
+        texto = formatear_tabla(paralelo)
+        self.assertEqual(len(texto.splitlines()), len(configuraciones) + 2)
+        self.assertIn("stride(quantum=4)", texto)
+
+    def test_invalid_barrido(self):
+        with self.assertRaises(ValueError):
+            rejilla("desconocido")
+        with self.assertRaises(ValueError):
+            rejilla("rr", quantum=[])
+        with self.assertRaises(ValueError):
+            barrer([], rejilla("fcfs"))
+        with self.assertRaises(ValueError):
+            barrer(self.crear_procesos(), [Configuracion("desconocido")])
+
+if __name__ == "__main__":
+    unittest.main()
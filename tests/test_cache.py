@@ -0,0 +1,88 @@
+import os
+import tempfile
+import unittest
+from src.cache import CacheResultados
+from src.proceso import Proceso
+from src.repositorio import RepositorioProcesos
+from src.scheduler import FCFSScheduler, LoteriaScheduler, RoundRobinScheduler
+
+class TestCacheResultados(unittest.TestCase):
+    def setUp(self):
+        self.repositorio = RepositorioProcesos()
+        for pid, duracion, prioridad, llegada in [("A", 5, 1, 0), ("B", 3, 2, 1), ("C", 8, 0, 4)]:
+            self.repositorio.agregar(Proceso(pid, duracion, prioridad, llegada))
+
+    def test_aciertos_y_lru(self):
+        cache = CacheResultados(capacidad=2)
+        primera = cache.obtener(self.repositorio, RoundRobinScheduler(2))
+        self.assertIs(cache.obtener(self.repositorio, RoundRobinScheduler(2)), primera)
+        self.assertEqual((cache.aciertos, cache.fallos), (1, 1))
+        self.assertEqual(primera.resultado.tiempos_por_proceso(),
+                         RoundRobinScheduler(2).planificar_resultado(self.repositorio.listar()).tiempos_por_proceso())
+        self.assertEqual(primera.metricas.num_procesos, 3)
+        self.assertTrue(all(p.tiempo_fin is None for p in self.repositorio.listar()))
+
+        cache.obtener(self.repositorio, FCFSScheduler())
+        cache.obtener(self.repositorio, RoundRobinScheduler(2))  # Pasa a ser la más reciente
+        cache.obtener(self.repositorio, RoundRobinScheduler(4))  # Descarta FCFS
+        self.assertEqual(len(cache), 2)
+        cache.obtener(self.repositorio, FCFSScheduler())
+        self.assertEqual((cache.aciertos, cache.fallos), (2, 4))
+
+    def test_cambios_invalidan(self):
+        cache = CacheResultados()
+        antes = cache.obtener(self.repositorio, FCFSScheduler())
+        self.repositorio.agregar(Proceso("D", 2, 0, 0))
+        self.assertEqual(len(cache), 0)
+        despues = cache.obtener(self.repositorio, FCFSScheduler())
+        self.assertEqual(len(despues.resultado), 4)
+
+        self.repositorio.eliminar("D")
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.obtener(self.repositorio, FCFSScheduler()).resultado.tiempos_por_proceso(),
+                         antes.resultado.tiempos_por_proceso())
+        self.repositorio.agregar_lote([("E", 1, 0)])
+        self.assertEqual(len(cache), 0)
+
+    def test_repositorios_nuevos_se_observan(self):
+        # Los repositorios temporales se liberan y sus id se pueden reutilizar
+        cache = CacheResultados()
+        for i in range(20):
+            repositorio = RepositorioProcesos()
+            repositorio.agregar(Proceso("A", 5, 1, 0))
+            cache.obtener(repositorio, FCFSScheduler())
+            repositorio.agregar(Proceso(f"X{i}", 1, 0, 0))
+            self.assertEqual(len(cache), 0)
+            del repositorio
+
+    def test_nivel_en_disco(self):
+        with tempfile.TemporaryDirectory() as directorio:
+            cache = CacheResultados(capacidad=1, directorio=directorio)
+            esperado = cache.obtener(self.repositorio, RoundRobinScheduler(3)).resultado.tiempos_por_proceso()
+            cache.obtener(self.repositorio, FCFSScheduler())  # Pasa RR a disco
+            self.assertEqual(len(os.listdir(directorio)), 1)
+
+            # Otra caché sobre el mismo directorio reutiliza la entrada
+            otra = CacheResultados(capacidad=1, directorio=directorio)
+            entrada = otra.obtener(self.repositorio, RoundRobinScheduler(3))
+            self.assertEqual(otra.aciertos, 1)
+            self.assertEqual(entrada.resultado.tiempos_por_proceso(), esperado)
+            self.assertEqual(list(entrada.resultado.gantt),
+                             RoundRobinScheduler(3).planificar_resultado(self.repositorio.listar()).gantt.expandir())
+
+            self.repositorio.eliminar("A")
+            self.assertEqual(os.listdir(directorio), [])
+
+    def test_no_reproducible_no_se_guarda(self):
+        cache = CacheResultados()
+        cache.obtener(self.repositorio, LoteriaScheduler(2))
+        self.assertEqual(len(cache), 0)
+        cache.obtener(self.repositorio, LoteriaScheduler(2, semilla=1))
+        self.assertEqual(len(cache), 1)
+
+    def test_invalid_capacidad(self):
+        with self.assertRaises(ValueError):
+            CacheResultados(capacidad=0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+import os
+import pickle
+import random
+import tempfile
+import unittest
+from src.proceso import Proceso
+from src.scheduler import RoundRobinScheduler
+from src.metrics import Metrics
+from src.gantt import GanttBuffer, GanttComprimido, SegmentoRR, DTYPE_ENTRADA
+
+class TestGanttComprimido(unittest.TestCase):
+    def test_segmento_expandido(self):
+        segmento = SegmentoRR(inicio=10, quantum=2, vueltas=2, pids=("A", "B"), cierre=(1, 2))
+        self.assertEqual(segmento.num_entradas, 6)
+        self.assertEqual(segmento.fin, 21)
+        self.assertEqual(list(segmento.entradas()), [
+            ("A", 10, 12), ("B", 12, 14),
+            ("A", 14, 16), ("B", 16, 18),
+            ("A", 18, 19), ("B", 19, 21)
+        ])
+        self.assertEqual(pickle.loads(pickle.dumps(segmento)), segmento)
+        self.assertNotEqual(segmento, SegmentoRR(10, 2, 2, ("A", "B"), (2, 2)))
+
+    def test_expandir_coincide_con_planificar(self):
+        duraciones = [7, 3, 12, 1, 9]
+        procesos = [Proceso(f"C{i}", d, 0) for i, d in enumerate(duraciones)]
+        comprimido = RoundRobinScheduler(quantum=2).planificar_comprimido(procesos)
+        copia = [Proceso(f"C{i}", d, 0) for i, d in enumerate(duraciones)]
+        esperado = RoundRobinScheduler(quantum=2).planificar(copia)
+
+        self.assertEqual(comprimido.expandir(), esperado)
+        self.assertEqual(len(comprimido), len(esperado))
+        tiempos = comprimido.tiempos_por_proceso()
+        for proceso in copia:
+            self.assertEqual(tiempos[proceso.pid], (proceso.tiempo_inicio, proceso.tiempo_fin))
+
+    def test_duraciones_enormes(self):
+        procesos = [Proceso("G1", 10**9, 0), Proceso("G2", 3 * 10**8, 0), Proceso("G3", 5, 0)]
+        comprimido = RoundRobinScheduler(quantum=1).planificar_comprimido(procesos)
+        # Un segmento por cada proceso que termina
+        self.assertEqual(len(comprimido.segmentos), 3)
+        self.assertEqual(len(comprimido), 10**9 + 3 * 10**8 + 5)
+        self.assertEqual(procesos[2].tiempo_fin, 15)
+        self.assertEqual(procesos[1].tiempo_fin, 6 * 10**8 + 5)
+        self.assertEqual(procesos[0].tiempo_fin, 10**9 + 3 * 10**8 + 5)
+        # La expansión es perezosa
+        primeras = []
+        for entrada in comprimido:
+            primeras.append(entrada)
+            if len(primeras) == 4:
+                break
+        self.assertEqual(primeras, [("G1", 0, 1), ("G2", 1, 2), ("G3", 2, 3), ("G1", 3, 4)])
+
+    def test_rotaciones_comparten_los_pids(self):
+        generador = random.Random(3)
+        duraciones = list(range(1, 401))
+        generador.shuffle(duraciones)
+        procesos = [Proceso(f"R{i}", d, 0, 7 * (i % 3)) for i, d in enumerate(duraciones)]
+        copia = [Proceso(f"R{i}", d, 0, 7 * (i % 3)) for i, d in enumerate(duraciones)]
+        comprimido = RoundRobinScheduler(quantum=1).planificar_comprimido(procesos)
+        esperado = RoundRobinScheduler(quantum=1).planificar(copia)
+
+        self.assertEqual(comprimido.expandir(), esperado)
+        self.assertEqual(len(comprimido), len(esperado))
+        self.assertEqual(pickle.loads(pickle.dumps(comprimido)).expandir(), esperado)
+        # Cada segmento vive con cientos de procesos, pero los pids de sus
+        # rotaciones no se repiten en cada uno
+        self.assertGreater(sum(len(segmento.pids) for segmento in comprimido.segmentos), 60000)
+        self.assertLess(len(pickle.dumps(comprimido)), 100000)
+        # Los índices sueltos coinciden con la columna materializada
+        for segmento in comprimido.segmentos[::40]:
+            for columna in (segmento.pids, segmento.cierre):
+                valores = tuple(columna)
+                for indice in (0, len(valores) // 2, -1):
+                    self.assertEqual(columna[indice], valores[indice])
+                self.assertEqual(columna[1:3], valores[1:3])
+                with self.assertRaises(IndexError):
+                    columna[len(valores)]
+
+    def test_vacio(self):
+        comprimido = GanttComprimido([])
+        self.assertEqual(len(comprimido), 0)
+        self.assertEqual(comprimido.expandir(), [])
+
+class TestGanttBuffer(unittest.TestCase):
+    def setUp(self):
+        self.entradas = [(f"P{i % 7}", 3 * i, 3 * i + 3) for i in range(1000)]
+
+    def test_ida_y_vuelta(self):
+        buffer = GanttBuffer.desde_iterable(iter(self.entradas), capacidad_inicial=8)
+        self.assertEqual(len(buffer), 1000)
+        self.assertEqual(buffer.expandir(), self.entradas)
+        self.assertEqual(DTYPE_ENTRADA.itemsize, 20)
+        self.assertEqual(buffer.nbytes, 20 * 1000)
+        self.assertFalse(buffer.en_disco)
+
+    def test_indices_y_cortes(self):
+        buffer = GanttBuffer.desde_iterable(self.entradas)
+        self.assertEqual(buffer[0], self.entradas[0])
+        self.assertEqual(buffer[-1], self.entradas[-1])
+        with self.assertRaises(IndexError):
+            buffer[1000]
+        vista = buffer[10:20]
+        self.assertEqual(list(vista), self.entradas[10:20])
+        self.assertEqual(list(buffer[::100]), self.entradas[::100])
+        with self.assertRaises(ValueError):
+            vista.agregar(("P1", 0, 1))  # Las vistas son de solo lectura
+
+    def test_volcado_a_disco(self):
+        with tempfile.TemporaryDirectory() as directorio:
+            buffer = GanttBuffer(capacidad_inicial=16, limite_memoria=100, directorio=directorio)
+            buffer.TAM_BLOQUE = 64
+            buffer.extender(self.entradas)
+            self.assertTrue(buffer.en_disco)
+            self.assertEqual(len(os.listdir(directorio)), 1)
+            self.assertEqual(buffer.expandir(), self.entradas)
+            self.assertEqual(buffer[500], self.entradas[500])
+            buffer.cerrar()
+            self.assertEqual(os.listdir(directorio), [])
+            self.assertEqual(len(buffer), 0)
+
+    def test_pid_invalido(self):
+        buffer = GanttBuffer()
+        with self.assertRaises(ValueError):
+            buffer.agregar(("", 0, 1))
+        with self.assertRaises(ValueError):
+            GanttBuffer(limite_memoria=0)
+
+    def test_planificar_buffer_y_metrics(self):
+        procesos = [Proceso("P1", 5, 1), Proceso("P2", 3, 2), Proceso("P3", 2, 1)]
+        buffer = RoundRobinScheduler(quantum=2).planificar_buffer(procesos)
+        self.assertEqual(buffer.expandir(), [
+            ("P1", 0, 2), ("P2", 2, 4), ("P3", 4, 6),
+            ("P1", 6, 8), ("P2", 8, 9), ("P1", 9, 10)
+        ])
+        metrics = Metrics(procesos, buffer)
+        self.assertAlmostEqual(metrics.obtener_metricas_promedio()["promedio_espera"], 5.0, places=3)
+        with self.assertRaises(ValueError):
+            Metrics(procesos, GanttBuffer())  # Buffer vacío
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import random
+import time
+import unittest
+from src.incremental import FCFSIncremental, RoundRobinIncremental
+from src.proceso import Proceso
+from src.repositorio import RepositorioProcesos
+from src.scheduler import FCFSScheduler, RoundRobinScheduler
+
+class TestPlanificacionIncremental(unittest.TestCase):
+    def comprobar(self, plan, scheduler, repositorio):
+        resultado = plan.resultado()
+        esperado = scheduler.planificar_resultado(repositorio.listar())
+        self.assertEqual(resultado.pids, esperado.pids)
+        self.assertEqual(list(resultado.gantt), esperado.gantt.expandir())
+        self.assertEqual(resultado.tiempos_por_proceso(), esperado.tiempos_por_proceso())
+
+    def test_coincide_con_planificar_desde_cero(self):
+        rnd = random.Random(8)
+        for _ in range(150):
+            repositorio = RepositorioProcesos()
+            for i in range(rnd.randint(0, 12)):
+                repositorio.agregar(Proceso(f"P{i}", rnd.randint(1, 12), 0, rnd.randint(0, 40)))
+            quantum = rnd.randint(1, 5)
+            planes = [(FCFSIncremental(repositorio), FCFSScheduler()),
+                      (RoundRobinIncremental(repositorio, quantum), RoundRobinScheduler(quantum))]
+            for paso in range(20):
+                plan = planes[paso % 2][0]
+                if repositorio.listar() and rnd.random() < 0.4:
+                    plan.eliminar(rnd.choice(repositorio.listar()).pid)
+                else:
+                    llegada = rnd.choice([0, rnd.randint(0, 60), rnd.randint(0, 200)])
+                    plan.agregar(Proceso(f"N{paso}", rnd.randint(1, 12), 0, llegada))
+                if repositorio.listar():
+                    for plan_, scheduler in planes:
+                        self.comprobar(plan_, scheduler, repositorio)
+
+    def test_agregar_al_final_solo_alarga_la_cola(self):
+        repositorio = RepositorioProcesos()
+        for i in range(5):
+            repositorio.agregar(Proceso(f"P{i}", 4, 0, 2 * i))
+        plan = FCFSIncremental(repositorio)
+        plan.agregar(Proceso("X", 3, 0, 100))
+        self.assertEqual(plan.resultado().tiempos_por_proceso()["X"], (100, 103))
+        plan.eliminar("P0")
+        self.assertEqual(plan.resultado().tiempos_por_proceso()["P1"], (2, 6))
+        self.comprobar(plan, FCFSScheduler(), repositorio)
+
+    def test_cambios_externos_replanifican(self):
+        repositorio = RepositorioProcesos()
+        repositorio.agregar_lote([("A", 5, 0), ("B", 3, 0)])
+        plan = RoundRobinIncremental(repositorio, 2)
+        repositorio.agregar(Proceso("C", 4, 0, 1))
+        self.comprobar(plan, RoundRobinScheduler(2), repositorio)
+        plan.eliminar("A")
+        self.comprobar(plan, RoundRobinScheduler(2), repositorio)
+
+    def test_segmento_largo_escala_linealmente(self):
+        # Un único segmento de muchas vueltas: reanudarlo tras el final de
+        # la cola no debe costar más que replanificar desde cero
+        n = 16000
+        repositorio = RepositorioProcesos()
+        repositorio.agregar_lote(pids=[f"P{i}" for i in range(n)], duraciones=[40] * n,
+                                 prioridades=[0] * n)
+        plan = RoundRobinIncremental(repositorio, 2)
+        inicio = time.perf_counter()
+        plan.agregar(Proceso("X", 5, 0, 3 * n + 1))
+        incremental = time.perf_counter() - inicio
+        inicio = time.perf_counter()
+        RoundRobinScheduler(2).planificar_resultado(repositorio.listar())
+        completo = time.perf_counter() - inicio
+        self.assertLess(incremental, 2 * completo + 0.05)
+        self.comprobar(plan, RoundRobinScheduler(2), repositorio)
+
+    def test_invalid_incremental(self):
+        repositorio = RepositorioProcesos()
+        with self.assertRaises(ValueError):
+            RoundRobinIncremental(repositorio, 0)
+        plan = FCFSIncremental(repositorio)
+        with self.assertRaises(ValueError):
+            plan.resultado()
+        with self.assertRaises(ValueError):
+            plan.eliminar("P1")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,12 +1,11 @@
+import random
 import unittest
 from src.proceso import Proceso
 from src.scheduler import FCFSScheduler, RoundRobinScheduler
-from src.metrics import Metrics
+from src.metrics import Metrics, MetricasIncrementales, SketchCuantiles
 
 class TestMetrics(unittest.TestCase):
     def setUp(self):
-        # Limpiar PIDs usados antes de cada prueba
-        Proceso._pids_usados.clear()
         # Crear procesos de prueba
         self.procesos = [
             Proceso("P1", 5, 1),
@@ -79,6 +78,15 @@ class TestMetrics(unittest.TestCase):
         self.assertAlmostEqual(metricas_promedio["promedio_retorno"], 8.333, places=3)
         self.assertAlmostEqual(metricas_promedio["promedio_espera"], 5.0, places=3)
 
+    def test_metrics_round_robin_comprimido(self):
+        scheduler = RoundRobinScheduler(quantum=2)
+        gantt = scheduler.planificar_comprimido(self.procesos)
+        metrics = Metrics(self.procesos, gantt)
+        metricas_por_proceso = metrics.obtener_metricas_por_proceso()
+        self.assertEqual(metricas_por_proceso["P1"], {"tiempo_respuesta": 0, "tiempo_retorno": 10, "tiempo_espera": 5})
+        self.assertEqual(metricas_por_proceso["P2"], {"tiempo_respuesta": 2, "tiempo_retorno": 9, "tiempo_espera": 6})
+        self.assertEqual(metricas_por_proceso["P3"], {"tiempo_respuesta": 4, "tiempo_retorno": 6, "tiempo_espera": 4})
+
     def test_invalid_input(self):
         scheduler = FCFSScheduler()
         gantt = scheduler.planificar(self.procesos)
@@ -95,5 +103,92 @@ class TestMetrics(unittest.TestCase):
         with self.assertRaises(ValueError):
             Metrics(self.procesos, [("P1", 0)])  # Tupla incompleta
 
+class TestMetricasIncrementales(unittest.TestCase):
+    def test_sketch_error_relativo(self):
+        generador = random.Random(11)
+        valores = [int(generador.expovariate(1 / 5000)) for _ in range(20000)]
+        sketch = SketchCuantiles(precision=0.01)
+        for valor in valores:
+            sketch.agregar(valor)
+        ordenados = sorted(valores)
+        for q in (0.5, 0.95, 0.99):
+            exacto = ordenados[int(q * (len(ordenados) - 1))]
+            self.assertLessEqual(abs(sketch.cuantil(q) - exacto), 0.01 * exacto)
+        # La memoria depende del rango de valores, no de cuántos hay
+        self.assertLess(len(sketch._cubetas), 1000)
+
+    def test_sketch_lote_y_merge(self):
+        valores = list(range(0, 3000, 7))
+        individual = SketchCuantiles(0.02)
+        for valor in valores:
+            individual.agregar(valor)
+        mitad_a, mitad_b = SketchCuantiles(0.02), SketchCuantiles(0.02)
+        mitad_a.agregar_lote(valores[:200])
+        mitad_b.agregar_lote(valores[200:])
+        mitad_a.merge(mitad_b)
+        self.assertEqual(mitad_a.total, individual.total)
+        for q in (0, 0.25, 0.5, 0.9, 1):
+            self.assertEqual(mitad_a.cuantil(q), individual.cuantil(q))
+        with self.assertRaises(ValueError):
+            mitad_a.merge(SketchCuantiles(0.05))
+        with self.assertRaises(ValueError):
+            individual.agregar(-1)
+        with self.assertRaises(ValueError):
+            SketchCuantiles(0)
+
+    def test_acumulador_coincide_con_metrics(self):
+        procesos = [Proceso("P1", 5, 1), Proceso("P2", 3, 2), Proceso("P3", 2, 1)]
+        gantt = RoundRobinScheduler(quantum=2).planificar(procesos)
+        metrics = Metrics(procesos, gantt)
+
+        acumulador = MetricasIncrementales()
+        for proceso in procesos:
+            acumulador.agregar(proceso)
+        self.assertEqual(acumulador.num_procesos, 3)
+        self.assertEqual(acumulador.obtener_metricas_promedio(), metrics.obtener_metricas_promedio())
+        self.assertEqual(metrics.obtener_percentiles((100,))["tiempo_espera"]["p100"], 6)
+        self.assertEqual(acumulador.percentil("tiempo_retorno", 0), 6)
+        self.assertIn("p95", str(acumulador))
+        # El acumulador de Metrics se construye al pedirlo
+        self.assertEqual(metrics.acumulador.obtener_percentiles(), acumulador.obtener_percentiles())
+        self.assertIs(metrics.acumulador, metrics.acumulador)
+
+    def test_merge_de_fragmentos(self):
+        completo = MetricasIncrementales()
+        fragmentos = [MetricasIncrementales() for _ in range(3)]
+        for i in range(300):
+            tiempos = (i, 2 * i + 1, i + 1)
+            completo.agregar_tiempos(*tiempos)
+            fragmentos[i % 3].agregar_tiempos(*tiempos)
+        fragmentos[0].merge(fragmentos[1])
+        fragmentos[0].merge(fragmentos[2])
+        self.assertEqual(fragmentos[0].obtener_metricas_promedio(), completo.obtener_metricas_promedio())
+        self.assertEqual(fragmentos[0].obtener_percentiles(), completo.obtener_percentiles())
+
+    def test_fallo_no_modifica_el_acumulador(self):
+        acumulador = MetricasIncrementales()
+        acumulador.agregar_tiempos(1, 2, 3)
+        antes = (acumulador.num_procesos, acumulador.obtener_metricas_promedio(), acumulador.obtener_percentiles())
+        with self.assertRaises(ValueError):
+            acumulador.agregar_tiempos(5, -1, 2)
+        with self.assertRaises(ValueError):
+            acumulador.agregar_tiempos(5, 2.5, 2)
+        with self.assertRaises(ValueError):
+            acumulador.agregar_lote([5, 6], [7, 8], [2, -3])
+        self.assertEqual((acumulador.num_procesos, acumulador.obtener_metricas_promedio(),
+                          acumulador.obtener_percentiles()), antes)
+
+    def test_acumulador_invalido(self):
+        acumulador = MetricasIncrementales()
+        with self.assertRaises(ValueError):
+            acumulador.obtener_metricas_promedio()  # Vacío
+        with self.assertRaises(ValueError):
+            acumulador.agregar(Proceso("P9", 4, 1))  # Sin planificar
+        acumulador.agregar_tiempos(1, 2, 3)
+        with self.assertRaises(ValueError):
+            acumulador.percentil("tiempo_total", 50)
+        with self.assertRaises(ValueError):
+            acumulador.percentil("tiempo_espera", 101)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
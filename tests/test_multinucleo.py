@@ -0,0 +1,71 @@
+import random
+import unittest
+from src.proceso import Proceso
+from src.metrics import Metrics
+from src.multinucleo import FCFSMultinucleoScheduler, RoundRobinMultinucleoScheduler
+from src.scheduler import FCFSScheduler, RoundRobinScheduler
+from src.tabla import TablaProcesos
+
+class TestMultinucleo(unittest.TestCase):
+    def crear_procesos(self):
+        return [Proceso("A", 5, 0), Proceso("B", 3, 0), Proceso("C", 2, 0), Proceso("D", 4, 0)]
+
+    def test_fcfs_dos_nucleos(self):
+        procesos = self.crear_procesos()
+        resultado = FCFSMultinucleoScheduler(nucleos=2).planificar_multinucleo(procesos)
+        self.assertEqual(resultado.por_nucleo, [
+            [("A", 0, 5), ("D", 5, 9)],
+            [("B", 0, 3), ("C", 3, 5)]
+        ])
+        self.assertEqual(resultado.tiempo_total, 9)
+        self.assertEqual(resultado.utilizacion(), [1.0, 5 / 9])
+        self.assertEqual([p.tiempo_fin for p in procesos], [5, 3, 5, 9])
+
+    def test_un_nucleo_equivale_a_un_solo_procesador(self):
+        rnd = random.Random(4)
+        for _ in range(50):
+            datos = [(f"P{i}", rnd.randint(1, 12), 0, rnd.randint(0, 30)) for i in range(rnd.randint(1, 10))]
+            quantum = rnd.randint(1, 4)
+            esperado_rr = RoundRobinScheduler(quantum).planificar([Proceso(*fila) for fila in datos])
+            esperado_fcfs = FCFSScheduler().planificar([Proceso(*fila) for fila in datos])
+            for colas_por_nucleo in (False, True):
+                rr = RoundRobinMultinucleoScheduler(quantum, 1, colas_por_nucleo)
+                fcfs = FCFSMultinucleoScheduler(1, colas_por_nucleo)
+                self.assertEqual(rr.planificar([Proceso(*fila) for fila in datos]), esperado_rr)
+                self.assertEqual(fcfs.planificar([Proceso(*fila) for fila in datos]), esperado_fcfs)
+
+    def test_robo_de_trabajo(self):
+        procesos = [Proceso("A", 10, 0), Proceso("B", 1, 0), Proceso("C", 1, 0), Proceso("D", 1, 0)]
+        resultado = FCFSMultinucleoScheduler(2, colas_por_nucleo=True).planificar_multinucleo(procesos)
+        # C estaba en la cola del núcleo 0, ocupado con A: el núcleo 1 la roba
+        self.assertEqual(resultado.por_nucleo[1], [("B", 0, 1), ("D", 1, 2), ("C", 2, 3)])
+        self.assertEqual(resultado.robos, 1)
+
+    def test_metricas_y_tabla(self):
+        rnd = random.Random(9)
+        n = 200
+        pids = [f"P{i}" for i in range(n)]
+        duraciones = [rnd.randint(1, 20) for _ in range(n)]
+        llegadas = [rnd.randint(0, 300) for _ in range(n)]
+        procesos = [Proceso(p, d, 0, a) for p, d, a in zip(pids, duraciones, llegadas)]
+        tabla = TablaProcesos(pids, duraciones, [0] * n, llegadas)
+
+        scheduler = RoundRobinMultinucleoScheduler(quantum=3, nucleos=8, colas_por_nucleo=True)
+        resultado = scheduler.planificar_multinucleo(procesos)
+        resultado_tabla = scheduler.planificar_multinucleo(tabla)
+        self.assertEqual(resultado.por_nucleo, resultado_tabla.por_nucleo)
+        self.assertEqual(sum(resultado.ocupado), sum(duraciones))
+
+        gantt = resultado.gantt()
+        self.assertEqual(gantt, sorted(gantt, key=lambda entrada: entrada[1]))
+        self.assertEqual(Metrics(procesos, gantt).obtener_metricas_promedio(),
+                         Metrics(tabla, resultado_tabla.gantt()).obtener_metricas_promedio())
+
+    def test_invalid_nucleos(self):
+        with self.assertRaises(ValueError):
+            FCFSMultinucleoScheduler(nucleos=0)
+        with self.assertRaises(ValueError):
+            RoundRobinMultinucleoScheduler(quantum=0, nucleos=4)
+
+if __name__ == "__main__":
+    unittest.main()
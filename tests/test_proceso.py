@@ -1,11 +1,10 @@
+import gc
+import threading
 import unittest
-from src.proceso import Proceso
+from src.proceso import Proceso, ErrorLote, recolector_pausado
+from src.repositorio import RepositorioProcesos
 
 class TestProceso(unittest.TestCase):
-    def tearDown(self):
-        # Limpiar los PIDs usados después de cada prueba
-        Proceso._pids_usados.clear()
-
     def test_crear_proceso_valido(self):
         proceso = Proceso("P1", 10, 1)
         self.assertEqual(proceso.pid, "P1")
@@ -17,9 +16,22 @@ class TestProceso(unittest.TestCase):
         self.assertIsNone(proceso.tiempo_fin)
 
     def test_pid_duplicado(self):
-        Proceso("P1", 10, 1)
+        # La unicidad del PID la garantiza el repositorio, no la clase
+        repositorio = RepositorioProcesos()
+        repositorio.agregar(Proceso("P1", 10, 1))
         with self.assertRaises(ValueError):
-            Proceso("P1", 5, 2)
+            repositorio.agregar(Proceso("P1", 5, 2))
+        # Otro repositorio tiene su propio espacio de PIDs
+        otro = RepositorioProcesos()
+        otro.agregar(Proceso("P1", 5, 2))
+        self.assertEqual(otro.obtener("P1").duracion, 5)
+
+    def test_proceso_compacto(self):
+        proceso = Proceso("P1", 10, 1)
+        self.assertFalse(hasattr(proceso, "__dict__"))
+        self.assertFalse(hasattr(Proceso, "__del__"))
+        with self.assertRaises(AttributeError):
+            proceso.atributo_nuevo = 1
 
     def test_pid_invalido(self):
         with self.assertRaises(ValueError):
@@ -39,7 +51,7 @@ class TestProceso(unittest.TestCase):
 
     def test_reducir_tiempo_restante(self):
         proceso = Proceso("P1", 10, 1)
-        procedimiento.reducir_tiempo_restante(3)
+        proceso.reducir_tiempo_restante(3)
         self.assertEqual(proceso.tiempo_restante, 7)
         with self.assertRaises(ValueError):
             proceso.reducir_tiempo_restante(8)  # Excede tiempo restante
@@ -57,5 +69,79 @@ class TestProceso(unittest.TestCase):
         with self.assertRaises(ValueError):
             proceso.establecer_tiempo_fin(20)  # Ya establecido
 
+    def test_crear_lote(self):
+        por_columnas = Proceso.crear_lote(pids=["P1", "P2"], duraciones=[10, 4], prioridades=[1, 0])
+        por_filas = Proceso.crear_lote([("P1", 10, 1), ("P2", 4, 0)])
+        for procesos in (por_columnas, por_filas):
+            self.assertEqual([p.pid for p in procesos], ["P1", "P2"])
+            self.assertEqual(procesos[1].duracion, 4)
+            self.assertEqual(procesos[1].tiempo_restante, 4)
+            self.assertEqual(procesos[1].tiempo_llegada, 0)
+            self.assertIsNone(procesos[1].tiempo_inicio)
+        self.assertEqual(Proceso.crear_lote([]), [])
+
+    def test_crear_lote_con_llegadas(self):
+        por_columnas = Proceso.crear_lote(pids=["P1", "P2"], duraciones=[10, 4], prioridades=[1, 0],
+                                          llegadas=[0, 7])
+        por_filas = Proceso.crear_lote([("P1", 10, 1, 0), ("P2", 4, 0, 7)])
+        mezcladas = Proceso.crear_lote([("P1", 10, 1), ("P2", 4, 0, 7)])
+        for procesos in (por_columnas, por_filas, mezcladas):
+            self.assertEqual([p.tiempo_llegada for p in procesos], [0, 7])
+        with self.assertRaises(ErrorLote) as contexto:
+            Proceso.crear_lote(pids=["P1", "P2", "P3"], duraciones=[1, 2, 3], prioridades=[0, 0, 0],
+                               llegadas=[0, -1, 2.5])
+        self.assertEqual([fila for fila, _ in contexto.exception.errores], [1, 2])
+        with self.assertRaises(ErrorLote):
+            Proceso.crear_lote([("P1", 1, 0, -3)])
+        with self.assertRaises(ValueError):
+            Proceso.crear_lote(pids=["P1"], duraciones=[1], prioridades=[0], llegadas=[0, 1])
+        with self.assertRaises(ValueError):
+            Proceso.crear_lote([("P1", 1, 0)], llegadas=[0])
+
+    def test_crear_lote_reporta_todas_las_filas(self):
+        with self.assertRaises(ErrorLote) as contexto:
+            Proceso.crear_lote([("P1", 10, 1), ("", 5, 1), ("P1", 0, -1), ("P4",), ("P5", 3, 2)])
+        self.assertIsInstance(contexto.exception, ValueError)
+        self.assertEqual([fila for fila, _ in contexto.exception.errores], [1, 2, 2, 2, 3])
+        with self.assertRaises(ValueError):
+            Proceso.crear_lote([("P1", 1, 1)], pids=["P1"])  # Filas y columnas a la vez
+        with self.assertRaises(ValueError):
+            Proceso.crear_lote(pids=["P1"], duraciones=[1, 2], prioridades=[0])
+
+    def test_recolector_pausado(self):
+        self.assertTrue(gc.isenabled())
+        with recolector_pausado():
+            with recolector_pausado():
+                self.assertFalse(gc.isenabled())
+            self.assertFalse(gc.isenabled())  # El bloque exterior sigue abierto
+        self.assertTrue(gc.isenabled())
+        Proceso.crear_lote([("P1", 1, 0)])
+
+        # Bloques de otro hilo que se cierran en otro orden
+        dentro, salir = threading.Event(), threading.Event()
+        def cargar():
+            with recolector_pausado():
+                dentro.set()
+                salir.wait()
+        hilo = threading.Thread(target=cargar)
+        with recolector_pausado():
+            hilo.start()
+            dentro.wait()
+        try:
+            self.assertFalse(gc.isenabled())
+        finally:
+            salir.set()
+            hilo.join()
+        self.assertTrue(gc.isenabled())
+
+        # Si estaba desactivado, sigue desactivado
+        gc.disable()
+        try:
+            with recolector_pausado():
+                pass
+            self.assertFalse(gc.isenabled())
+        finally:
+            gc.enable()
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -2,13 +2,12 @@ import unittest
 import os
 import json
 import csv
-from src.proceso import Proceso
+import tempfile
+from src.proceso import Proceso, ErrorLote
 from src.repositorio import RepositorioProcesos
 
 class TestRepositorioProcesos(unittest.TestCase):
     def setUp(self):
-        # Limpiar PIDs usados antes de cada prueba
-        Proceso._pids_usados.clear()
         self.repositorio = RepositorioProcesos()
         self.proceso1 = Proceso("P1", 5, 1)
         self.proceso2 = Proceso("P2", 3, 2)
@@ -43,6 +42,27 @@ class TestRepositorioProcesos(unittest.TestCase):
         self.assertEqual(self.repositorio.obtener("P1"), self.proceso1)
         self.assertIsNone(self.repositorio.obtener("P2"))
 
+    def test_agregar_lote(self):
+        self.repositorio.agregar(self.proceso1)
+        agregados = self.repositorio.agregar_lote(pids=["L1", "L2"], duraciones=[4, 6], prioridades=[0, 2])
+        self.assertEqual(len(agregados), 2)
+        self.assertEqual(len(self.repositorio.listar()), 3)
+        self.assertEqual(self.repositorio.obtener("L2").prioridad, 2)
+        self.assertEqual(self.repositorio.obtener("L2").tiempo_llegada, 0)
+        self.repositorio.agregar_lote([("L3", 1, 0, 5)])
+        self.repositorio.agregar_lote(pids=["L4"], duraciones=[2], prioridades=[1], llegadas=[9])
+        self.assertEqual(self.repositorio.obtener("L3").tiempo_llegada, 5)
+        self.assertEqual(self.repositorio.obtener("L4").tiempo_llegada, 9)
+
+    def test_agregar_lote_es_atomico(self):
+        self.repositorio.agregar(self.proceso1)
+        with self.assertRaises(ErrorLote) as contexto:
+            self.repositorio.agregar_lote([("L1", 4, 0), ("P1", 2, 0), ("L3", -1, 0)])
+        self.assertEqual([fila for fila, _ in contexto.exception.errores], [1, 2])
+        # Ningún proceso del lote se ha agregado
+        self.assertEqual(len(self.repositorio.listar()), 1)
+        self.assertIsNone(self.repositorio.obtener("L1"))
+
     def test_guardar_cargar_json(self):
         self.repositorio.agregar(self.proceso1)
         self.repositorio.agregar(self.proceso2)
@@ -79,6 +99,16 @@ class TestRepositorioProcesos(unittest.TestCase):
         # Limpiar archivo
         os.remove(archivo)
 
+    def test_cargar_json_pid_duplicado(self):
+        archivo = "test_duplicado.json"
+        item = {"pid": "P1", "duracion": 5, "prioridad": 1, "tiempo_restante": 5,
+                "tiempo_llegada": 0, "tiempo_inicio": None, "tiempo_fin": None}
+        with open(archivo, 'w', encoding='utf-8') as f:
+            json.dump([item, item], f)
+        with self.assertRaises(ValueError):
+            self.repositorio.cargar_json(archivo)
+        os.remove(archivo)
+
     def test_cargar_json_invalido(self):
         archivo = "test_invalido.json"
         with open(archivo, 'w', encoding='utf-8') as f:
@@ -95,5 +125,145 @@ class TestRepositorioProcesos(unittest.TestCase):
             self.repositorio.cargar_csv(archivo)
         os.remove(archivo)
 
+    def test_guardar_cargar_jsonl(self):
+        self.repositorio.agregar(Proceso("P1", 5, 1, 4))
+        self.repositorio.agregar(self.proceso2)
+        archivo = "test_procesos.jsonl"
+        self.repositorio.guardar_jsonl(archivo)
+        RepositorioProcesos.anexar_jsonl(archivo, [Proceso("P3", 7, 0)])
+        with open(archivo, encoding='utf-8') as f:
+            self.assertEqual(len(f.readlines()), 3)
+
+        # Lectura por bloques
+        bloques = list(RepositorioProcesos.leer_jsonl(archivo, tamano_bloque=2))
+        self.assertEqual([[p.pid for p in bloque] for bloque in bloques], [["P1", "P2"], ["P3"]])
+
+        nuevo_repositorio = RepositorioProcesos()
+        nuevo_repositorio.agregar(Proceso("X", 1, 0))
+        nuevo_repositorio.cargar_jsonl(archivo, tamano_bloque=1)
+        self.assertEqual([p.pid for p in nuevo_repositorio.listar()], ["P1", "P2", "P3"])
+        p1 = nuevo_repositorio.obtener("P1")
+        self.assertEqual((p1.duracion, p1.prioridad, p1.tiempo_llegada), (5, 1, 4))
+        self.repositorio.agregar(Proceso("P3", 7, 0))
+        self.assertEqual(nuevo_repositorio.huella, self.repositorio.huella)
+        os.remove(archivo)
+
+    def test_cargar_jsonl_invalido(self):
+        archivo = "test_invalido.jsonl"
+        self.repositorio.agregar(self.proceso1)
+        self.repositorio.guardar_jsonl(archivo)
+        RepositorioProcesos.anexar_jsonl(archivo, [self.proceso2, self.proceso1])
+        with self.assertRaisesRegex(ValueError, "P1"):
+            self.repositorio.cargar_jsonl(archivo)
+        with self.assertRaises(ValueError):
+            RepositorioProcesos.anexar_jsonl(archivo, [Proceso("P4", 1, 0), None])
+        with open(archivo, encoding='utf-8') as f:
+            self.assertEqual(len(f.readlines()), 3)  # No se ha añadido P4
+        with open(archivo, 'a', encoding='utf-8') as f:
+            f.write("{no es json}\n")
+        with self.assertRaisesRegex(ValueError, "línea 4"):
+            list(RepositorioProcesos.leer_jsonl(archivo))
+        with self.assertRaises(ValueError):
+            list(RepositorioProcesos.leer_jsonl(archivo, tamano_bloque=0))
+        # Un fallo no modifica el repositorio
+        self.assertEqual([p.pid for p in self.repositorio.listar()], ["P1"])
+        os.remove(archivo)
+
+    def test_guardar_incremental(self):
+        with tempfile.TemporaryDirectory() as directorio:
+            archivo = os.path.join(directorio, "procesos.inc")
+            self.repositorio.agregar_lote([("P1", 5, 1), ("P2", 3, 2), ("P3", 4, 0)])
+            self.repositorio.guardar_incremental(archivo)
+            with open(archivo, encoding='utf-8') as f:
+                instantanea = f.read()
+
+            # Solo se añade el delta al log; la instantánea no se toca
+            self.repositorio.eliminar("P1")
+            self.repositorio.agregar(Proceso("P4", 2, 0, 6))
+            self.repositorio.obtener("P2").establecer_tiempo_inicio(1)
+            self.repositorio.marcar_modificado("P2")
+            self.repositorio.guardar_incremental(archivo)
+            self.repositorio.guardar_incremental(archivo)  # Sin cambios: no escribe nada
+            with open(archivo, encoding='utf-8') as f:
+                self.assertEqual(f.read(), instantanea)
+            with open(archivo + ".log", encoding='utf-8') as f:
+                self.assertEqual(len(f.readlines()), 4)  # Cabecera y tres cambios
+
+            nuevo = RepositorioProcesos()
+            nuevo.cargar_incremental(archivo)
+            self.assertEqual([p.pid for p in nuevo.listar()], ["P2", "P3", "P4"])
+            self.assertEqual(nuevo.obtener("P2").tiempo_inicio, 1)
+            self.assertEqual(nuevo.obtener("P4").tiempo_llegada, 6)
+            self.assertEqual(nuevo.huella, self.repositorio.huella)
+
+            # Al superar el máximo de registros se compacta
+            nuevo.agregar(Proceso("P5", 1, 0))
+            nuevo.guardar_incremental(archivo, max_registros=3)
+            with open(archivo + ".log", encoding='utf-8') as f:
+                self.assertEqual(len(f.readlines()), 1)
+            self.assertEqual(sorted(os.listdir(directorio)), ["procesos.inc", "procesos.inc.log"])
+            otro = RepositorioProcesos()
+            otro.cargar_incremental(archivo)
+            self.assertEqual([p.pid for p in otro.listar()], ["P2", "P3", "P4", "P5"])
+
+    def test_cargar_incremental_tras_un_fallo(self):
+        with tempfile.TemporaryDirectory() as directorio:
+            archivo = os.path.join(directorio, "procesos.inc")
+            self.repositorio.agregar(self.proceso1)
+            self.repositorio.guardar_incremental(archivo)
+            self.repositorio.agregar(self.proceso2)
+            self.repositorio.guardar_incremental(archivo)
+            with open(archivo + ".log", encoding='utf-8') as f:
+                log_anterior = f.read()
+
+            # Escritura del log interrumpida: la última línea se descarta
+            with open(archivo + ".log", "a", encoding='utf-8') as f:
+                f.write('{"op": "eliminar", "pi')
+            nuevo = RepositorioProcesos()
+            nuevo.cargar_incremental(archivo)
+            self.assertEqual([p.pid for p in nuevo.listar()], ["P1", "P2"])
+            nuevo.agregar(Proceso("P3", 1, 0))
+            nuevo.guardar_incremental(archivo)  # El log no está limpio: compacta
+
+            # Compactación interrumpida tras escribir la instantánea: el log
+            # de la generación anterior se ignora
+            with open(archivo + ".log", "w", encoding='utf-8') as f:
+                f.write(log_anterior)
+            otro = RepositorioProcesos()
+            otro.cargar_incremental(archivo)
+            self.assertEqual([p.pid for p in otro.listar()], ["P1", "P2", "P3"])
+
+            with open(archivo, "w", encoding='utf-8') as f:
+                f.write("[]")
+            with self.assertRaises(ValueError):
+                otro.cargar_incremental(archivo)
+            self.assertEqual(len(otro.listar()), 3)
+            with self.assertRaises(ValueError):
+                otro.marcar_modificado("P9")
+
+    def test_huella(self):
+        vacia = self.repositorio.huella
+        self.repositorio.agregar(self.proceso1)
+        self.repositorio.agregar(self.proceso2)
+        huella = self.repositorio.huella
+        self.assertNotEqual(huella, vacia)
+
+        # La huella incremental coincide con la recalculada tras una carga
+        otro = RepositorioProcesos()
+        otro.agregar_lote([("P1", 5, 1), ("P2", 3, 2)])
+        self.assertEqual(otro.huella, huella)
+
+        # Depende del orden de inserción
+        invertido = RepositorioProcesos()
+        invertido.agregar(Proceso("P2", 3, 2))
+        invertido.agregar(Proceso("P1", 5, 1))
+        self.assertNotEqual(invertido.huella, huella)
+
+        avisos = []
+        self.repositorio.observar(avisos.append)
+        self.repositorio.eliminar("P2")
+        self.assertEqual(avisos, [huella])
+        self.assertNotEqual(self.repositorio.huella, huella)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
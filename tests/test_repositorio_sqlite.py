@@ -0,0 +1,98 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from src.proceso import Proceso, ErrorLote
+from src.repositorio_sqlite import RepositorioSQLite
+from src.scheduler import FCFSScheduler
+
+class TestRepositorioSQLite(unittest.TestCase):
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.archivo = os.path.join(self.directorio.name, "procesos.db")
+        self.repositorio = RepositorioSQLite(self.archivo)
+
+    def tearDown(self):
+        self.repositorio.cerrar()
+        self.directorio.cleanup()
+
+    def reabrir(self) -> RepositorioSQLite:
+        self.repositorio.cerrar()
+        self.repositorio = RepositorioSQLite(self.archivo)
+        return self.repositorio
+
+    def test_persistencia(self):
+        self.repositorio.agregar(Proceso("P1", 5, 1, 3))
+        self.repositorio.agregar_lote([("P2", 3, 2), ("P3", 4, 1, 6)])
+        self.repositorio.eliminar("P2")
+        self.repositorio.agregar(Proceso("P2", 7, 0))
+        huella = self.repositorio.huella
+
+        repositorio = self.reabrir()
+        self.assertEqual([p.pid for p in repositorio.listar()], ["P1", "P3", "P2"])
+        self.assertEqual(repositorio.obtener("P1").tiempo_llegada, 3)
+        self.assertEqual(repositorio.obtener("P3").tiempo_llegada, 6)
+        self.assertEqual(repositorio.obtener("P2").duracion, 7)
+        self.assertEqual(repositorio.huella, huella)
+        self.assertEqual([p.pid for p in repositorio.listar_por_prioridad(1)], ["P1", "P3"])
+
+    def test_sincronizar_tiempos(self):
+        self.repositorio.agregar_lote([("A", 2, 0), ("B", 3, 0)])
+        FCFSScheduler().planificar(self.repositorio.listar())
+        self.repositorio.sincronizar()
+        repositorio = self.reabrir()
+        self.assertEqual(repositorio.obtener("B").tiempo_inicio, 2)
+        self.assertEqual(repositorio.obtener("B").tiempo_fin, 5)
+        self.assertEqual(repositorio.obtener("B").tiempo_restante, 0)
+
+    def test_cargar_reemplaza_la_base(self):
+        self.repositorio.agregar(Proceso("X", 1, 0))
+        json = os.path.join(self.directorio.name, "procesos.json")
+        otro = RepositorioSQLite()
+        otro.agregar_lote([("J1", 2, 1), ("J2", 4, 0)])
+        otro.guardar_json(json)
+        self.repositorio.cargar_json(json)
+        self.assertEqual([p.pid for p in self.reabrir().listar()], ["J1", "J2"])
+
+    def test_cargar_incremental_reemplaza_la_base(self):
+        self.repositorio.agregar(Proceso("A", 1, 0))
+        archivo = os.path.join(self.directorio.name, "procesos.inc")
+        otro = RepositorioSQLite()
+        otro.agregar(Proceso("X", 2, 1))
+        otro.guardar_incremental(archivo)
+        self.repositorio.cargar_incremental(archivo)
+        self.repositorio.agregar(Proceso("A", 3, 0))  # Ya no está en la base de datos
+        self.assertEqual([p.pid for p in self.reabrir().listar()], ["X", "A"])
+
+    def test_errores_no_modifican_la_base(self):
+        self.repositorio.agregar(Proceso("P1", 5, 1))
+        with self.assertRaises(ValueError):
+            self.repositorio.agregar(Proceso("P1", 2, 0))
+        with self.assertRaises(ErrorLote):
+            self.repositorio.agregar_lote([("P2", 3, 0), ("P1", 1, 0)])
+        with self.assertRaises(ValueError):
+            self.repositorio.eliminar("P9")
+        self.assertEqual([p.pid for p in self.reabrir().listar()], ["P1"])
+
+    def test_lote_rechazado_por_la_base(self):
+        archivo = os.path.join(self.directorio.name, "procesos.inc")
+        self.repositorio.agregar(Proceso("P1", 5, 1))
+        self.repositorio.guardar_incremental(archivo)
+        huella = self.repositorio.huella
+        # Otra conexión inserta un PID que el repositorio no conoce
+        with sqlite3.connect(self.archivo) as conexion:
+            conexion.execute("INSERT INTO procesos (pid, duracion, prioridad, tiempo_restante, "
+                             "tiempo_llegada) VALUES ('P3', 1, 0, 1, 0)")
+        conexion.close()
+        with self.assertRaises(IOError):
+            self.repositorio.agregar_lote([("P2", 3, 0), ("P3", 4, 1)])
+        self.assertEqual([p.pid for p in self.repositorio.listar()], ["P1"])
+        self.assertEqual(self.repositorio.huella, huella)
+        # El lote rechazado no queda pendiente del guardado incremental
+        self.repositorio.guardar_incremental(archivo)
+        otro = RepositorioSQLite()
+        otro.cargar_incremental(archivo)
+        self.assertEqual([p.pid for p in otro.listar()], ["P1"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,11 +1,49 @@
+import pickle
+import random
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from src.proceso import Proceso
-from src.scheduler import FCFSScheduler, RoundRobinScheduler, GanttEntry
+from src.metrics import Metrics
+from src.simulacion import ArbolFenwick
+from src.scheduler import (FCFSScheduler, RoundRobinScheduler, PrioridadScheduler,
+                           PrioridadExpropiativaScheduler, SJFScheduler, SRTFScheduler, MLFQScheduler,
+                           CFSScheduler, LoteriaScheduler, StrideScheduler, GanttEntry)
+from src.multinucleo import RoundRobinMultinucleoScheduler
+from src.tabla import TablaProcesos
+
+def sjf_referencia(procesos):
+    """SJF no expropiativo sobre tuplas (pid, duracion, llegada), eligiendo con una búsqueda lineal."""
+    pendientes = list(range(len(procesos)))
+    gantt = []
+    tiempo_actual = 0
+    while pendientes:
+        listos = [i for i in pendientes if procesos[i][2] <= tiempo_actual]
+        if not listos:
+            tiempo_actual = min(procesos[i][2] for i in pendientes)
+            continue
+        i = min(listos, key=lambda i: (procesos[i][1], procesos[i][2], i))
+        pendientes.remove(i)
+        gantt.append((procesos[i][0], tiempo_actual, tiempo_actual + procesos[i][1]))
+        tiempo_actual += procesos[i][1]
+    return gantt
+
+def round_robin_referencia(procesos, quantum):
+    """Round-Robin quantum a quantum sobre pares (pid, duracion), sin atajos."""
+    gantt = []
+    tiempo_actual = 0
+    cola = [list(p) for p in procesos]
+    while cola:
+        entrada = cola.pop(0)
+        tiempo_ejecucion = min(quantum, entrada[1])
+        gantt.append((entrada[0], tiempo_actual, tiempo_actual + tiempo_ejecucion))
+        tiempo_actual += tiempo_ejecucion
+        entrada[1] -= tiempo_ejecucion
+        if entrada[1] > 0:
+            cola.append(entrada)
+    return gantt
 
 class TestScheduler(unittest.TestCase):
     def setUp(self):
-        # Limpiar PIDs usados antes de cada prueba
-        Proceso._pids_usados.clear()
         # Crear procesos de prueba
         self.procesos = [
             Proceso("P1", 5, 1),
@@ -31,6 +69,22 @@ class TestScheduler(unittest.TestCase):
         self.assertEqual(self.procesos[1].tiempo_restante, 0)
         self.assertEqual(self.procesos[2].tiempo_restante, 0)
 
+    def test_fcfs_comprimido(self):
+        gantt = FCFSScheduler().planificar_comprimido(self.procesos)
+        self.assertEqual(len(gantt.segmentos), 1)
+        self.assertEqual(gantt.expandir(), [("P1", 0, 5), ("P2", 5, 8), ("P3", 8, 10)])
+        self.assertEqual(gantt.tiempos_por_proceso()["P2"], (5, 8))
+
+        # Llegadas desordenadas y con huecos: un segmento por tramo ocupado
+        tabla = TablaProcesos(["A", "B", "C", "D"], [2, 3, 1, 4], [0] * 4, [9, 0, 1, 20])
+        gantt = FCFSScheduler().planificar_comprimido(tabla)
+        self.assertEqual(gantt.expandir(), [("B", 0, 3), ("C", 3, 4), ("A", 9, 11), ("D", 20, 24)])
+        primero = gantt.segmentos[0]
+        self.assertEqual((primero.pids[-1], primero.cierre[0], primero.pids[:1]), ("C", 3, ("B",)))
+        with self.assertRaises(IndexError):
+            primero.pids[2]
+        self.assertEqual(pickle.loads(pickle.dumps(gantt)).segmentos, gantt.segmentos)
+
     def test_round_robin_scheduler_quantum_2(self):
         scheduler = RoundRobinScheduler(quantum=2)
         gantt = scheduler.planificar(self.procesos)
@@ -52,6 +106,47 @@ class TestScheduler(unittest.TestCase):
         self.assertEqual(self.procesos[1].tiempo_restante, 0)
         self.assertEqual(self.procesos[2].tiempo_restante, 0)
 
+    def test_round_robin_equivale_a_referencia(self):
+        generador = random.Random(2024)
+        for carga in range(50):
+            num_procesos = generador.randint(1, 30)
+            quantum = generador.randint(1, 6)
+            procesos = [
+                Proceso(f"W{carga}-{i}", generador.randint(1, 40), 0)
+                for i in range(num_procesos)
+            ]
+            esperado = round_robin_referencia(
+                [(p.pid, p.duracion) for p in procesos], quantum
+            )
+            gantt = RoundRobinScheduler(quantum).planificar(procesos)
+            self.assertEqual(gantt, esperado)
+            for proceso in procesos:
+                primera = next(e for e in esperado if e[0] == proceso.pid)
+                ultima = [e for e in esperado if e[0] == proceso.pid][-1]
+                self.assertEqual(proceso.tiempo_inicio, primera[1])
+                self.assertEqual(proceso.tiempo_fin, ultima[2])
+                self.assertEqual(proceso.tiempo_restante, 0)
+
+    def test_planificar_iter(self):
+        iterador = FCFSScheduler().planificar_iter(self.procesos)
+        self.assertEqual(next(iterador), ("P1", 0, 5))
+        # Las entradas se producen bajo demanda
+        self.assertEqual(self.procesos[0].tiempo_fin, 5)
+        self.assertIsNone(self.procesos[1].tiempo_inicio)
+        self.assertEqual(list(iterador), [("P2", 5, 8), ("P3", 8, 10)])
+
+        procesos = [Proceso("R1", 5, 1), Proceso("R2", 3, 2)]
+        self.assertEqual(
+            list(RoundRobinScheduler(quantum=2).planificar_iter(procesos)),
+            [("R1", 0, 2), ("R2", 2, 4), ("R1", 4, 6), ("R2", 6, 7), ("R1", 7, 8)]
+        )
+
+    def test_planificar_iter_valida_al_llamar(self):
+        with self.assertRaises(ValueError):
+            FCFSScheduler().planificar_iter([])
+        with self.assertRaises(ValueError):
+            RoundRobinScheduler(quantum=2).planificar_iter([None])
+
     def test_invalid_procesos(self):
         fcfs = FCFSScheduler()
         rr = RoundRobinScheduler(quantum=2)
@@ -70,5 +165,240 @@ class TestScheduler(unittest.TestCase):
         with self.assertRaises(ValueError):
             RoundRobinScheduler(quantum=-1)
 
+class TestSJFScheduler(unittest.TestCase):
+    def crear_procesos(self):
+        return [Proceso("A", 7, 0, 0), Proceso("B", 4, 0, 2), Proceso("C", 1, 0, 4), Proceso("D", 4, 0, 5)]
+
+    def test_sjf(self):
+        gantt = SJFScheduler().planificar(self.crear_procesos())
+        self.assertEqual(gantt, [("A", 0, 7), ("C", 7, 8), ("B", 8, 12), ("D", 12, 16)])
+
+    def test_srtf(self):
+        procesos = self.crear_procesos()
+        gantt = SRTFScheduler().planificar(procesos)
+        self.assertEqual(gantt, [("A", 0, 2), ("B", 2, 4), ("C", 4, 5), ("B", 5, 7), ("D", 7, 11), ("A", 11, 16)])
+        self.assertEqual([p.tiempo_fin for p in procesos], [16, 7, 5, 11])
+
+    def test_srtf_no_expropia_con_empate(self):
+        # B necesita lo mismo que le queda a A: A sigue en CPU
+        procesos = [Proceso("A", 5, 0, 0), Proceso("B", 3, 0, 2)]
+        self.assertEqual(SRTFScheduler().planificar(procesos), [("A", 0, 5), ("B", 5, 8)])
+
+    def test_sjf_equivale_a_referencia(self):
+        rnd = random.Random(8)
+        for _ in range(100):
+            datos = [(f"P{i}", rnd.randint(1, 9), rnd.randint(0, 25)) for i in range(rnd.randint(1, 12))]
+            procesos = [Proceso(pid, d, 0, a) for pid, d, a in datos]
+            self.assertEqual(SJFScheduler().planificar(procesos), sjf_referencia(datos))
+
+class TestMLFQScheduler(unittest.TestCase):
+    def test_degradacion_y_expulsion(self):
+        procesos = [Proceso("A", 7, 0, 0), Proceso("B", 3, 0, 3)]
+        gantt = MLFQScheduler(quanta=(2, 4)).planificar(procesos)
+        # A baja al nivel 1 y B, recién llegada al nivel 0, la expulsa
+        self.assertEqual(gantt, [("A", 0, 2), ("A", 2, 3), ("B", 3, 5), ("A", 5, 9), ("B", 9, 10)])
+
+    def test_un_nivel_equivale_a_round_robin(self):
+        rnd = random.Random(2)
+        datos = [(f"P{i}", rnd.randint(1, 20), 0) for i in range(30)]
+        mlfq = MLFQScheduler(quanta=(3,)).planificar([Proceso(*fila) for fila in datos])
+        rr = RoundRobinScheduler(quantum=3).planificar([Proceso(*fila) for fila in datos])
+        self.assertEqual(mlfq, rr)
+
+    def test_boost_evita_inanicion(self):
+        def primera_vuelta_de_a(intervalo_boost):
+            procesos = [Proceso("A", 20, 0, 0)] + [Proceso(f"S{k}", 2, 0, 2 * k) for k in range(1, 21)]
+            gantt = MLFQScheduler(quanta=(2, 2), intervalo_boost=intervalo_boost).planificar(procesos)
+            return min(inicio for pid, inicio, _ in gantt if pid == "A" and inicio > 0)
+
+        # Sin boost A espera en el nivel 1 hasta que deja de llegar trabajo
+        self.assertEqual(primera_vuelta_de_a(None), 42)
+        self.assertEqual(primera_vuelta_de_a(10), 10)
+
+    def test_invalid_quanta(self):
+        with self.assertRaises(ValueError):
+            MLFQScheduler(quanta=())
+        with self.assertRaises(ValueError):
+            MLFQScheduler(quanta=(2, 0))
+        with self.assertRaises(ValueError):
+            MLFQScheduler(intervalo_boost=-5)
+
+class TestCFSScheduler(unittest.TestCase):
+    def tiempo_en_ventana(self, gantt, pid, hasta):
+        return sum(min(fin, hasta) - inicio for p, inicio, fin in gantt if p == pid and inicio < hasta)
+
+    def test_reparto_proporcional_al_peso(self):
+        # Prioridad 0 pesa 1024 y prioridad 3 pesa 524: casi el doble de CPU
+        procesos = [Proceso("A", 1000, 0), Proceso("B", 1000, 3)]
+        gantt = CFSScheduler(latencia_objetivo=30, granularidad_minima=1).planificar(procesos)
+        proporcion = self.tiempo_en_ventana(gantt, "A", 600) / self.tiempo_en_ventana(gantt, "B", 600)
+        self.assertAlmostEqual(proporcion, 1024 / 524, delta=0.1)
+
+    def test_iguales_se_alternan(self):
+        procesos = [Proceso("A", 4, 1), Proceso("B", 4, 1)]
+        gantt = CFSScheduler(latencia_objetivo=4, granularidad_minima=1).planificar(procesos)
+        self.assertEqual(gantt, [("A", 0, 2), ("B", 2, 4), ("A", 4, 6), ("B", 6, 8)])
+
+    def test_llegada_no_acapara_la_cpu(self):
+        # C llega con el vruntime mínimo de la cola, no con 0
+        procesos = [Proceso("A", 100, 1), Proceso("B", 100, 1), Proceso("C", 100, 1, 100)]
+        gantt = CFSScheduler(latencia_objetivo=10, granularidad_minima=2).planificar(procesos)
+        self.assertLessEqual(self.tiempo_en_ventana(gantt, "C", 150), 30)
+        self.assertGreater(self.tiempo_en_ventana(gantt, "C", 150), 0)
+
+    def test_metricas(self):
+        rnd = random.Random(6)
+        procesos = [Proceso(f"P{i}", rnd.randint(1, 30), rnd.randint(0, 5), rnd.randint(0, 100)) for i in range(40)]
+        gantt = CFSScheduler().planificar(procesos)
+        self.assertEqual(sum(fin - inicio for _, inicio, fin in gantt), sum(p.duracion for p in procesos))
+        self.assertEqual(len(Metrics(procesos, gantt).obtener_metricas_por_proceso()), 40)
+
+    def test_invalid_parametros(self):
+        with self.assertRaises(ValueError):
+            CFSScheduler(latencia_objetivo=0)
+        with self.assertRaises(ValueError):
+            CFSScheduler(granularidad_minima=-1)
+
+class TestRepartoProporcional(unittest.TestCase):
+    def cuantos(self, gantt, pid, hasta):
+        return sum(1 for p, inicio, _ in gantt if p == pid and inicio < hasta)
+
+    def test_stride_reparto_exacto(self):
+        # Prioridad 0 tiene 1024 boletos y prioridad 3 tiene 524
+        procesos = [Proceso("A", 10000, 0), Proceso("B", 10000, 3)]
+        gantt = StrideScheduler(quantum=1).planificar(procesos)
+        self.assertAlmostEqual(self.cuantos(gantt, "A", 1548) / self.cuantos(gantt, "B", 1548), 1024 / 524, delta=0.01)
+
+    def test_loteria_reparto_aproximado(self):
+        procesos = [Proceso("A", 10000, 0), Proceso("B", 10000, 3)]
+        gantt = LoteriaScheduler(quantum=1, semilla=1).planificar(procesos)
+        self.assertAlmostEqual(self.cuantos(gantt, "A", 6000) / self.cuantos(gantt, "B", 6000), 1024 / 524, delta=0.15)
+
+    def test_loteria_reproducible(self):
+        def sorteo(semilla):
+            procesos = [Proceso(f"P{i}", 20, i % 4, i) for i in range(30)]
+            return LoteriaScheduler(quantum=2, semilla=semilla).planificar(procesos)
+        self.assertEqual(sorteo(42), sorteo(42))
+        self.assertNotEqual(sorteo(42), sorteo(43))
+
+    def test_arbol_fenwick(self):
+        rnd = random.Random(0)
+        valores = [rnd.randint(0, 5) for _ in range(37)]
+        arbol = ArbolFenwick(len(valores))
+        for i, valor in enumerate(valores):
+            arbol.agregar(i, valor)
+        acumulado = 0
+        for i, valor in enumerate(valores):
+            for objetivo in range(acumulado, acumulado + valor):
+                self.assertEqual(arbol.buscar(objetivo), i)
+            acumulado += valor
+        self.assertEqual(arbol.total, sum(valores))
+
+    def test_invalid_quantum(self):
+        with self.assertRaises(ValueError):
+            LoteriaScheduler(quantum=0)
+        with self.assertRaises(ValueError):
+            StrideScheduler(quantum=-2)
+
+class TestPrioridadScheduler(unittest.TestCase):
+    def crear_procesos(self):
+        return [Proceso("A", 5, 3, 0), Proceso("B", 2, 1, 1), Proceso("C", 2, 2, 2)]
+
+    def test_no_expropiativo(self):
+        gantt = PrioridadScheduler().planificar(self.crear_procesos())
+        self.assertEqual(gantt, [("A", 0, 5), ("B", 5, 7), ("C", 7, 9)])
+
+    def test_expropiativo(self):
+        procesos = self.crear_procesos()
+        gantt = PrioridadExpropiativaScheduler().planificar(procesos)
+        self.assertEqual(gantt, [("A", 0, 1), ("B", 1, 3), ("C", 3, 5), ("A", 5, 9)])
+        self.assertEqual(procesos[0].tiempo_inicio, 0)
+        self.assertEqual(procesos[0].tiempo_fin, 9)
+
+    def test_empates_en_orden_de_llegada(self):
+        procesos = [Proceso(f"P{i}", 1, 1) for i in range(5)]
+        gantt = PrioridadScheduler().planificar(procesos)
+        self.assertEqual([pid for pid, _, _ in gantt], ["P0", "P1", "P2", "P3", "P4"])
+
+    def test_envejecimiento(self):
+        procesos = [Proceso("A", 10, 0, 0), Proceso("B", 1, 5, 0), Proceso("C", 1, 0, 8)]
+        # Sin envejecimiento C adelanta a B, que lleva esperando desde el principio
+        self.assertEqual([pid for pid, _, _ in PrioridadScheduler().planificar(procesos)], ["A", "C", "B"])
+        procesos = [Proceso("A", 10, 0, 0), Proceso("B", 1, 5, 0), Proceso("C", 1, 0, 8)]
+        gantt = PrioridadScheduler(envejecimiento=1).planificar(procesos)
+        self.assertEqual([pid for pid, _, _ in gantt], ["A", "B", "C"])
+
+    def test_expropiativo_nunca_ejecuta_uno_menos_prioritario(self):
+        rnd = random.Random(5)
+        for _ in range(100):
+            datos = [(f"P{i}", rnd.randint(1, 8), rnd.randint(0, 4), rnd.randint(0, 30)) for i in range(rnd.randint(1, 12))]
+            procesos = [Proceso(*fila) for fila in datos]
+            gantt = PrioridadExpropiativaScheduler().planificar(procesos)
+            self.assertEqual(sum(fin - inicio for _, inicio, fin in gantt), sum(d for _, d, _, _ in datos))
+            por_pid = {p.pid: p for p in procesos}
+            for pid, inicio, fin in gantt:
+                for otro in procesos:
+                    # Ningún proceso más prioritario estaba listo durante la ráfaga
+                    if otro.prioridad < por_pid[pid].prioridad and otro.tiempo_fin > inicio:
+                        self.assertGreaterEqual(otro.tiempo_llegada, fin)
+
+    def test_invalid_envejecimiento(self):
+        with self.assertRaises(ValueError):
+            PrioridadScheduler(envejecimiento=0)
+
+class TestPlanificarResultado(unittest.TestCase):
+    def crear_datos(self):
+        rnd = random.Random(21)
+        return [(f"P{i}", rnd.randint(1, 15), rnd.randint(0, 6), rnd.randint(0, 80)) for i in range(60)]
+
+    def planificadores(self):
+        return [FCFSScheduler(), RoundRobinScheduler(3), PrioridadExpropiativaScheduler(5), SJFScheduler(),
+                SRTFScheduler(), MLFQScheduler((2, 6), 50), CFSScheduler(), LoteriaScheduler(2, semilla=4),
+                StrideScheduler(2), RoundRobinMultinucleoScheduler(3, nucleos=3)]
+
+    def test_coincide_con_planificar_sin_modificar(self):
+        datos = self.crear_datos()
+        procesos = [Proceso(*fila) for fila in datos]
+        pids, duraciones, prioridades, llegadas = zip(*datos)
+        tabla = TablaProcesos(pids, duraciones, prioridades, llegadas)
+        for scheduler in self.planificadores():
+            esperados = [Proceso(*fila) for fila in datos]
+            gantt = scheduler.planificar(esperados)
+            for carga in (procesos, tabla):
+                resultado = scheduler.planificar_resultado(carga)
+                self.assertEqual(list(resultado.gantt), gantt)
+                self.assertEqual(resultado.tiempos_por_proceso(),
+                                 {p.pid: (p.tiempo_inicio, p.tiempo_fin) for p in esperados})
+                self.assertEqual(Metrics(carga, resultado).obtener_metricas_promedio(),
+                                 Metrics(esperados, gantt).obtener_metricas_promedio())
+
+        # La carga sigue sin planificar
+        self.assertTrue(all(p.tiempo_inicio is None and p.tiempo_restante == p.duracion for p in procesos))
+        self.assertTrue((tabla.tiempo_fin == -1).all())
+
+    def test_carga_compartida_entre_hilos(self):
+        procesos = [Proceso(*fila) for fila in self.crear_datos()]
+        FCFSScheduler().planificar(procesos)  # Ya planificada: se planifica igual desde su definición
+        planificadores = self.planificadores()
+        secuencial = [s.planificar_resultado(procesos).tiempos_por_proceso() for s in planificadores]
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            concurrente = list(pool.map(lambda s: s.planificar_resultado(procesos).tiempos_por_proceso(),
+                                        planificadores))
+        self.assertEqual(concurrente, secuencial)
+
+    def test_aplicar(self):
+        datos = self.crear_datos()
+        procesos = [Proceso(*fila) for fila in datos]
+        resultado = SRTFScheduler().planificar_resultado(procesos)
+        resultado.aplicar(procesos)
+        self.assertEqual({p.pid: (p.tiempo_inicio, p.tiempo_fin) for p in procesos}, resultado.tiempos_por_proceso())
+        self.assertTrue(all(p.tiempo_restante == 0 for p in procesos))
+        with self.assertRaises(ValueError):
+            resultado.aplicar(procesos)
+        with self.assertRaises(ValueError):
+            resultado.aplicar(procesos[:10])
+        with self.assertRaises(ValueError):
+            Metrics(procesos[::-1], resultado)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,142 @@
+import random
+import unittest
+from collections import deque
+from src.proceso import Proceso
+from src.gantt import GanttComprimido
+from src.scheduler import FCFSScheduler, RoundRobinScheduler
+from src.simulacion import Politica, PoliticaFCFS, SimuladorEventos
+from src.tabla import TablaProcesos
+
+def round_robin_llegadas(procesos, quantum):
+    """Round-Robin quantum a quantum sobre tuplas (pid, duracion, llegada), sin atajos."""
+    restantes = [duracion for _, duracion, _ in procesos]
+    pendientes = sorted(range(len(procesos)), key=lambda i: procesos[i][2])
+    cola = deque()
+    gantt = []
+    tiempo_actual = 0
+    siguiente = 0
+    while siguiente < len(pendientes) or cola:
+        while siguiente < len(pendientes) and procesos[pendientes[siguiente]][2] <= tiempo_actual:
+            cola.append(pendientes[siguiente])
+            siguiente += 1
+        if not cola:
+            tiempo_actual = procesos[pendientes[siguiente]][2]
+            continue
+        i = cola.popleft()
+        tiempo_ejecucion = min(quantum, restantes[i])
+        gantt.append((procesos[i][0], tiempo_actual, tiempo_actual + tiempo_ejecucion))
+        tiempo_actual += tiempo_ejecucion
+        restantes[i] -= tiempo_ejecucion
+        # Los que llegan mientras tanto entran antes que el expulsado
+        while siguiente < len(pendientes) and procesos[pendientes[siguiente]][2] <= tiempo_actual:
+            cola.append(pendientes[siguiente])
+            siguiente += 1
+        if restantes[i] > 0:
+            cola.append(i)
+    return gantt
+
+class PoliticaMasCortoExpropiativo(Politica):
+    """Política mínima de prueba: el de menor tiempo restante, con expulsión."""
+
+    def iniciar(self, simulador):
+        super().iniciar(simulador)
+        self.listos = []
+
+    def encolar(self, indice, tiempo):
+        self.listos.append(indice)
+
+    def seleccionar(self, tiempo):
+        if not self.listos:
+            return None
+        restantes = self.simulador.restantes
+        self.listos.sort(key=lambda i: (restantes[i], i))
+        return self.listos.pop(0), None
+
+    def expropiar(self, actual, tiempo):
+        restante_actual = self.simulador.restante_en(actual, tiempo)
+        return any(self.simulador.restantes[i] < restante_actual for i in self.listos)
+
+class TestSimuladorEventos(unittest.TestCase):
+    def test_fcfs_con_llegadas(self):
+        procesos = [Proceso("P1", 3, 1, 0), Proceso("P2", 2, 1, 10), Proceso("P3", 4, 1, 1)]
+        gantt = FCFSScheduler().planificar(procesos)
+        self.assertEqual(gantt, [("P1", 0, 3), ("P3", 3, 7), ("P2", 10, 12)])
+        self.assertEqual(procesos[1].tiempo_inicio, 10)
+        self.assertEqual(procesos[1].tiempo_fin, 12)
+
+    def test_fcfs_tabla_vectorizado_coincide(self):
+        rnd = random.Random(3)
+        for _ in range(50):
+            n = rnd.randint(1, 15)
+            duraciones = [rnd.randint(1, 9) for _ in range(n)]
+            llegadas = [rnd.randint(0, 40) for _ in range(n)]
+            pids = [f"P{i}" for i in range(n)]
+            procesos = [Proceso(p, d, 0, a) for p, d, a in zip(pids, duraciones, llegadas)]
+            tabla = TablaProcesos(pids, duraciones, [0] * n, llegadas)
+
+            esperado = FCFSScheduler().planificar(procesos)
+            comprimido = FCFSScheduler().planificar_comprimido(tabla)
+            self.assertEqual(comprimido.expandir(), esperado)
+            self.assertEqual(tabla.tiempo_inicio.tolist(), [p.tiempo_inicio for p in procesos])
+            self.assertEqual(tabla.tiempo_fin.tolist(), [p.tiempo_fin for p in procesos])
+
+    def test_round_robin_con_llegadas_coincide_con_referencia(self):
+        rnd = random.Random(11)
+        for _ in range(200):
+            n = rnd.randint(1, 10)
+            quantum = rnd.randint(1, 4)
+            datos = [(f"P{i}", rnd.randint(1, 30), rnd.choice([0, rnd.randint(0, 60)])) for i in range(n)]
+            esperado = round_robin_llegadas(datos, quantum)
+
+            procesos = [Proceso(pid, d, 0, a) for pid, d, a in datos]
+            self.assertEqual(RoundRobinScheduler(quantum).planificar(procesos), esperado)
+
+            tabla = TablaProcesos([p for p, _, _ in datos], [d for _, d, _ in datos],
+                                  [0] * n, [a for _, _, a in datos])
+            comprimido = RoundRobinScheduler(quantum).planificar_comprimido(tabla)
+            self.assertEqual(comprimido.expandir(), esperado)
+            self.assertEqual(tabla.tiempo_fin.tolist(), [p.tiempo_fin for p in procesos])
+
+    def test_salta_huecos_inactivos(self):
+        # Un hueco de 10^15 unidades se recorre en un solo paso
+        procesos = [Proceso("P1", 2, 0, 0), Proceso("P2", 5, 0, 10**15)]
+        gantt = RoundRobinScheduler(quantum=1).planificar_comprimido(procesos)
+        self.assertEqual(gantt.tiempos_por_proceso(), {"P1": (0, 2), "P2": (10**15, 10**15 + 5)})
+        self.assertLessEqual(len(gantt.segmentos), 2)
+
+    def test_llegadas_antes_que_fin_de_quantum(self):
+        # R2 llega justo cuando R1 agota su quantum y le adelanta en la cola
+        procesos = [Proceso("R1", 4, 0, 0), Proceso("R2", 1, 0, 2), Proceso("R3", 1, 0, 2)]
+        self.assertEqual(
+            RoundRobinScheduler(quantum=2).planificar(procesos),
+            [("R1", 0, 2), ("R2", 2, 3), ("R3", 3, 4), ("R1", 4, 6)]
+        )
+
+    def test_politica_expropiativa(self):
+        simulador = SimuladorEventos(PoliticaMasCortoExpropiativo())
+        tramos = simulador.simular(["A", "B", "C"], [8, 2, 4], [0, 3, 4])
+        gantt = GanttComprimido.desde_tramos(tramos).expandir()
+        self.assertEqual(gantt, [("A", 0, 3), ("B", 3, 5), ("C", 5, 9), ("A", 9, 14)])
+        self.assertEqual(simulador.inicios, [0, 3, 5])
+        self.assertEqual(simulador.fines, [14, 5, 9])
+
+    def test_observadores(self):
+        avisos = []
+        simulador = SimuladorEventos(PoliticaFCFS())
+        list(simulador.simular(["A", "B"], [2, 3], [5, 0],
+                               al_iniciar=lambda i, t: avisos.append(("inicio", i, t)),
+                               al_terminar=lambda i, t: avisos.append(("fin", i, t))))
+        self.assertEqual(avisos, [("inicio", 1, 0), ("fin", 1, 3), ("inicio", 0, 5), ("fin", 0, 7)])
+
+    def test_politica_invalida(self):
+        with self.assertRaises(ValueError):
+            SimuladorEventos(None)
+
+    def test_proceso_llegada_invalida(self):
+        with self.assertRaises(ValueError):
+            Proceso("P1", 3, 1, -1)
+        with self.assertRaises(ValueError):
+            Proceso("P1", 3, 1, 1.5)
+
+if __name__ == "__main__":
+    unittest.main()
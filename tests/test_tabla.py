@@ -0,0 +1,230 @@
+import os
+import pickle
+import random
+import tempfile
+import unittest
+import numpy as np
+from src.proceso import Proceso
+from src.repositorio import RepositorioProcesos
+from src.scheduler import FCFSScheduler, RoundRobinScheduler
+from src.metrics import Metrics
+from src import tabla as tabla_modulo
+from src.tabla import TablaProcesos, SIN_TIEMPO
+
+class TestTablaProcesos(unittest.TestCase):
+    def setUp(self):
+        self.tabla = TablaProcesos(["P1", "P2", "P3"], [5, 3, 2], [1, 2, 1])
+
+    def test_crear_tabla(self):
+        self.assertEqual(len(self.tabla), 3)
+        self.assertEqual(self.tabla.duracion.dtype, np.int64)
+        self.assertEqual(self.tabla.tiempo_restante.tolist(), [5, 3, 2])
+        self.assertEqual(self.tabla.tiempo_llegada.tolist(), [0, 0, 0])
+        self.assertTrue((self.tabla.tiempo_inicio == SIN_TIEMPO).all())
+        self.assertTrue((self.tabla.tiempo_fin == SIN_TIEMPO).all())
+        self.assertEqual(self.tabla.indice("P2"), 1)
+        with self.assertRaises(ValueError):
+            self.tabla.indice("P9")
+
+    def test_tabla_invalida(self):
+        with self.assertRaises(ValueError):
+            TablaProcesos(["P1", "P1"], [5, 3], [1, 2])  # PID duplicado
+        with self.assertRaises(ValueError):
+            TablaProcesos(["P1", ""], [5, 3], [1, 2])  # PID vacío
+        with self.assertRaises(ValueError):
+            TablaProcesos(["P1", "P2"], [5, 0], [1, 2])  # Duración no positiva
+        with self.assertRaises(ValueError):
+            TablaProcesos(["P1", "P2"], [5, 3], [1, -2])  # Prioridad negativa
+        with self.assertRaises(ValueError):
+            TablaProcesos(["P1", "P2"], [5], [1, 2])  # Longitudes distintas
+
+    def test_conversion_repositorio(self):
+        repositorio = RepositorioProcesos()
+        repositorio.agregar(Proceso("R1", 4, 0))
+        repositorio.agregar(Proceso("R2", 6, 3, 2))
+        repositorio.obtener("R2").establecer_tiempo_inicio(4)
+        repositorio.obtener("R2").reducir_tiempo_restante(1)
+
+        tabla = TablaProcesos.desde_repositorio(repositorio)
+        self.assertEqual(tabla.pids, ["R1", "R2"])
+        self.assertEqual(tabla.prioridad.tolist(), [0, 3])
+        self.assertEqual(tabla.tiempo_inicio.tolist(), [SIN_TIEMPO, 4])
+
+        copia = tabla.a_repositorio()
+        self.assertEqual(copia.obtener("R2").duracion, 6)
+        self.assertEqual(copia.obtener("R2").tiempo_inicio, 4)
+        self.assertEqual(copia.obtener("R2").tiempo_restante, 5)
+        self.assertEqual(copia.obtener("R2").tiempo_llegada, 2)
+        self.assertIsNone(copia.obtener("R1").tiempo_inicio)
+        self.assertEqual(copia.obtener("R1").tiempo_restante, 4)
+        self.assertEqual(copia.huella, repositorio.huella)
+
+    def test_guardar_abrir_binario(self):
+        repositorio = RepositorioProcesos()
+        repositorio.agregar(Proceso("R1", 4, 0, 2))
+        repositorio.agregar(Proceso("Ñ2", 6, 3))
+        repositorio.obtener("Ñ2").establecer_tiempo_inicio(4)
+        tabla = TablaProcesos.desde_repositorio(repositorio)
+        with tempfile.TemporaryDirectory() as directorio:
+            archivo = os.path.join(directorio, "procesos.bin")
+            tabla.guardar_binario(archivo)
+            abierta = TablaProcesos.abrir_binario(archivo)
+            self.assertEqual(list(abierta.pids), ["R1", "Ñ2"])
+            self.assertEqual((abierta.pids[-1], abierta.pids[:1]), ("Ñ2", ["R1"]))
+            self.assertEqual(abierta.indice("Ñ2"), 1)
+            self.assertEqual(pickle.loads(pickle.dumps(abierta.pids)), ["R1", "Ñ2"])
+            self.assertEqual(abierta.tiempo_llegada.tolist(), [2, 0])
+            self.assertEqual(abierta.tiempo_inicio.tolist(), [SIN_TIEMPO, 4])
+            self.assertIsNone(abierta.a_repositorio().obtener("R1").tiempo_fin)
+
+            # Planificar la tabla abierta no modifica el archivo
+            plan = TablaProcesos(["P1", "P2", "P3"], [5, 3, 2], [1, 2, 1])
+            plan.guardar_binario(archivo)
+            gantt = FCFSScheduler().planificar(TablaProcesos.abrir_binario(archivo))
+            self.assertEqual(gantt, [("P1", 0, 5), ("P2", 5, 8), ("P3", 8, 10)])
+            self.assertTrue((TablaProcesos.abrir_binario(archivo).tiempo_fin == SIN_TIEMPO).all())
+
+            TablaProcesos([], [], []).guardar_binario(archivo)
+            self.assertEqual(len(TablaProcesos.abrir_binario(archivo)), 0)
+
+            with open(archivo, "wb") as f:
+                f.write(b"no es una tabla binaria de procesos")
+            with self.assertRaises(ValueError):
+                TablaProcesos.abrir_binario(archivo)
+
+    def test_csv_compatible_con_repositorio(self):
+        repositorio = RepositorioProcesos()
+        repositorio.agregar(Proceso("R1", 4, 0, 2))
+        repositorio.agregar(Proceso("R;2", 6, 3))  # Se escribe entre comillas
+        repositorio.agregar(Proceso("R3", 1, 1, 7))
+        repositorio.obtener("R3").establecer_tiempo_inicio(9)
+        with tempfile.TemporaryDirectory() as directorio:
+            archivo = os.path.join(directorio, "procesos.csv")
+            copia = os.path.join(directorio, "copia.csv")
+            repositorio.guardar_csv(archivo)
+            tabla = TablaProcesos.cargar_csv(archivo)
+            self.assertEqual(tabla.pids, ["R1", "R;2", "R3"])
+            self.assertEqual(tabla.tiempo_llegada.tolist(), [2, 0, 7])
+            self.assertEqual(tabla.tiempo_inicio.tolist(), [SIN_TIEMPO, SIN_TIEMPO, 9])
+            tabla.guardar_csv(copia)
+            with open(archivo, "rb") as a, open(copia, "rb") as b:
+                self.assertEqual(a.read(), b.read())
+
+            # Columnas en otro orden y líneas en blanco
+            with open(archivo, "w", encoding="utf-8") as f:
+                f.write("tiempo_fin;pid;duracion;prioridad;tiempo_restante;tiempo_llegada;tiempo_inicio\n"
+                        "\n8;A;5;1;0;3;3\n;B;2;0;2;0;\n\n")
+            tabla = TablaProcesos.cargar_csv(archivo)
+            self.assertEqual(tabla.pids, ["A", "B"])
+            self.assertEqual(tabla.tiempo_fin.tolist(), [8, SIN_TIEMPO])
+            self.assertEqual(tabla.tiempo_restante.tolist(), [0, 2])
+            self.assertEqual(tabla.a_repositorio().obtener("A").tiempo_inicio, 3)
+            repositorio.cargar_csv(archivo)
+            self.assertEqual(repositorio.obtener("A").tiempo_fin, 8)
+
+            for contenido in ["pid;duracion\nP1;5\n",  # Encabezado incompleto
+                              "pid;duracion;prioridad;tiempo_restante;tiempo_llegada;tiempo_inicio;tiempo_fin\n"
+                              "P1;5;1;5;0;;\nP2;x;1;5;0;;\n",  # Duración no entera
+                              "pid;duracion;prioridad;tiempo_restante;tiempo_llegada;tiempo_inicio;tiempo_fin\n"
+                              "P1;5;1;5;0;;\nP1;5;1;5;0;;\n",  # PID duplicado
+                              "pid;duracion;prioridad;tiempo_restante;tiempo_llegada;tiempo_inicio;tiempo_fin\n"
+                              "P1;5;1;5;0;\n"]:  # Falta una columna
+                with open(archivo, "w", encoding="utf-8") as f:
+                    f.write(contenido)
+                with self.assertRaises(ValueError):
+                    TablaProcesos.cargar_csv(archivo)
+
+    def test_csv_por_bloques(self):
+        encabezado = "pid;duracion;prioridad;tiempo_restante;tiempo_llegada;tiempo_inicio;tiempo_fin\r\n"
+        filas = [f"P{i};{i + 1};{i % 10};{i + 1};{i * 1000};;\r\n" for i in range(300)]
+        filas[7] = "Ñ7;8;7;8;7000;;\n"  # Final de línea distinto y PID no ASCII
+        filas[250] = "P250;251;0;251;250000;1234567890123456789;\r\n"  # Más de 18 cifras
+        original = tabla_modulo._BYTES_BLOQUE_CSV
+        tabla_modulo._BYTES_BLOQUE_CSV = 500
+        try:
+            with tempfile.TemporaryDirectory() as directorio:
+                archivo = os.path.join(directorio, "procesos.csv")
+                with open(archivo, "w", encoding="utf-8", newline="") as f:
+                    f.write(encabezado + "".join(filas))
+                tabla = TablaProcesos.cargar_csv(archivo)
+                self.assertEqual(len(tabla), 300)
+                self.assertEqual(tabla.pids[6:9], ["P6", "Ñ7", "P8"])
+                self.assertEqual(tabla.tiempo_llegada[-1], 299000)
+                self.assertEqual(tabla.tiempo_inicio[250], 1234567890123456789)
+                repositorio = RepositorioProcesos()
+                repositorio.cargar_csv(archivo)
+                self.assertEqual(tabla.pids, [p.pid for p in repositorio.listar()])
+
+                for fila, contenido in [(290, "P3;4;3;4;3000;;\r\n"),  # PID duplicado en otro bloque
+                                        (100, " \t;4;3;4;3000;;\r\n"),  # PID en blanco
+                                        (100, "P100;-4;3;4;3000;;\r\n"),  # Duración negativa
+                                        (100, "P100;4;3;4;3000;-;\r\n"),  # Signo sin cifras
+                                        (100, "P100;4;3\r;4;3000;;\r\n"),  # Retorno de carro suelto
+                                        (100, "P100;4;3;4;3000;\r\n")]:  # Falta una columna
+                    with open(archivo, "w", encoding="utf-8", newline="") as f:
+                        f.write(encabezado + "".join(filas[:fila] + [contenido] + filas[fila + 1:]))
+                    with self.assertRaises(ValueError):
+                        TablaProcesos.cargar_csv(archivo)
+
+                # Comillas a mitad del archivo: el resto se lee con el módulo csv
+                filas[200] = '"P;200";201;0;201;200000;;\r\n'
+                with open(archivo, "w", encoding="utf-8", newline="") as f:
+                    f.write(encabezado + "".join(filas[:250] + filas[251:] + ["P3;1;0;1;0;;\r\n"]))
+                with self.assertRaisesRegex(ValueError, "duplicados"):
+                    TablaProcesos.cargar_csv(archivo)
+                with open(archivo, "w", encoding="utf-8", newline="") as f:
+                    f.write(encabezado + "".join(filas[:250] + filas[251:]))
+                tabla = TablaProcesos.cargar_csv(archivo)
+                self.assertEqual(tabla.pids[199:202], ["P199", "P;200", "P201"])
+                self.assertEqual(tabla.duracion.sum(), sum(range(1, 301)) - 251)
+        finally:
+            tabla_modulo._BYTES_BLOQUE_CSV = original
+
+    def test_fcfs_con_tabla(self):
+        gantt = FCFSScheduler().planificar(self.tabla)
+        self.assertEqual(gantt, [("P1", 0, 5), ("P2", 5, 8), ("P3", 8, 10)])
+        self.assertEqual(self.tabla.tiempo_inicio.tolist(), [0, 5, 8])
+        self.assertEqual(self.tabla.tiempo_fin.tolist(), [5, 8, 10])
+        self.assertEqual(self.tabla.tiempo_restante.tolist(), [0, 0, 0])
+        with self.assertRaises(ValueError):
+            FCFSScheduler().planificar(self.tabla)  # Ya planificada
+
+    def test_round_robin_con_tabla(self):
+        gantt = RoundRobinScheduler(quantum=2).planificar(self.tabla)
+        self.assertEqual(gantt, [
+            ("P1", 0, 2), ("P2", 2, 4), ("P3", 4, 6),
+            ("P1", 6, 8), ("P2", 8, 9), ("P1", 9, 10)
+        ])
+        self.assertEqual(self.tabla.tiempo_inicio.tolist(), [0, 2, 4])
+        self.assertEqual(self.tabla.tiempo_fin.tolist(), [10, 9, 6])
+
+    def test_metrics_con_tabla(self):
+        gantt = RoundRobinScheduler(quantum=2).planificar(self.tabla)
+        metrics = Metrics(self.tabla, gantt)
+        metricas_por_proceso = metrics.obtener_metricas_por_proceso()
+        self.assertEqual(metricas_por_proceso["P2"], {"tiempo_respuesta": 2, "tiempo_retorno": 9, "tiempo_espera": 6})
+        metricas_promedio = metrics.obtener_metricas_promedio()
+        self.assertAlmostEqual(metricas_promedio["promedio_retorno"], 8.333, places=3)
+        with self.assertRaises(ValueError):
+            Metrics(TablaProcesos(["X"], [1], [0]), gantt)  # Sin planificar
+
+    def test_fcfs_y_metrics_vectorizados_coinciden(self):
+        generador = random.Random(7)
+        duraciones = [generador.randint(1, 1000) for _ in range(500)]
+        pids = [f"V{i}" for i in range(len(duraciones))]
+
+        procesos = [Proceso(pid, d, 0) for pid, d in zip(pids, duraciones)]
+        gantt_lista = FCFSScheduler().planificar(procesos)
+        esperado = Metrics(procesos, gantt_lista)
+
+        tabla = TablaProcesos(pids, duraciones, [0] * len(pids))
+        gantt_tabla = FCFSScheduler().planificar(tabla)
+        vectorizado = Metrics(tabla, gantt_tabla)
+
+        self.assertEqual(gantt_tabla, gantt_lista)
+        self.assertEqual(vectorizado.obtener_metricas_promedio(), esperado.obtener_metricas_promedio())
+        self.assertEqual(vectorizado.obtener_metricas_por_proceso(), esperado.obtener_metricas_por_proceso())
+        self.assertEqual(str(vectorizado), str(esperado))
+
+if __name__ == "__main__":
+    unittest.main()